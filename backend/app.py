@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, make_response
+from flask import Flask, request, jsonify, make_response, Response, stream_with_context
 from flask_cors import CORS
 from datetime import datetime
 import logging
@@ -6,10 +6,15 @@ import traceback
 import os
 import sys
 import json
+import hmac
+import threading
+import time
 from google.auth.transport import requests
 from google.oauth2 import id_token
 from auth_service_mongodb import AuthServiceMongoDB
-from services.translation_service import TranslationService
+from services.translation_service import SUGGEST_TOP_K, get_translation_service, get_translation_status
+from services.batch_pool import BulkJobsBusy, get_batch_pool
+from services.translation_sessions import TranslationSessionStore
 # Import route blueprints
 from routes import auth_bp, user_bp
 
@@ -26,6 +31,12 @@ logger = logging.getLogger(__name__)
 # Store broadcasts by join code
 broadcasts_store = {}
 
+# Incremental live-caption translation state, keyed by class join code
+translation_sessions = TranslationSessionStore(get_translation_service)
+
+# Held while a reload requested over HTTP runs, so concurrent requests can't stack rebuilds
+translation_reload_lock = threading.Lock()
+
 # =============================
 # CORS CONFIG - DYNAMIC ORIGIN HANDLING
 # =============================
@@ -90,6 +101,18 @@ logger.info("[OK] Blueprints registered:")
 logger.info("   - /api/auth/* (Authentication routes)")
 logger.info("   - /api/user/* (User profile routes)")
 
+# =============================
+# TRANSLATION SERVICE WARM-UP
+# =============================
+# Load the dataset once per process so requests only pay for lookups.
+# Set TRANSLATION_PRELOAD=0 to defer loading until the first translation.
+if os.getenv('TRANSLATION_PRELOAD', '1') != '0':
+    try:
+        get_translation_service()
+        logger.info("[OK] TranslationService preloaded")
+    except Exception as e:
+        logger.warning(f"[WARNING] TranslationService preload failed: {e}")
+
 # =============================
 # ROUTES
 # =============================
@@ -112,7 +135,7 @@ def health():
 def debug_translation_db():
     """Debug endpoint - show translation database status"""
     try:
-        translation_service = TranslationService()
+        translation_service = get_translation_service()
         
         return jsonify({
             "success": True,
@@ -131,6 +154,83 @@ def debug_translation_db():
             "error": str(e)
         }), 500
 
+@app.route("/api/translate/ready", methods=["GET"])
+def translation_ready():
+    """Readiness probe - reports whether the translation index is loaded"""
+    status = get_translation_status()
+    return jsonify({
+        "success": status.get("ready", False),
+        "translation": status
+    }), 200 if status.get("ready") else 503
+
+@app.route("/api/translate/reload", methods=["POST", "OPTIONS"])
+def translation_reload():
+    """
+    Rebuild the translation indexes from the current dataset CSV without downtime.
+    
+    Requires TRANSLATION_ADMIN_TOKEN to be set and sent as the X-Admin-Token header;
+    without it the endpoint is disabled. The rebuild runs in the background and is
+    swapped in atomically; requests keep using the previous indexes until it is ready.
+    ?wait=1 waits for it and returns the reload stats. Only one reload runs at a time:
+    a request made while one is running gets 409.
+    """
+    if request.method == "OPTIONS":
+        return "", 204
+    
+    admin_token = os.getenv('TRANSLATION_ADMIN_TOKEN', '')
+    if not admin_token:
+        return jsonify({
+            "success": False,
+            "message": "Dataset reload is disabled; set TRANSLATION_ADMIN_TOKEN to enable it"
+        }), 403
+    if not hmac.compare_digest(request.headers.get("X-Admin-Token", ""), admin_token):
+        return jsonify({
+            "success": False,
+            "message": "Invalid admin token"
+        }), 403
+    
+    if not translation_reload_lock.acquire(blocking=False):
+        return jsonify({
+            "success": False,
+            "message": "A reload is already running"
+        }), 409
+    
+    translation_service = get_translation_service()
+    force = request.args.get("force") == "1"
+    
+    if request.args.get("wait") == "1":
+        try:
+            stats = translation_service.reload_dataset(force=force)
+            return jsonify({
+                "success": True,
+                "reload": stats,
+                "dataset_version": translation_service.dataset_version
+            }), 200
+        except Exception as e:
+            logger.error(f"❌ Dataset reload error: {traceback.format_exc()}")
+            return jsonify({
+                "success": False,
+                "message": "Reload failed",
+                "error": str(e)
+            }), 500
+        finally:
+            translation_reload_lock.release()
+    
+    def reload():
+        try:
+            translation_service.reload_dataset(force=force)
+        except Exception:
+            logger.error(f"❌ Dataset reload error: {traceback.format_exc()}")
+        finally:
+            translation_reload_lock.release()
+    
+    threading.Thread(target=reload, name="translation-reload", daemon=True).start()
+    return jsonify({
+        "success": True,
+        "message": "Reload started",
+        "dataset_version": translation_service.dataset_version
+    }), 202
+
 # =============================
 # STUDENT LOGIN
 # =============================
@@ -443,19 +543,27 @@ def translate():
                 "message": "No text provided"
             }), 400
         
-        # Initialize translation service
-        translation_service = TranslationService()
+        translation_service = get_translation_service()
         
-        # Translate the text
-        translation = translation_service.translate(
-            text,
+        # "auto" runs script/token-vote detection instead of assuming a source
+        detection = None
+        if source_lang == "auto":
+            detection = translation_service.detect_language(text)
+            source_lang = detection["language"] or "english"
+        
+        # Translate the text (translate_batch() also says how much of it the dataset covered)
+        result = translation_service.translate_batch(
+            [text],
             source_lang=source_lang,
-            target_lang=target_lang
-        )
+            target_langs=[target_lang]
+        )[0]
+        translation = result["translations"][target_lang]
         
         # Log result
         if translation:
             logger.info(f"[OK] Translated: '{text}' ({source_lang}->{target_lang}) = '{translation}'")
+            # Phrases teachers actually use are suggested first while typing
+            translation_service.record_phrase_use(text, source_lang)
         else:
             logger.warning(f"[WARNING] Translation not found: '{text}' ({source_lang}->{target_lang})")
         
@@ -465,7 +573,14 @@ def translate():
             "text": text,
             "source_lang": source_lang,
             "target_lang": target_lang,
-            "found": bool(translation)  # Add flag to indicate if translation was found
+            "found": result["found"][target_lang],  # The dataset covered the whole text
+            # True when a similar dataset phrase (matched_phrase) was translated instead of the text itself
+            "approximate": result["approximate"][target_lang],
+            "matched_phrase": result["matched_phrase"][target_lang],
+            "detection": detection,
+            "dataset_version": translation_service.dataset_version,
+            # Misspelled words that were matched to a close dataset word instead
+            "corrections": result["corrections"]
         }), 200
     
     except Exception as e:
@@ -476,14 +591,61 @@ def translate():
             "error": str(e)
         }), 500
 
+@app.route("/api/translate/suggest", methods=["GET", "OPTIONS"])
+def translate_suggest():
+    """
+    Autocomplete dataset phrases while a teacher types.
+    
+    Query: ?q=<text typed so far>&source_lang=english&target_langs=bodo,mizo&k=8
+    Returns the k best phrases starting with q - most used in this server first, then
+    most frequent in the dataset - each with its translations.
+    """
+    if request.method == "OPTIONS":
+        return "", 204
+    try:
+        prefix = request.args.get("q", "")
+        source_lang = request.args.get("source_lang", "english").lower()
+        target_langs = [lang for lang in request.args.get("target_langs", "bodo,mizo").split(",") if lang]
+        k = min(max(request.args.get("k", SUGGEST_TOP_K, type=int), 0), 50)
+        
+        translation_service = get_translation_service()
+        started = time.perf_counter()
+        suggestions = translation_service.suggest(prefix, source_lang=source_lang, target_langs=target_langs, k=k)
+        
+        return jsonify({
+            "success": True,
+            "prefix": prefix,
+            "source_lang": source_lang,
+            "suggestions": suggestions,
+            "dataset_version": translation_service.dataset_version,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"❌ Suggestion error: {traceback.format_exc()}")
+        return jsonify({
+            "success": False,
+            "message": "Suggestions failed",
+            "error": str(e)
+        }), 500
+
 @app.route("/api/translate/batch", methods=["POST", "OPTIONS"])
 def translate_batch():
-    """Translate text to Bodo and Mizo"""
+    """
+    Translate many texts into one or more target languages.
+    
+    Body: {"texts": [...], "source_lang": "english" | "auto", "target_langs": ["bodo", "mizo"]}
+    Duplicate texts are translated once and every target shares the same tokenization.
+    Very large batches are split across worker processes (see services.batch_pool);
+    a 429 means the bulk job limit is reached and the batch should be retried later.
+    """
     if request.method == "OPTIONS":
         return "", 204
     try:
         data = request.json or {}
         texts = data.get("texts", [])
+        source_lang = (data.get("source_lang") or "english").lower()
+        target_langs = data.get("target_langs") or ["bodo", "mizo"]
         
         if not texts:
             return jsonify({
@@ -491,27 +653,60 @@ def translate_batch():
                 "message": "No text provided"
             }), 400
         
-        # Initialize translation service
-        translation_service = TranslationService()
+        if not isinstance(texts, list) or not isinstance(target_langs, list):
+            return jsonify({
+                "success": False,
+                "message": "texts and target_langs must be lists"
+            }), 400
+        
+        if not all(isinstance(item, str) for item in texts + target_langs):
+            return jsonify({
+                "success": False,
+                "message": "texts and target_langs must only hold strings"
+            }), 400
+        
+        translation_service = get_translation_service()
+        
+        batch = get_batch_pool().translate_batch(
+            texts,
+            source_lang=None if source_lang == "auto" else source_lang,
+            target_langs=target_langs
+        )
         
         results = []
-        for text in texts:
-            bodo_translation = translation_service.translate(text, source_lang="english", target_lang="bodo")
-            mizo_translation = translation_service.translate(text, source_lang="english", target_lang="mizo")
-            
+        for item in batch:
+            translations = item["translations"]
             results.append({
-                "englishText": text,
-                "bodoTranslation": bodo_translation,
-                "mizoTranslation": mizo_translation
+                "text": item["text"],
+                "sourceLang": item["source_lang"],
+                "translations": translations,
+                "found": item["found"],
+                "approximate": item["approximate"],
+                "matchedPhrase": item["matched_phrase"],
+                "corrections": item["corrections"],
+                # Flat fields kept for existing clients (TeacherDashboard)
+                "englishText": item["text"],
+                "bodoTranslation": translations.get("bodo", ""),
+                "mizoTranslation": translations.get("mizo", "")
             })
         
-        logger.info(f"[OK] Translated {len(texts)} texts")
+        logger.info(f"[OK] Translated {len(texts)} texts into {', '.join(target_langs)}")
         
         return jsonify({
             "success": True,
-            "translations": results
+            "translations": results,
+            "dataset_version": translation_service.dataset_version
         }), 200
     
+    except BulkJobsBusy as e:
+        logger.warning(f"[WARNING] Batch of {len(texts)} texts refused: {e}")
+        response = jsonify({
+            "success": False,
+            "message": "Too many bulk translation jobs running, retry shortly",
+            "error": str(e)
+        })
+        response.headers["Retry-After"] = "5"
+        return response, 429
     except Exception as e:
         logger.error(f"❌ Translation error: {traceback.format_exc()}")
         return jsonify({
@@ -520,6 +715,92 @@ def translate_batch():
             "error": str(e)
         }), 500
 
+@app.route("/api/translate/stream", methods=["POST", "OPTIONS"])
+def translate_stream():
+    """
+    Stream translations of a line-delimited transcript as NDJSON.
+    
+    Body: plain text, one utterance per line.
+    Query: ?source_lang=english|auto&target_langs=bodo,mizo
+    Each input line produces one JSON line as soon as it is translated.
+    """
+    if request.method == "OPTIONS":
+        return "", 204
+    
+    source_lang = request.args.get("source_lang", "english").lower()
+    target_langs = [lang for lang in request.args.get("target_langs", "bodo,mizo").split(",") if lang]
+    translation_service = get_translation_service()
+    
+    def generate():
+        # request.stream is read line by line, so neither input nor output is buffered whole
+        results = translation_service.translate_stream(
+            request.stream,
+            source_lang=None if source_lang == "auto" else source_lang,
+            target_langs=target_langs
+        )
+        count = 0
+        try:
+            for result in results:
+                count += 1
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logger.error(f"❌ Streaming translation error: {traceback.format_exc()}")
+            yield json.dumps({"success": False, "error": str(e)}) + "\n"
+        logger.info(f"[OK] Streamed {count} translated lines")
+    
+    response = Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+    response.headers["X-Accel-Buffering"] = "no"  # Don't let proxies hold back early lines
+    response.headers["X-Dataset-Version"] = translation_service.dataset_version
+    return response
+
+@app.route("/api/translate/session/<join_code>", methods=["POST", "DELETE", "OPTIONS"])
+def translate_session(join_code):
+    """
+    Incrementally translate a class's growing live transcript.
+    
+    POST body: {"text": full transcript so far, "source_lang": "english" | "auto", "target_langs": [...]}
+    Only words after the last stable phrase boundary are re-translated; each target returns
+    {"replace_from": segment index, "segments": new segment texts, "translation": full text}.
+    DELETE discards the session.
+    """
+    if request.method == "OPTIONS":
+        return "", 204
+    
+    join_code = join_code.upper()
+    if request.method == "DELETE":
+        return jsonify({
+            "success": True,
+            "ended": translation_sessions.end(join_code)
+        }), 200
+    
+    try:
+        data = request.json or {}
+        text = data.get("text", "")
+        source_lang = (data.get("source_lang") or "english").lower()
+        target_langs = data.get("target_langs") or ["bodo", "mizo"]
+        
+        delta = translation_sessions.update(
+            join_code,
+            text,
+            source_lang=None if source_lang == "auto" else source_lang,
+            target_langs=target_langs
+        )
+        
+        return jsonify({
+            "success": True,
+            "joinCode": join_code,
+            "dataset_version": get_translation_service().dataset_version,
+            **delta
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"❌ Session translation error: {traceback.format_exc()}")
+        return jsonify({
+            "success": False,
+            "message": "Translation failed",
+            "error": str(e)
+        }), 500
+
 # =============================
 # TEACHER ENDPOINTS
 # =============================
@@ -606,6 +887,7 @@ def stop_class():
         if join_code in broadcasts_store:
             del broadcasts_store[join_code]
             logger.info(f"🛑 Class stopped, broadcasts cleared for {join_code}")
+        translation_sessions.end(join_code.upper())
         
         return jsonify({
             "success": True,
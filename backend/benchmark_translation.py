@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the translation service.
+
+Usage:
+    python benchmark_translation.py sentences [--repeat N] [--baseline]
+    python benchmark_translation.py startup [--repeat N]
+    python benchmark_translation.py memory [--sizes 4000,100000,1000000]
+    python benchmark_translation.py fuzzy [--words N]
+    python benchmark_translation.py reload [--sizes 4000,100000]
+    python benchmark_translation.py lazy [--sizes 4000,100000]
+    python benchmark_translation.py batch [--texts 12000] [--workers N]
+    python benchmark_translation.py similar [--texts 2000]
+    python benchmark_translation.py mixed [--texts 2000]
+    python benchmark_translation.py suggest [--sizes 2500,100000] [--keystrokes 5000]
+    python benchmark_translation.py engines [--sizes 4000,100000] [--texts 3000]
+"""
+
+import argparse
+import contextlib
+import csv
+import gc
+import io
+import json
+import os
+import random
+import shutil
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.batch_pool import BatchPool
+from services.fuzzy_index import _edit_distance
+from services.phrase_similarity import PhraseSimilarityIndex, np
+from services.phrase_suggest import PrefixIndex
+from services.row_store import RowStore
+from services.translation_cache import TranslationCache
+from services.translation_service import DATASET_COLUMNS, DATASET_PATH, DIRECTIONS, LANGUAGE_COLUMNS, TranslationService
+from services.translation_snapshot import compile_snapshot
+from services.transliteration import romanize
+
+
+def _quiet():
+    """Silence the per-call [CSV MATCH]/[WORD-BY-WORD] logging while timing"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _load_service():
+    with _quiet():
+        return TranslationService()
+
+
+def _scan_word(ts):
+    """_translate_word() as it was before the word index: scan every row, then the database"""
+    def translate_word(word, source_lang, target_lang, indexes=None):
+        clean_word = word.strip().lower().strip(string.punctuation)
+        if not clean_word:
+            return ''
+        indexes = indexes or ts.indexes
+        for row in indexes.csv_rows:
+            source_value = row.get(LANGUAGE_COLUMNS[source_lang])
+            if source_value and ts._normalize_text(source_value) == clean_word:
+                word_translation = row.get(LANGUAGE_COLUMNS[target_lang])
+                if word_translation and word_translation != '?':
+                    return word_translation
+        word_translation = indexes.translation_db.get(source_lang, {}).get(clean_word, {}).get(target_lang)
+        return word_translation if word_translation and word_translation.strip() else ''
+    return translate_word
+
+
+def bench_sentences(args):
+    """Word-by-word translation cost as sentences get longer (--baseline: also with the row scan)"""
+    ts = _load_service()
+    ts.cache = TranslationCache(0)  # Every repeat does the lookups again
+    with _quiet():
+        ts.warm_indexes([('english', 'bodo')])  # First-use index builds are not part of a lookup
+        ts._fuzzy_index('english')
+    vocabulary = sorted(ts.word_index[('english', 'bodo')])
+    random.seed(7)
+
+    def timed(sentences):
+        with _quiet():
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                for sentence in sentences:
+                    ts.translate(sentence, source_lang='english', target_lang='bodo')
+            elapsed = time.perf_counter() - started
+        return elapsed / (args.repeat * len(sentences))
+
+    header = f"{'words':>6} | {'ms/sentence':>12} | {'us/word':>8}"
+    print(header + (f" | {'scan ms':>9} | {'speedup':>8}" if args.baseline else ''))
+    print("-" * (len(header) + (23 if args.baseline else 0)))
+    for length in (1, 3, 6, 12, 24, 48):
+        # Unknown trailing token forces a miss on the exact-match step
+        sentences = [' '.join(random.sample(vocabulary, length - 1) + ['zzqx'])
+                     for _ in range(20)]
+        per_sentence = timed(sentences)
+        line = f"{length:>6} | {per_sentence * 1000:>12.3f} | {per_sentence / length * 1e6:>8.1f}"
+        if args.baseline:
+            ts._translate_word = _scan_word(ts)
+            try:
+                scanned = timed(sentences)
+            finally:
+                del ts._translate_word
+            line += f" | {scanned * 1000:>9.3f} | {scanned / per_sentence:>7.0f}x"
+        print(line)
+
+
+def bench_startup(args):
+    """Cold-start cost: parsing the CSV vs loading a compiled snapshot"""
+    workdir = tempfile.mkdtemp()
+    try:
+        # Work on a copy so the benchmark never writes next to the real dataset
+        csv_path = os.path.join(workdir, os.path.basename(DATASET_PATH))
+        shutil.copyfile(DATASET_PATH, csv_path)
+        with _quiet():
+            compile_snapshot(csv_path)
+
+        print(f"{'source':>9} | {'ms/load':>9}")
+        print("-" * 22)
+        for label, use_snapshot in (('csv', False), ('snapshot', True)):
+            with _quiet():
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    ts = TranslationService(csv_path=csv_path, use_snapshot=use_snapshot)
+                elapsed = time.perf_counter() - started
+            assert ts.loaded_from == label
+            print(f"{label:>9} | {elapsed / args.repeat * 1000:>9.1f}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+def _write_synthetic_dataset(path, size):
+    """Repeat the real dataset, suffixing cells so every row stays a distinct entry"""
+    with open(DATASET_PATH, 'r', encoding='utf-8') as f:
+        base_rows = list(csv.DictReader(f))
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=DATASET_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        for row_id in range(size):
+            row = dict(base_rows[row_id % len(base_rows)])
+            copy = row_id // len(base_rows)
+            if copy:
+                for column in ('English', 'Bodo', 'Mizo'):
+                    if row[column] and row[column] != '?':
+                        row[column] = f"{row[column]} {copy}"
+            row['ID'] = f"{row_id + 1:07d}"
+            writer.writerow(row)
+
+
+def _traced(build):
+    """Bytes still allocated by build() once it returns, measured with tracemalloc"""
+    gc.collect()
+    tracemalloc.start()
+    with _quiet():
+        result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return current
+
+
+def _load_dict_rows(csv_path):
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _load_row_store(csv_path):
+    store = RowStore(DATASET_COLUMNS)
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            store.append(row)
+    store.freeze()
+    return store
+
+
+def bench_memory(args):
+    """Resident footprint of list-of-dicts rows vs RowStore (and the whole service)"""
+    workdir = tempfile.mkdtemp()
+    try:
+        print(f"{'rows':>9} | {'dict rows MB':>12} | {'RowStore MB':>11} | {'ratio':>5} | {'service MB':>10}")
+        print("-" * 62)
+        for size in [int(size) for size in args.sizes.split(',')]:
+            csv_path = os.path.join(workdir, f"dataset_{size}.csv")
+            _write_synthetic_dataset(csv_path, size)
+            dict_rows = _traced(lambda: _load_dict_rows(csv_path))
+            row_store = _traced(lambda: _load_row_store(csv_path))
+            service = '-'
+            if size <= args.service_max:
+                service = f"{_traced(lambda: TranslationService(csv_path=csv_path, use_snapshot=False)) / 1e6:.1f}"
+            print(f"{size:>9} | {dict_rows / 1e6:>12.1f} | {row_store / 1e6:>11.1f} | "
+                  f"{dict_rows / row_store:>5.1f} | {service:>10}")
+            os.remove(csv_path)
+    finally:
+        shutil.rmtree(workdir)
+
+
+def _misspell(word, rng):
+    """One random edit: delete, insert, substitute or swap adjacent characters"""
+    position = rng.randrange(len(word))
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    edit = rng.choice(('delete', 'insert', 'substitute', 'swap'))
+    if edit == 'delete':
+        return word[:position] + word[position + 1:]
+    if edit == 'insert':
+        return word[:position] + letter + word[position:]
+    if edit == 'swap' and position < len(word) - 1:
+        return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+    return word[:position] + letter + word[position + 1:]
+
+
+def bench_fuzzy(args):
+    """Typo correction latency and accuracy: deletion index vs scanning the vocabulary"""
+    ts = _load_service()
+    rng = random.Random(7)
+    with _quiet():
+        index = ts._fuzzy_index('english')
+    vocabulary = sorted(word for word in index.frequencies if len(word) >= 4 and word.isalpha())
+    originals = rng.sample(vocabulary, min(args.words, len(vocabulary)))
+    typos = [_misspell(word, rng) for word in originals]
+
+    started = time.perf_counter()
+    results = [index.lookup(typo) for typo in typos]
+    indexed = (time.perf_counter() - started) / len(typos)
+
+    scan_sample = typos[:50]
+    started = time.perf_counter()
+    for typo in scan_sample:
+        limit = index.allowed_distance(typo)
+        min(vocabulary, key=lambda word: _edit_distance(typo, word, limit))
+    scanned = (time.perf_counter() - started) / len(scan_sample)
+
+    restored = sum(1 for original, result in zip(originals, results) if result and result[0] == original)
+    corrected = sum(1 for result in results if result)
+    print(f"Vocabulary: {len(index)} words, {len(typos)} single-edit typos")
+    print(f"Deletion index: {indexed * 1000:.3f} ms/lookup")
+    print(f"Linear scan:    {scanned * 1000:.3f} ms/lookup")
+    print(f"Corrected: {corrected / len(typos):.1%}, back to the intended word: {restored / len(typos):.1%}")
+
+
+def bench_reload(args):
+    """Hot reload after editing one row: incremental patch vs building every index again"""
+    workdir = tempfile.mkdtemp()
+    try:
+        print(f"{'rows':>8} | {'incremental ms':>14} | {'full ms':>8}")
+        print("-" * 38)
+        for size in [int(size) for size in args.sizes.split(',')]:
+            csv_path = os.path.join(workdir, f"dataset_{size}.csv")
+            _write_synthetic_dataset(csv_path, size)
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            with _quiet():
+                ts = TranslationService(csv_path=csv_path, use_snapshot=False)
+                ts.warm_indexes()  # Patch every direction, as a long-running server would have built them
+            timings = {}
+            for mode in ('incremental', 'full'):
+                rows[size // 2]['Mizo'] = f"edited {mode}"
+                with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=DATASET_COLUMNS, extrasaction='ignore')
+                    writer.writeheader()
+                    writer.writerows(rows)
+                with _quiet():
+                    if mode == 'full':
+                        started = time.perf_counter()
+                        TranslationService(csv_path=csv_path, use_snapshot=False).warm_indexes()
+                    else:
+                        started = time.perf_counter()
+                        ts.reload_dataset()
+                timings[mode] = time.perf_counter() - started
+            print(f"{size:>8} | {timings['incremental'] * 1000:>14.1f} | {timings['full'] * 1000:>8.1f}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+def bench_lazy(args):
+    """Cold start with lazy per-direction indexes, what each direction's first request adds, and eager loading"""
+    workdir = tempfile.mkdtemp()
+    try:
+        for size in [int(size) for size in args.sizes.split(',')]:
+            csv_path = os.path.join(workdir, f"dataset_{size}.csv")
+            _write_synthetic_dataset(csv_path, size)
+            with _quiet():
+                started = time.perf_counter()
+                ts = TranslationService(csv_path=csv_path, use_snapshot=False)
+                startup = time.perf_counter() - started
+                first_requests = {}
+                for source_lang, target_lang in DIRECTIONS:
+                    # Two dataset phrases run together miss the exact index, so segmentation
+                    # needs the source's phrase trie and the direction's word index too
+                    text = ' '.join(list(ts.translation_db[source_lang])[:2])
+                    started = time.perf_counter()
+                    ts.translate(text, source_lang, target_lang)
+                    first_requests[(source_lang, target_lang)] = time.perf_counter() - started
+                started = time.perf_counter()
+                TranslationService(csv_path=csv_path, use_snapshot=False).warm_indexes()
+                eager = time.perf_counter() - started
+            print(f"{size} rows: lazy startup {startup * 1000:.1f} ms, eager startup {eager * 1000:.1f} ms")
+            for (source_lang, target_lang), elapsed in first_requests.items():
+                print(f"  first {source_lang}->{target_lang} request: {elapsed * 1000:>8.1f} ms")
+            os.remove(csv_path)
+    finally:
+        shutil.rmtree(workdir)
+
+
+def bench_batch(args):
+    """A bulk job of distinct texts: one process vs split across a worker pool"""
+    ts = _load_service()
+    english = [text for text in ts.translation_db['english'] if text]
+    rng = random.Random(7)
+    texts = [' '.join(rng.sample(english, rng.randint(1, 3))) for _ in range(args.texts)]
+    target_langs = ['bodo', 'mizo']
+
+    with _quiet():
+        started = time.perf_counter()
+        sequential = ts.translate_batch(texts, 'english', target_langs)
+        single = time.perf_counter() - started
+        ts.cache.clear()
+        pool = BatchPool(ts, workers=args.workers, threshold=1)
+        pool.start()  # Fork the workers outside the timing
+        started = time.perf_counter()
+        parallel = pool.translate_batch(texts, 'english', target_langs)
+        pooled = time.perf_counter() - started
+        pool.close()
+    assert parallel == sequential
+    print(f"{len(texts)} texts, {os.cpu_count()} CPUs")
+    print(f"one process:      {single:.2f} s")
+    print(f"{args.workers} worker processes: {pooled:.2f} s ({single / pooled:.1f}x)")
+
+
+def bench_similar(args):
+    """Nearest-phrase scoring: one text at a time vs a whole batch in one matrix operation"""
+    ts = _load_service()
+    phrases = [key for key in ts.translation_db['english'] if len(key.split()) > 1]
+    rng = random.Random(7)
+    texts = []
+    for _ in range(args.texts):
+        words = rng.choice(phrases).split()
+        words.insert(rng.randint(0, len(words)), rng.choice(['please', 'now', 'everyone', 'quickly']))
+        texts.append(' '.join(words))
+
+    started = time.perf_counter()
+    index = PhraseSimilarityIndex(phrases)
+    built = time.perf_counter() - started
+    started = time.perf_counter()
+    looped = [index.top_k([text])[0] for text in texts]
+    single = time.perf_counter() - started
+    started = time.perf_counter()
+    batched = index.top_k(texts)
+    together = time.perf_counter() - started
+    assert [[key for key, _ in matches] for matches in looped] == [[key for key, _ in matches] for matches in batched]
+
+    print(f"{len(index)} English phrases, {len(texts)} paraphrases, scoring with {'NumPy' if np else 'pure Python'}")
+    print(f"Index build:    {built * 1000:.1f} ms")
+    print(f"One at a time:  {single / len(texts) * 1000:.3f} ms/text")
+    print(f"Batched:        {together / len(texts) * 1000:.3f} ms/text ({single / together:.1f}x)")
+
+
+def bench_mixed(args):
+    """Auto-detected translation throughput for Devanagari, romanized Bodo, English and mixed lines"""
+    ts = _load_service()
+    rng = random.Random(7)
+    bodo = [key for key in ts.translation_db['bodo'] if any('\u0900' <= char <= '\u097f' for char in key)]
+    english = [key for key in ts.translation_db['english'] if key.isascii()]
+    devanagari = rng.sample(bodo, min(args.texts, len(bodo)))
+    inputs = {
+        'devanagari bodo': devanagari,
+        'romanized bodo': [romanize(text) for text in devanagari],
+        'english': rng.sample(english, min(args.texts, len(english))),
+    }
+    inputs['mixed script'] = [f"{rng.choice(inputs['romanized bodo'])} {rng.choice(inputs['english'])} "
+                              f"{rng.choice(devanagari)}" for _ in range(len(devanagari))]
+
+    with _quiet():
+        ts.warm_indexes()
+    results = {}
+    print(f"{'input':16} {'lines':>6} {'lines/sec':>10}  detected as")
+    for kind, texts in inputs.items():
+        ts.cache.clear()
+        with _quiet():
+            started = time.perf_counter()
+            results[kind] = ts.translate_batch(texts, None, ['english'])
+            seconds = time.perf_counter() - started
+        detected = {}
+        for result in results[kind]:
+            detected[result['source_lang']] = detected.get(result['source_lang'], 0) + 1
+        shares = ', '.join(f"{lang} {count / len(texts):.0%}" for lang, count in sorted(detected.items(),
+                                                                                     key=lambda item: -item[1]))
+        print(f"{kind:16} {len(texts):6} {len(texts) / seconds:10.0f}  {shares}")
+    same = sum(1 for original, romanized in zip(results['devanagari bodo'], results['romanized bodo'])
+               if original['translations'] == romanized['translations'])
+    print(f"Romanized lines translated like their Devanagari original: {same / len(devanagari):.1%}")
+
+
+def bench_suggest(args):
+    """Autocomplete latency per keystroke: sorted prefix index vs scanning every phrase"""
+    ts = _load_service()
+    english = list(ts.translation_db['english'])
+    rng = random.Random(7)
+    print(f"{'phrases':>8} {'build ms':>9} {'scan p50':>9} {'index p50':>10} {'index p99':>10}  (ms per keystroke)")
+    for size in [int(size) for size in args.sizes.split(',')]:
+        # Past the real dataset's size, phrases are extended with extra words to stand in for a bigger one
+        phrases = set(english[:size])
+        while len(phrases) < size:
+            phrases.add(f"{rng.choice(english)} {rng.choice(english)}")
+        counts = {phrase: rng.randint(1, 5) for phrase in phrases}
+        started = time.perf_counter()
+        index = PrefixIndex(counts)
+        built = time.perf_counter() - started
+
+        # Every prefix of randomly chosen phrases, as typed one character at a time
+        keystrokes = []
+        while len(keystrokes) < args.keystrokes:
+            phrase = rng.choice(index.phrases)
+            keystrokes.extend(phrase[:end] for end in range(1, len(phrase) + 1))
+        keystrokes = keystrokes[:args.keystrokes]
+
+        def scan(prefix):
+            matches = [phrase for phrase in counts if phrase.startswith(prefix)]
+            return sorted(matches, key=lambda phrase: (-counts[phrase], len(phrase), phrase))[:8]
+
+        timings = {}
+        for name, complete in (('scan', scan), ('index', lambda prefix: index.top(prefix, 8))):
+            samples = []
+            # A full scan is slow enough that a few hundred keystrokes give a stable median
+            for prefix in keystrokes[:300] if name == 'scan' else keystrokes:
+                started = time.perf_counter()
+                complete(prefix)
+                samples.append(time.perf_counter() - started)
+            samples.sort()
+            timings[name] = samples
+        assert all(scan(prefix) == index.top(prefix, 8) for prefix in keystrokes[:200])
+        print(f"{len(index):8} {built * 1000:9.1f} {timings['scan'][len(timings['scan']) // 2] * 1000:9.3f} "
+              f"{timings['index'][len(keystrokes) // 2] * 1000:10.4f} "
+              f"{timings['index'][len(keystrokes) * 99 // 100] * 1000:10.4f}")
+
+    # End to end through the service, translations included
+    prefixes = [phrase[:rng.randint(1, len(phrase))] for phrase in rng.choices(english, k=args.keystrokes)]
+    with _quiet():
+        ts.suggest('a')
+        started = time.perf_counter()
+        for prefix in prefixes:
+            ts.suggest(prefix)
+        seconds = time.perf_counter() - started
+    print(f"TranslationService.suggest() with bodo+mizo translations: {seconds / len(prefixes) * 1000:.4f} ms/keystroke")
+
+
+def _rss_bytes():
+    """Current resident set size of this process"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def bench_engine_probe(args):
+    """One engine in a fresh process: load time, RSS and per-translation latency (run by bench_engines)"""
+    rss_before = _rss_bytes()
+    with _quiet():
+        started = time.perf_counter()
+        ts = TranslationService(csv_path=args.csv, engine=args.engine)
+        loaded = time.perf_counter() - started
+    rss_loaded = _rss_bytes()
+
+    # Exact phrases, word-by-word sentences and paraphrases, in every direction from English
+    english = [value for value in ts.csv_rows.column('English') if value]
+    rng = random.Random(7)
+    texts = []
+    for _ in range(args.texts):
+        kind = rng.random()
+        if kind < 0.6:
+            texts.append(rng.choice(english))
+        elif kind < 0.9:
+            texts.append(' '.join(rng.choice(english).split()[0] for _ in range(rng.randint(3, 8))))
+        else:
+            texts.append(f"{rng.choice(english)} please")
+    samples = []
+    with _quiet():
+        for text in texts:
+            started = time.perf_counter()
+            ts.translate(text, source_lang='english', target_lang='bodo')
+            ts.translate(text, source_lang='english', target_lang='mizo')
+            samples.append(time.perf_counter() - started)
+    samples.sort()
+    print(json.dumps({
+        'load_seconds': loaded,
+        'rss_loaded': rss_loaded - rss_before,
+        'rss_after': _rss_bytes() - rss_before,
+        'p50': samples[len(samples) // 2],
+        'p99': samples[len(samples) * 99 // 100],
+        'mean': sum(samples) / len(samples)
+    }))
+
+
+def bench_engines(args):
+    """In-memory dicts vs the SQLite store: cold start, resident memory and translation latency"""
+    workdir = tempfile.mkdtemp()
+    try:
+        print(f"{'rows':>8} {'engine':>7} {'load s':>7} {'RSS MB':>7} {'RSS after MB':>13} "
+              f"{'p50 ms':>7} {'p99 ms':>7} {'mean ms':>8}")
+        for size in [int(size) for size in args.sizes.split(',')]:
+            csv_path = os.path.join(workdir, f"dataset_{size}.csv")
+            _write_synthetic_dataset(csv_path, size)
+            # Compile the store first, so its load time is that of a worker opening an existing file
+            subprocess.run([sys.executable, '-m', 'services.sqlite_store', 'build', '--csv', csv_path],
+                           cwd=os.path.dirname(os.path.abspath(__file__)), check=True, stdout=subprocess.DEVNULL)
+            for engine in ('memory', 'sqlite'):
+                # A fresh interpreter per engine, so neither inherits the other's memory;
+                # the result cache is off so every call reaches the engine
+                probe = subprocess.run([sys.executable, os.path.abspath(__file__), '_engine_probe', '--engine', engine,
+                                        '--csv', csv_path, '--texts', str(args.texts)],
+                                       env=dict(os.environ, TRANSLATION_CACHE_SIZE='0'), check=True,
+                                       capture_output=True, text=True)
+                result = json.loads(probe.stdout.strip().splitlines()[-1])
+                print(f"{size:8} {engine:>7} {result['load_seconds']:7.2f} {result['rss_loaded'] / 1e6:7.1f} "
+                      f"{result['rss_after'] / 1e6:13.1f} {result['p50'] * 1000:7.3f} {result['p99'] * 1000:7.3f} "
+                      f"{result['mean'] * 1000:8.3f}")
+            os.remove(csv_path)
+    finally:
+        shutil.rmtree(workdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translation service benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sentences = subparsers.add_parser("sentences", help="word-by-word scaling with sentence length")
+    sentences.add_argument("--repeat", type=int, default=5)
+    sentences.add_argument("--baseline", action="store_true",
+                           help="also time word lookups with the row scan the word index replaced")
+    sentences.set_defaults(func=bench_sentences)
+
+    startup = subparsers.add_parser("startup", help="CSV parse vs compiled snapshot load time")
+    startup.add_argument("--repeat", type=int, default=10)
+    startup.set_defaults(func=bench_startup)
+
+    memory = subparsers.add_parser("memory", help="tracemalloc footprint of the row store")
+    memory.add_argument("--sizes", default="4000,100000,1000000")
+    memory.add_argument("--service-max", type=int, default=100000,
+                        help="largest size to also load the full TranslationService at")
+    memory.set_defaults(func=bench_memory)
+
+    fuzzy = subparsers.add_parser("fuzzy", help="typo correction latency and accuracy")
+    fuzzy.add_argument("--words", type=int, default=1000)
+    fuzzy.set_defaults(func=bench_fuzzy)
+
+    reload = subparsers.add_parser("reload", help="incremental hot reload vs full index build")
+    reload.add_argument("--sizes", default="4000,100000")
+    reload.set_defaults(func=bench_reload)
+
+    lazy = subparsers.add_parser("lazy", help="lazy per-direction index builds vs eager startup")
+    lazy.add_argument("--sizes", default="4000,100000")
+    lazy.set_defaults(func=bench_lazy)
+
+    batch = subparsers.add_parser("batch", help="bulk batch in one process vs a worker pool")
+    batch.add_argument("--texts", type=int, default=12000)
+    batch.add_argument("--workers", type=int, default=max((os.cpu_count() or 1) - 1, 2))
+    batch.set_defaults(func=bench_batch)
+
+    similar = subparsers.add_parser("similar", help="nearest-phrase scoring per text vs batched")
+    similar.add_argument("--texts", type=int, default=2000)
+    similar.set_defaults(func=bench_similar)
+
+    mixed = subparsers.add_parser("mixed", help="throughput for Devanagari, romanized Bodo and mixed-script input")
+    mixed.add_argument("--texts", type=int, default=2000)
+    mixed.set_defaults(func=bench_mixed)
+
+    suggest = subparsers.add_parser("suggest", help="autocomplete latency per keystroke")
+    suggest.add_argument("--sizes", default="2500,100000")
+    suggest.add_argument("--keystrokes", type=int, default=5000)
+    suggest.set_defaults(func=bench_suggest)
+
+    engines = subparsers.add_parser("engines", help="in-memory vs SQLite engine latency and RSS")
+    engines.add_argument("--sizes", default="4000,100000")
+    engines.add_argument("--texts", type=int, default=3000)
+    engines.set_defaults(func=bench_engines)
+
+    probe = subparsers.add_parser("_engine_probe")
+    probe.add_argument("--engine", required=True)
+    probe.add_argument("--csv", required=True)
+    probe.add_argument("--texts", type=int, default=3000)
+    probe.set_defaults(func=bench_engine_probe)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
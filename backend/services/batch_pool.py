@@ -0,0 +1,198 @@
+"""
+Process-pool translation for very large batches.
+
+translate_batch() runs on one core. Above PARALLEL_THRESHOLD distinct texts
+a bulk job (e.g. a semester's worksheet bank) is split into chunks that
+worker processes translate in parallel, and the results are merged back in
+input order. Workers are forked from the loaded service, so they share its
+dataset pages copy-on-write instead of each loading the CSV; every direction
+is built first, at startup rather than in a request.
+
+The pool is off unless TRANSLATION_BATCH_WORKERS is set, since forking and
+building every direction undo the lazy startup. When it is on, the pool is
+forked once, by get_translation_service() preloading on the main thread
+(see app.py) while the new service is still private to it and before its
+journal follower and dataset watcher start. A service first loaded inside a
+request thread (TRANSLATION_PRELOAD=0) forks no workers, as other threads
+may then hold the stdout or logging locks a worker needs. It is never
+re-forked: each job carries the service's data position (see
+TranslationService.data_position()) and a worker that is behind reloads the
+CSVs or replays the journal itself before translating, so workers never
+translate with stale data. A pool that breaks is not replaced; bulk jobs
+then run in-process.
+
+At most MAX_BULK_JOBS bulk jobs run at once, and TRANSLATION_BATCH_WORKERS
+should leave one core free so live-class requests keep a CPU; further bulk
+jobs are refused with BulkJobsBusy until one finishes. Without workers or
+fork() batches are translated in-process as before, as they are while the
+service holds additions that never reached the journal.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from services.translation_cache import TranslationCache
+
+# Distinct texts above which a batch is split across worker processes
+PARALLEL_THRESHOLD = int(os.getenv('TRANSLATION_BATCH_PARALLEL_THRESHOLD', '2000'))
+
+# Worker processes; 0 (the default) translates every batch in-process
+BATCH_WORKERS = int(os.getenv('TRANSLATION_BATCH_WORKERS', '0'))
+
+# Bulk jobs allowed to use the pool at the same time
+MAX_BULK_JOBS = int(os.getenv('TRANSLATION_BULK_JOBS', '1'))
+
+# Chunks per worker: enough to even out slow chunks without much per-chunk overhead
+_CHUNKS_PER_WORKER = 4
+
+# The service a forked worker inherits from its parent
+_worker_service = None
+
+
+class BulkJobsBusy(Exception):
+    """Raised when MAX_BULK_JOBS bulk jobs are already running"""
+
+
+def _init_worker(cache_size):
+    # The worker gets its own cache and locks rather than relying on their state at fork time;
+    # it only writes when catching up to the parent (see _translate_chunk)
+    _worker_service.cache = TranslationCache(cache_size)
+    _worker_service._lock = threading.Lock()
+    if _worker_service.journal is not None:
+        _worker_service.journal._lock = threading.Lock()
+    if _worker_service.store is not None:
+        _worker_service.store.reset_after_fork()
+
+
+def _ready():
+    return os.getpid()
+
+
+def _translate_chunk(task):
+    texts, source_lang, target_langs, position = task
+    _worker_service.catch_up(position)
+    return _worker_service.translate_batch(texts, source_lang, target_langs)
+
+
+class BatchPool:
+    """Runs translate_batch() for a service, in worker processes when the batch is large"""
+
+    def __init__(self, service, workers=BATCH_WORKERS, threshold=PARALLEL_THRESHOLD, max_jobs=MAX_BULK_JOBS):
+        self.service = service
+        self.workers = workers
+        self.threshold = threshold
+        self.max_jobs = max(max_jobs, 1)
+        self._jobs = threading.BoundedSemaphore(self.max_jobs)
+        self._pool = None
+
+    def start(self):
+        """
+        Build every index and fork the workers, waiting until they are up.
+
+        Only on the main thread, before the process starts threads that touch the
+        service (see the module docstring); elsewhere, without workers and if it
+        fails, nothing is built or forked and batches run in-process.
+        """
+        global _worker_service
+        if self._pool is not None or not self.available():
+            return
+        if threading.current_thread() is not threading.main_thread():
+            print(f"[BATCH] Not forking {self.workers} workers outside the main thread; bulk jobs run in this process")
+            return
+        started = time.perf_counter()
+        self.service.warm_indexes()  # Workers must never build indexes themselves
+        _worker_service = self.service
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(self.service.cache.capacity,)
+        )
+        try:
+            # With fork every worker starts on the first submit, before the pool's own thread
+            done, _ = wait([pool.submit(_ready) for _ in range(self.workers)])
+            for future in done:
+                future.result()
+        except Exception as e:
+            print(f"[BATCH] Could not start {self.workers} workers ({e}); bulk jobs run in this process")
+            pool.shutdown(wait=False)
+            return
+        self._pool = pool
+        print(f"[BATCH] {self.workers} workers ready in {time.perf_counter() - started:.2f}s")
+
+    def translate_batch(self, texts, source_lang=None, target_langs=('bodo', 'mizo')):
+        """
+        Same results as TranslationService.translate_batch(), in input order.
+
+        Raises: BulkJobsBusy when the batch needs the pool and the bulk job cap is reached
+        """
+        distinct = list(dict.fromkeys((text or '').strip() for text in texts))
+        position = self.service.data_position()
+        if len(distinct) < self.threshold or self._pool is None or position is None:
+            return self.service.translate_batch(texts, source_lang, target_langs)
+
+        if not self._jobs.acquire(blocking=False):
+            raise BulkJobsBusy(f"{self.max_jobs} bulk translation job(s) already running")
+        try:
+            by_text = self._translate_parallel(distinct, source_lang, list(target_langs), position)
+        finally:
+            self._jobs.release()
+        if by_text is None:
+            return self.service.translate_batch(texts, source_lang, target_langs)
+        return [dict(by_text[(text or '').strip()], text=text) for text in texts]
+
+    def available(self):
+        """
+        Bulk jobs need worker processes and fork().
+
+        Even one worker helps: the job runs outside this process and its GIL, so
+        request threads stay responsive.
+        """
+        return self.workers > 0 and 'fork' in multiprocessing.get_all_start_methods()
+
+    def _translate_parallel(self, distinct, source_lang, target_langs, position):
+        """{text: result} for every distinct text, or None if the pool could not be used"""
+        chunk_size = max(1, -(-len(distinct) // (self.workers * _CHUNKS_PER_WORKER)))
+        chunks = [distinct[start:start + chunk_size] for start in range(0, len(distinct), chunk_size)]
+        pool = self._pool
+        if pool is None:
+            return None
+        try:
+            by_text = {}
+            tasks = [(chunk, source_lang, target_langs, position) for chunk in chunks]
+            for chunk, results in zip(chunks, pool.map(_translate_chunk, tasks)):
+                by_text.update(zip(chunk, results))
+        except Exception as e:
+            # Re-forking now would copy whatever locks this process's threads hold
+            print(f"[BATCH] Worker pool failed ({e}); bulk jobs run in this process from now on")
+            self.close()
+            return None
+        print(f"[BATCH] Translated {len(distinct)} distinct texts in {len(chunks)} chunks on {self.workers} workers")
+        return by_text
+
+    def close(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)  # Running chunks finish first
+
+
+_shared_pool = None
+
+
+def start_batch_pool(service):
+    """Create the process-wide BatchPool and fork its workers; see get_translation_service()"""
+    global _shared_pool
+    _shared_pool = BatchPool(service)
+    _shared_pool.start()
+    return _shared_pool
+
+
+def get_batch_pool():
+    """Process-wide BatchPool for the shared TranslationService"""
+    from services.translation_service import get_translation_service
+
+    get_translation_service()  # Loading the shared service starts its pool
+    return _shared_pool
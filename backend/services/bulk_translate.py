@@ -0,0 +1,218 @@
+"""
+Offline bulk translation of lesson files.
+
+Streams plain-text, CSV, SRT and VTT files through TranslationService and
+writes one translated file per target language (CSV gets one extra column
+per target instead). Caption numbering, timing lines, headers and blank
+lines are copied unchanged; only caption text lines are translated, so
+every cue keeps its timing and layout. Files are processed in windows of
+lines, so memory stays constant however long the input is; each window is
+translated across worker processes (see services.batch_pool).
+
+Run from backend/:
+    python -m services.bulk_translate lesson1.srt worksheet.csv --targets bodo,mizo
+    python -m services.bulk_translate notes.txt --source auto --output-dir translated/
+"""
+
+import argparse
+import contextlib
+import csv
+import os
+import sys
+import time
+
+FORMATS = ('txt', 'csv', 'srt', 'vtt')
+
+# Lines translated together; bounds memory and gives the worker pool enough to split
+WINDOW_LINES = 5000
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    return extension if extension in FORMATS else 'txt'
+
+
+def read_segments(f, file_format):
+    """
+    Yield ('text', line) for lines to translate and ('copy', line) for structure kept as-is.
+
+    In SRT/VTT files only cue payload lines - after a timing line, up to the next blank
+    line - are text; cue numbers, identifiers, WEBVTT headers and NOTE blocks are copied.
+    """
+    in_cue = False
+    for line in f:
+        if not line.strip():
+            in_cue = False
+            yield 'copy', line
+        elif file_format == 'txt' or in_cue:
+            yield 'text', line
+        else:
+            in_cue = '-->' in line
+            yield 'copy', line
+
+
+class BulkStats:
+    """Line counts and coverage for one run"""
+
+    def __init__(self, target_langs):
+        self.lines = 0
+        self.translated = {target_lang: 0 for target_lang in target_langs}
+        self.corrections = 0
+        self.files = 0
+
+    def add(self, result):
+        self.lines += 1
+        for target_lang, found in result['found'].items():
+            self.translated[target_lang] += found
+        self.corrections += len(result['corrections'])
+
+    def report(self, seconds):
+        lines = [f"[BULK] {self.files} file(s), {self.lines} lines in {seconds:.2f}s "
+                 f"({self.lines / seconds if seconds else 0:.0f} lines/sec)"]
+        for target_lang, translated in self.translated.items():
+            coverage = translated / self.lines if self.lines else 0.0
+            lines.append(f"[BULK]   {target_lang}: {translated}/{self.lines} lines translated ({coverage:.1%})")
+        lines.append(f"[BULK]   typo corrections: {self.corrections}")
+        return '\n'.join(lines)
+
+
+def output_paths(path, file_format, target_langs, output_dir=None):
+    """{target: path} for lesson1.srt -> lesson1.bodo.srt; CSV writes lesson1.translated.csv"""
+    directory = output_dir or os.path.dirname(path)
+    stem, extension = os.path.splitext(os.path.basename(path))
+    if file_format == 'csv':
+        return {None: os.path.join(directory, f"{stem}.translated{extension}")}
+    return {target_lang: os.path.join(directory, f"{stem}.{target_lang}{extension}")
+            for target_lang in target_langs}
+
+
+def translate_file(pool, path, source_lang, target_langs, stats, output_dir=None, column=None,
+                   window=WINDOW_LINES):
+    """Translate one file window by window; returns the paths written"""
+    file_format = detect_format(path)
+    paths = output_paths(path, file_format, target_langs, output_dir)
+    with contextlib.ExitStack() as stack:
+        source = stack.enter_context(open(path, 'r', encoding='utf-8-sig', newline=''))
+        outputs = {target_lang: stack.enter_context(open(output, 'w', encoding='utf-8', newline=''))
+                   for target_lang, output in paths.items()}
+        if file_format == 'csv':
+            _translate_csv(pool, source, outputs[None], source_lang, target_langs, stats, column, window)
+        else:
+            _translate_lines(pool, source, file_format, outputs, source_lang, target_langs, stats, window)
+    stats.files += 1
+    return list(paths.values())
+
+
+def _translate_lines(pool, source, file_format, outputs, source_lang, target_langs, stats, window):
+    pending = []
+
+    def flush():
+        texts = [line.strip() for kind, line in pending if kind == 'text']
+        results = iter(pool.translate_batch(texts, source_lang, target_langs) if texts else ())
+        for kind, line in pending:
+            if kind == 'copy':
+                for output in outputs.values():
+                    output.write(line)
+                continue
+            result = next(results)
+            stats.add(result)
+            ending = line[len(line.rstrip('\r\n')):]
+            for target_lang, output in outputs.items():
+                # An untranslated caption keeps its original text so the cue still shows something
+                output.write((result['translations'].get(target_lang) or result['text']) + ending)
+        pending.clear()
+
+    texts = 0
+    for kind, line in read_segments(source, file_format):
+        pending.append((kind, line))
+        texts += kind == 'text'
+        if texts >= window:
+            flush()
+            texts = 0
+    flush()
+
+
+def _translate_csv(pool, source, output, source_lang, target_langs, stats, column, window):
+    reader = csv.reader(source)
+    writer = csv.writer(output)
+    header = next(reader, None)
+    if header is None:
+        return
+    if column is None:
+        column = next((name for name in header if name.lower() == (source_lang or 'english')), header[0])
+    if column not in header:
+        raise ValueError(f"column {column!r} not in {header}")
+    position = header.index(column)
+    writer.writerow(header + [f"{column}_{target_lang}" for target_lang in target_langs])
+    pending = []
+
+    def flush():
+        texts = [row[position].strip() if position < len(row) else '' for row in pending]
+        for row, result in zip(pending, pool.translate_batch(texts, source_lang, target_langs) if texts else ()):
+            if result['text']:
+                stats.add(result)
+            writer.writerow(row + [result['translations'].get(target_lang, '') for target_lang in target_langs])
+        pending.clear()
+
+    for row in reader:
+        pending.append(row)
+        if len(pending) >= window:
+            flush()
+    flush()
+
+
+def main(argv=None):
+    from services.batch_pool import BatchPool
+    from services.translation_journal import default_journal_path
+    from services.translation_service import DATASET_PATH, LANGUAGE_COLUMNS, TranslationService
+
+    parser = argparse.ArgumentParser(description="Translate lesson files (txt, csv, srt, vtt) offline")
+    parser.add_argument("files", nargs='+')
+    parser.add_argument("--source", default="english", help="source language, or 'auto' to detect per line")
+    parser.add_argument("--targets", default=None,
+                        help="comma-separated target languages (default: every language but the source)")
+    parser.add_argument("--output-dir", default=None, help="where to write results (default: next to each file)")
+    parser.add_argument("--column", default=None, help="CSV column to translate (default: the source language's)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (1 translates in this process)")
+    parser.add_argument("--window", type=int, default=WINDOW_LINES, help="lines translated per window")
+    parser.add_argument("--dataset", nargs='+', default=[DATASET_PATH], help="dataset CSV(s)")
+    parser.add_argument("--verbose", action="store_true", help="keep the per-lookup translation log")
+    args = parser.parse_args(argv)
+
+    source_lang = None if args.source == 'auto' else args.source.lower()
+    if args.targets:
+        target_langs = [target_lang.strip().lower() for target_lang in args.targets.split(',') if target_lang.strip()]
+    else:
+        target_langs = [lang for lang in LANGUAGE_COLUMNS if lang != (source_lang or 'english')]
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    # Same journal as the server (TRANSLATION_JOURNAL=0 ignores it), so runtime additions apply here too
+    journal_path = os.getenv('TRANSLATION_JOURNAL', default_journal_path(args.dataset[0]))
+    with contextlib.ExitStack() as stack:
+        log = sys.stdout if args.verbose else stack.enter_context(open(os.devnull, 'w'))
+        with contextlib.redirect_stdout(log):
+            service = TranslationService(csv_path=args.dataset,
+                                         journal_path=None if journal_path == '0' else journal_path)
+            pool = BatchPool(service, workers=args.workers if args.workers > 1 else 0, threshold=1)
+            pool.start()
+        print(f"[BULK] Dataset {service.dataset_version} loaded in {service.load_seconds:.2f}s; "
+              f"translating into {', '.join(target_langs)} with {max(args.workers, 1)} process(es)")
+
+        stats = BulkStats(target_langs)
+        started = time.perf_counter()
+        try:
+            for path in args.files:
+                with contextlib.redirect_stdout(log):
+                    written = translate_file(pool, path, source_lang, target_langs, stats, args.output_dir,
+                                             args.column, args.window)
+                print(f"[BULK] {path} -> {', '.join(written)}")
+        finally:
+            pool.close()
+        print(stats.report(time.perf_counter() - started))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Single-pass streaming ingest of one or more dataset CSVs.
+
+Each source (for example one CSV per subject) is parsed exactly once, record
+by record, straight into the shared RowStore that every index is built from;
+no list of row dicts or second parse is ever held. While streaming, the
+first row id holding each normalized key is remembered so later rows that
+repeat the key are reported - as duplicates when they agree, as conflicts
+when they translate it differently. The first row keeps winning, as it
+always has, so sources given earlier take precedence over later ones.
+"""
+
+import csv
+import os
+import time
+
+from services.row_store import RowStore
+
+# Conflicting keys listed individually in a load report; the rest are only counted
+MAX_REPORTED_CONFLICTS = 20
+
+
+def ingest_datasets(paths, columns, languages, normalize):
+    """
+    Stream every CSV in paths (in order) into one RowStore.
+
+    A row is kept if it has an English cell or a usable (non-empty, non-'?')
+    Bodo/Mizo cell; cells are stripped. Missing files and unreadable sources are
+    recorded in the report rather than raised.
+
+    Returns: (RowStore, load report dict)
+    """
+    started = time.perf_counter()
+    rows = RowStore(columns)
+    first_rows = {lang: {} for lang in languages}  # {language: {normalized key: first row id}}
+    report = {
+        'sources': [],
+        'rows_read': 0,
+        'rows_loaded': 0,
+        'skipped': {'empty': 0, 'placeholder_only': 0},
+        'duplicates': {lang: 0 for lang in languages},
+        'conflicts': {lang: 0 for lang in languages},
+        'conflict_samples': []
+    }
+
+    for path in paths:
+        source = _ingest_source(path, rows, columns, languages, normalize, first_rows, report)
+        report['sources'].append(source)
+        report['rows_read'] += source['rows_read']
+        report['rows_loaded'] += source['rows_loaded']
+        for reason, count in source['skipped'].items():
+            report['skipped'][reason] += count
+
+    report['seconds'] = round(time.perf_counter() - started, 4)
+    return rows, report
+
+
+def _ingest_source(path, rows, columns, languages, normalize, first_rows, report):
+    started = time.perf_counter()
+    name = os.path.basename(path)
+    source = {'path': path, 'rows_read': 0, 'rows_loaded': 0, 'extra_fields': 0,
+              'skipped': {'empty': 0, 'placeholder_only': 0}}
+    if not os.path.exists(path):
+        source['error'] = 'file not found'
+        return source
+
+    language_positions = [(lang, columns.index(col)) for lang, col in languages.items()]
+    english_position = columns.index(languages['english'])
+    id_position = columns.index('ID') if 'ID' in columns else None
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            positions = [header.index(column) if column in header else None for column in columns]
+            missing = [column for column, position in zip(columns, positions) if position is None]
+            if missing:
+                source['missing_columns'] = missing
+
+            for record in reader:
+                if not record:
+                    continue
+                source['rows_read'] += 1
+                if len(record) > len(header):
+                    source['extra_fields'] += 1  # Kept, as csv.DictReader would; the extras are ignored
+                cells = [record[position].strip() if position is not None and position < len(record) else ''
+                         for position in positions]
+
+                usable = [(lang, cells[position]) for lang, position in language_positions
+                          if cells[position] and cells[position] != '?']
+                if not usable and not cells[english_position]:
+                    reason = 'placeholder_only' if any(cells[position] for _, position in language_positions) else 'empty'
+                    source['skipped'][reason] += 1
+                    continue
+
+                row_id = rows.append_cells(cells)
+                source['rows_loaded'] += 1
+                for lang, value in usable:
+                    first = first_rows[lang].setdefault(normalize(value), row_id)
+                    if first != row_id:
+                        _record_repeat(rows, first, cells, lang, value, language_positions, id_position,
+                                       f"{name}:{reader.line_num}", report)
+    except Exception as e:
+        # Rows read before the error stay loaded; the report says where it stopped
+        source['error'] = f"{type(e).__name__}: {e}"
+        print(f"[CSV LOADER] Error reading {path}: {e}")
+
+    source['seconds'] = round(time.perf_counter() - started, 4)
+    return source
+
+
+def _record_repeat(rows, first, cells, lang, value, language_positions, id_position, where, report):
+    """A later row repeats a key: a conflict if another language disagrees, otherwise a duplicate"""
+    columns = rows.columns
+    for other, position in language_positions:
+        if other == lang:
+            continue
+        kept = rows.value(first, columns[position])
+        shadowed = cells[position]
+        if kept and kept != '?' and shadowed and shadowed != '?' and kept != shadowed:
+            report['conflicts'][lang] += 1
+            if len(report['conflict_samples']) < MAX_REPORTED_CONFLICTS:
+                report['conflict_samples'].append({
+                    'language': lang,
+                    'key': value,
+                    'target': other,
+                    'kept': {'id': rows.value(first, columns[id_position]) if id_position is not None else None,
+                             'translation': kept},
+                    'shadowed': {'at': where,
+                                 'id': cells[id_position] if id_position is not None else None,
+                                 'translation': shadowed}
+                })
+            return
+    report['duplicates'][lang] += 1
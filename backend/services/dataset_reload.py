@@ -0,0 +1,305 @@
+"""
+Incremental index rebuild for a changed classroom dataset.
+
+A reload re-reads the CSV into a fresh RowStore (that part is unavoidable)
+and diffs it against the rows of the live generation. When the edit is
+small, only the dictionary keys that appear in changed rows are recomputed -
+translation_db and exact_index entries, single-word entries, token counts
+and phrase-trie paths - and everything else is shared with the old
+generation. Pivot-filled entries depend on other rows, so they are derived
+again and only the keys whose pivots changed are patched downstream.
+Directions the old generation never built stay unbuilt; they are built
+from the new rows on first use. Larger edits fall back to the full build,
+which warms the directions that were in use.
+"""
+
+import string
+
+from services.translation_indexes import TranslationIndexes
+
+# Above this share of changed rows a full rebuild is cheaper than patching
+MAX_CHANGED_FRACTION = 0.2
+
+# Deleting punctuation and whitespace maps every spelling of a phrase to the same string
+_SKELETON = str.maketrans('', '', string.punctuation + string.whitespace)
+
+
+def diff_rows(old_rows, new_rows):
+    """
+    Smallest contiguous block of rows that differs, found by trimming the common prefix and suffix.
+
+    Returns: (start, old_end, new_end) - rows old[start:old_end] became new[start:new_end]
+    """
+    old = list(zip(*(old_rows.column(column) for column in old_rows.columns)))
+    new = list(zip(*(new_rows.column(column) for column in new_rows.columns)))
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def rebuild_indexes(service, current, rows, dataset_version):
+    """
+    Indexes for the rows of a re-read CSV, patched from `current` when only a few rows changed.
+
+    Returns: (TranslationIndexes or None if nothing changed, stats dict)
+    """
+    from services.translation_service import LANGUAGE_COLUMNS as languages
+
+    if rows.columns != current.csv_rows.columns:
+        return _full_rebuild(service, current, rows, dataset_version), {'mode': 'full', 'reason': 'columns changed'}
+
+    start, old_end, new_end = diff_rows(current.csv_rows, rows)
+    changed = (old_end - start) + (new_end - start)
+    stats = {'mode': 'incremental', 'removed_rows': old_end - start, 'added_rows': new_end - start}
+    if not changed:
+        return None, dict(stats, mode='unchanged')
+    if changed > MAX_CHANGED_FRACTION * max(len(rows), 1):
+        return _full_rebuild(service, current, rows, dataset_version), dict(stats, mode='full')
+
+    removed = [current.csv_rows[row_id] for row_id in range(start, old_end)]
+    added = [rows[row_id] for row_id in range(start, new_end)]
+
+    # Every key a changed row contributed (or now contributes) is recomputed; nothing else can differ
+    affected = {lang: set() for lang in languages}
+    for row in removed + added:
+        for lang, col in languages.items():
+            value = row.get(col)
+            if value:
+                affected[lang].add(service._normalize_text(value))
+
+    # Rows (in file order) holding each affected key, from one pass over the new columns
+    key_rows = {lang: {} for lang in languages}
+    for lang, col in languages.items():
+        keys = affected[lang]
+        if not keys:
+            continue
+        for row_id, value in enumerate(rows.column(col)):
+            if value:
+                key = service._normalize_text(value)
+                if key in keys:
+                    key_rows[lang].setdefault(key, []).append(row_id)
+
+    translation_db = _patch_translation_db(current.translation_db, rows, languages, affected, key_rows)
+    old_provenance = current.pivot_provenance.built()
+    direct_index = _without_pivots(current.exact_index.built(), old_provenance)
+    direct_index = _patch_exact_index(direct_index, rows, languages, affected, key_rows)
+    exact_index, pivot_provenance = _with_pivots(service, rows, direct_index)
+
+    # Keys that gained or lost a pivot translation need their word/phrase entries redone too
+    index_affected = {lang: set(keys) for lang, keys in affected.items()}
+    for (source_lang, target_lang), pivoted in pivot_provenance.items():
+        index_affected[source_lang].update(pivoted)
+        index_affected[source_lang].update(old_provenance.get((source_lang, target_lang), ()))
+
+    word_index = _patch_word_index(current.word_index.built(), exact_index, translation_db, index_affected)
+    token_index = _patch_token_index(service, current.token_index, languages, removed, added)
+    phrase_tries = _patch_phrase_tries(service, current.phrase_tries.built(), exact_index, pivot_provenance, rows,
+                                       languages, index_affected)
+
+    stats['affected_keys'] = sum(len(keys) for keys in affected.values())
+    built = {'exact_index': exact_index, 'pivot_provenance': pivot_provenance, 'word_index': word_index,
+             'phrase_tries': phrase_tries}
+    indexes = TranslationIndexes(
+        translation_db=translation_db,
+        csv_rows=rows,
+        token_index=token_index,
+        dataset_version=dataset_version,
+        **service._lazy_indexes(rows, translation_db, built)
+    )
+    # Folded keys only take one pass over the new database, so they are rebuilt rather than patched
+    for source_lang in current.folded_index.built():
+        indexes.folded_index[source_lang]
+    return indexes, stats
+
+
+def _full_rebuild(service, current, rows, dataset_version):
+    """Fresh lazy indexes for rows, with every direction the current generation had built warmed up"""
+    translation_db = service._load_translation_database(rows)
+    indexes = TranslationIndexes(
+        translation_db=translation_db,
+        csv_rows=rows,
+        token_index=service._build_token_index(rows),
+        dataset_version=dataset_version,
+        **service._lazy_indexes(rows, translation_db)
+    )
+    for name in ('exact_index', 'word_index', 'phrase_tries', 'folded_index'):
+        for key in getattr(current, name).built():
+            getattr(indexes, name)[key]
+    return indexes
+
+
+def _patch_translation_db(translation_db, rows, languages, affected, key_rows):
+    """Same first-row-wins rules as TranslationService._load_translation_database()"""
+    translation_db = dict(translation_db)
+    for lang, col in languages.items():
+        if not affected[lang]:
+            continue
+        entries = translation_db[lang] = dict(translation_db.get(lang, {}))
+        others = [(other, other_col) for other, other_col in languages.items() if other != lang]
+        for key in affected[lang]:
+            # English keys accept any row; Bodo/Mizo skip '?' placeholders
+            winner = next((row_id for row_id in key_rows[lang].get(key, ())
+                           if lang == 'english' or rows.value(row_id, col) != '?'), None)
+            if winner is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = {other: rows.value(winner, other_col) for other, other_col in others}
+    return translation_db
+
+
+def _without_pivots(exact_index, pivot_provenance):
+    """Direct entries only: copies of the directions that hold pivot-filled keys, minus those keys"""
+    exact_index = dict(exact_index)
+    for direction, pivoted in pivot_provenance.items():
+        if pivoted:
+            entries = exact_index[direction] = dict(exact_index[direction])
+            for key in pivoted:
+                entries.pop(key, None)
+    return exact_index
+
+
+def _with_pivots(service, rows, direct_index):
+    """
+    Add pivot-filled keys to each direction of direct_index.
+
+    Pivots are looked up among direct entries only, so they never chain.
+    Returns: (exact_index, pivot_provenance) for the same directions
+    """
+    exact_index = {}
+    pivot_provenance = {}
+    for (source_lang, target_lang), entries in direct_index.items():
+        pivot_lang = service._pivot_language(source_lang, target_lang)
+        filled = service._pivot_entries(rows, source_lang, target_lang, entries,
+                                        direct_index.get((pivot_lang, target_lang)))
+        if filled:
+            entries = dict(entries)
+            entries.update(filled)
+        exact_index[(source_lang, target_lang)] = entries
+        pivot_provenance[(source_lang, target_lang)] = {key: pivot_lang for key in filled}
+    return exact_index, pivot_provenance
+
+
+def _patch_exact_index(exact_index, rows, languages, affected, key_rows):
+    """Same first-usable-row-wins rule as TranslationService._build_exact_direction()"""
+    exact_index = dict(exact_index)
+    for (source_lang, target_lang), entries in list(exact_index.items()):
+        if not affected[source_lang]:
+            continue
+        source_col = languages[source_lang]
+        target_col = languages[target_lang]
+        entries = exact_index[(source_lang, target_lang)] = dict(entries)
+        for key in affected[source_lang]:
+            value = None
+            for row_id in key_rows[source_lang].get(key, ()):
+                target_value = rows.value(row_id, target_col)
+                if rows.value(row_id, source_col) != '?' and target_value and target_value != '?':
+                    value = target_value
+                    break
+            if value is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = value
+    return exact_index
+
+
+def _patch_word_index(word_index, exact_index, translation_db, affected):
+    """Same precedence as TranslationService._build_word_direction(): CSV entry, then database"""
+    word_index = dict(word_index)
+    for (source_lang, target_lang), words in list(word_index.items()):
+        keys = [key for key in affected[source_lang] if len(key.split()) == 1]
+        if not keys:
+            continue
+        words = word_index[(source_lang, target_lang)] = dict(words)
+        for key in keys:
+            value = exact_index[(source_lang, target_lang)].get(key)
+            if value is None:
+                value = translation_db.get(source_lang, {}).get(key, {}).get(target_lang)
+                if not (value and value.strip()):
+                    value = None
+            if value is None:
+                words.pop(key, None)
+            else:
+                words[key] = value
+    return word_index
+
+
+def _patch_token_index(service, token_index, languages, removed, added):
+    """Move the changed rows' token counts out of / into TranslationService._build_token_index()"""
+    token_index = dict(token_index)
+    copied = set()
+    for rows, step in ((removed, -1), (added, 1)):
+        for row in rows:
+            for lang, col in languages.items():
+                value = row.get(col)
+                if not value or value == '?':
+                    continue
+                for token in service._tokenize(value):
+                    if token not in copied:
+                        token_index[token] = dict(token_index.get(token, {}))
+                        copied.add(token)
+                    counts = token_index[token]
+                    counts[lang] = counts.get(lang, 0) + step
+                    if counts[lang] <= 0:
+                        del counts[lang]
+                    if not counts:
+                        del token_index[token]
+                        copied.discard(token)
+    return token_index
+
+
+def _patch_phrase_tries(service, phrase_tries, exact_index, pivot_provenance, rows, languages, affected):
+    """
+    Re-point every affected multi-word phrase's trie path at its new translation (or remove it).
+
+    Keys that differ only in punctuation ("well done" / "well done!") share one path. As in a
+    full build, the direct entry whose first usable row comes first owns it, then pivot-filled
+    entries in row order - so every row with the same tokens is considered, not only changed ones.
+    """
+    phrase_tries = dict(phrase_tries)
+    for source_lang, keys in affected.items():
+        if source_lang not in phrase_tries:
+            continue  # Not built yet; it will be built from the new rows
+        phrases = {}
+        for key in keys:
+            tokens = tuple(service._tokenize(key))
+            if len(tokens) > 1:
+                phrases[tokens] = []
+        if not phrases:
+            continue
+
+        # Rows spelling each phrase; only rows with a matching skeleton are tokenized
+        skeletons = {''.join(tokens).translate(_SKELETON) for tokens in phrases}
+        for row_id, value in enumerate(rows.column(languages[source_lang])):
+            if value and value.lower().translate(_SKELETON) in skeletons:
+                tokens = tuple(service._tokenize(value))
+                if tokens in phrases:
+                    phrases[tokens].append(row_id)
+
+        changes = []
+        for target_lang in languages:
+            if target_lang == source_lang:
+                continue
+            entries = exact_index[(source_lang, target_lang)]
+            pivoted = pivot_provenance.get((source_lang, target_lang), {})
+            target_col = languages[target_lang]
+            for tokens, row_ids in phrases.items():
+                value = None
+                for row_id in row_ids:
+                    target_value = rows.value(row_id, target_col)
+                    key = service._normalize_text(rows.value(row_id, languages[source_lang]))
+                    if target_value and target_value != '?' and key in entries and key not in pivoted:
+                        value = entries[key]
+                        break
+                if value is None:
+                    value = next((entries[key] for key in (
+                        service._normalize_text(rows.value(row_id, languages[source_lang])) for row_id in row_ids)
+                        if key in pivoted), None)
+                changes.append((list(tokens), target_lang, value))
+        phrase_tries[source_lang] = phrase_tries[source_lang].updated(changes)
+    return phrase_tries
@@ -0,0 +1,134 @@
+# When the closest words tie on distance, frequency only decides if the winner occurs this many times as often
+MIN_FREQUENCY_LEAD = 2
+
+
+class FuzzyWordIndex:
+    """
+    Typo-tolerant lookup over one language's vocabulary (SymSpell-style).
+
+    Every word is filed under each string obtained by deleting up to
+    max_distance characters from it. A query generates its own deletions and
+    probes for them, so candidates come from a few dict lookups instead of a
+    vocabulary scan; only those candidates get a real edit-distance check.
+    """
+
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self.frequencies = {}  # word -> occurrences in the dataset
+        self._deletes = {}  # deletion variant -> word, or tuple of words sharing it
+
+    def add(self, word, frequency=1):
+        if word in self.frequencies:
+            self.frequencies[word] += frequency
+            return
+        self.frequencies[word] = frequency
+        for variant in _deletions(word, self.max_distance):
+            words = self._deletes.get(variant)
+            if words is None:
+                self._deletes[variant] = word
+            elif isinstance(words, tuple):
+                self._deletes[variant] = words + (word,)
+            else:
+                self._deletes[variant] = (words, word)
+
+    def allowed_distance(self, word):
+        """
+        Short words tolerate fewer edits: below 3 characters any edit changes the meaning,
+        and below 8 two edits reach too many real words ("chapter" -> "charger").
+        """
+        if len(word) < 3:
+            return 0
+        if len(word) < 8:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def candidates(self, word):
+        """
+        Stored words within the allowed edit distance (Damerau: a transposition is one edit).
+
+        Returns: [(word, distance)], closest first, then more frequent, then alphabetical
+        """
+        limit = self.allowed_distance(word)
+        if not limit:
+            return []
+        ranked = []
+        checked = set()
+        for variant in _deletions(word, limit):
+            words = self._deletes.get(variant)
+            if words is None:
+                continue
+            for candidate in (words if isinstance(words, tuple) else (words,)):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                distance = _edit_distance(word, candidate, limit)
+                if distance <= limit:
+                    ranked.append((distance, -self.frequencies[candidate], candidate))
+        return [(candidate, distance) for distance, _, candidate in sorted(ranked)]
+
+    def best(self, candidates):
+        """
+        First of some ranked candidates, or None when it is ambiguous: the runner-up is as
+        close and the first is not MIN_FREQUENCY_LEAD times as frequent.
+        """
+        if not candidates:
+            return None
+        if len(candidates) > 1:
+            (word, distance), (runner_up, runner_up_distance) = candidates[:2]
+            if (runner_up_distance == distance
+                    and self.frequencies[word] < MIN_FREQUENCY_LEAD * self.frequencies[runner_up]):
+                return None
+        return candidates[0]
+
+    def lookup(self, word):
+        """
+        Closest stored word, ties going to the clearly more frequent one (see best()).
+
+        Returns: (word, distance), or None if nothing is close enough or the closest are ambiguous
+        """
+        if word in self.frequencies:
+            return (word, 0)
+        return self.best(self.candidates(word))
+
+    def matches(self, word, other):
+        """Whether other is word, or within word's allowed edit distance of it (other need not be stored)"""
+        if word == other:
+            return True
+        limit = self.allowed_distance(word)
+        return bool(limit) and _edit_distance(word, other, limit) <= limit
+
+    def __contains__(self, word):
+        return word in self.frequencies
+
+    def __len__(self):
+        return len(self.frequencies)
+
+
+def _deletions(word, max_distance):
+    """word plus every string reachable by deleting up to max_distance characters"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier if len(variant) > 1
+                    for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 as soon as it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
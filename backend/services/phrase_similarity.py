@@ -0,0 +1,164 @@
+"""
+Nearest-phrase retrieval for sentences with no exact dataset match.
+
+A teacher's sentence is often a slight paraphrase of a dataset row ("please
+open your notebooks now"). Each language's multi-word dataset phrases are
+turned into L2-normalized TF-IDF vectors over character trigrams, which
+tolerate reordered, added or misspelled words. A query is scored against
+every phrase at once with a sparse dot product: the postings of the
+query's trigrams are gathered and summed per phrase. Batches are scored as
+one matrix (queries x phrases) per block of queries, then the top k
+phrases of each row are selected.
+
+NumPy is optional (it is not in requirements.txt): it makes the scoring
+vectorized; without it the same arithmetic runs in pure Python with the
+same ranking, only slower.
+"""
+
+import math
+import string
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NGRAM = 3
+
+# Score matrix cells per block of a batch (8 bytes each), so a huge batch never allocates a huge matrix
+_BLOCK_CELLS = 4_000_000
+
+_PUNCTUATION = set(string.punctuation)
+
+
+def analyze(text):
+    """Lowercase tokens with surrounding punctuation removed, joined by single spaces (as _tokenize())"""
+    tokens = []
+    for word in text.lower().split():
+        word = word.strip(string.punctuation)
+        if word:
+            tokens.append(word)
+    return ' '.join(tokens)
+
+
+def ngram_counts(text):
+    """{character trigram: occurrences} of analyzed text, padded so word edges form trigrams too"""
+    padded = f" {text} "
+    counts = {}
+    for start in range(len(padded) - NGRAM + 1):
+        gram = padded[start:start + NGRAM]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class PhraseSimilarityIndex:
+    """TF-IDF character-trigram vectors of one language's phrases, queried by cosine similarity"""
+
+    def __init__(self, phrases):
+        """phrases: iterable of dataset keys; each is analyzed, and duplicates after analysis keep the first key"""
+        self.keys = []
+        vectors = []
+        seen = set()
+        for key in phrases:
+            text = analyze(key)
+            if text and text not in seen:
+                seen.add(text)
+                self.keys.append(key)
+                vectors.append(ngram_counts(text))
+
+        document_frequency = {}
+        for counts in vectors:
+            for gram in counts:
+                document_frequency[gram] = document_frequency.get(gram, 0) + 1
+        total = len(vectors)
+        # Smoothed IDF; a trigram no phrase has still weighs in a query's norm, as the rarest kind
+        self.idf = {gram: math.log((1 + total) / (1 + count)) + 1 for gram, count in document_frequency.items()}
+        self.unseen_idf = math.log(1 + total) + 1
+
+        # Postings per trigram: (phrase number, normalized weight), in phrase order
+        postings = {gram: [] for gram in self.idf}
+        for row, counts in enumerate(vectors):
+            weights = {gram: count * self.idf[gram] for gram, count in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            for gram, weight in weights.items():
+                postings[gram].append((row, weight / norm))
+
+        self._features = {gram: feature for feature, gram in enumerate(postings)}
+        if np is not None:
+            lengths = [len(entries) for entries in postings.values()]
+            self._indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=self._indptr[1:])
+            self._rows = np.fromiter((row for entries in postings.values() for row, _ in entries),
+                                     dtype=np.int64, count=int(self._indptr[-1]))
+            self._weights = np.fromiter((weight for entries in postings.values() for _, weight in entries),
+                                        dtype=np.float64, count=int(self._indptr[-1]))
+            self._postings = None
+        else:
+            self._postings = list(postings.values())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _query_vector(self, text):
+        """[(feature, weight)] of a query, normalized over all its trigrams (unseen ones included)"""
+        counts = ngram_counts(analyze(text))
+        weights = {gram: count * self.idf.get(gram, self.unseen_idf) for gram, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        if not norm:
+            return []
+        return [(self._features[gram], weight / norm) for gram, weight in weights.items() if gram in self._features]
+
+    def top_k(self, queries, k=5):
+        """
+        The k most similar phrases of every query, best first (ties keep dataset order).
+
+        Returns: list in query order of [(key, cosine score)]
+        """
+        vectors = [self._query_vector(query) for query in queries]
+        if not self.keys:
+            return [[] for _ in vectors]
+        if np is None:
+            return [self._top_k_python(vector, k) for vector in vectors]
+        block = max(1, _BLOCK_CELLS // len(self.keys))
+        results = []
+        for start in range(0, len(vectors), block):
+            results.extend(self._top_k_numpy(vectors[start:start + block], k))
+        return results
+
+    def _top_k_numpy(self, vectors, k):
+        phrase_count = len(self.keys)
+        query_ids = np.fromiter((query for query, vector in enumerate(vectors) for _ in vector), dtype=np.int64)
+        features = np.fromiter((feature for vector in vectors for feature, _ in vector), dtype=np.int64)
+        query_weights = np.fromiter((weight for vector in vectors for _, weight in vector), dtype=np.float64)
+
+        # Expand every query trigram into its postings: one gather, one multiply, one scatter-add
+        starts = self._indptr[features]
+        lengths = self._indptr[features + 1] - starts
+        offsets = np.arange(int(lengths.sum()), dtype=np.int64)
+        offsets += np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        cells = np.repeat(query_ids, lengths) * phrase_count + self._rows[offsets]
+        products = self._weights[offsets] * np.repeat(query_weights, lengths)
+        scores = np.bincount(cells, weights=products, minlength=len(vectors) * phrase_count)
+        scores = scores.reshape(len(vectors), phrase_count)
+
+        # argpartition alone would pick arbitrarily among phrases tied at the k-th score; instead
+        # take every phrase above it, fill up with the tied ones in dataset order, then rank by
+        # (-score, phrase number) as the pure Python path does
+        count = min(k, phrase_count)
+        kth = -np.partition(-scores, count - 1, axis=1)[:, count - 1]
+        results = []
+        for query, row in enumerate(scores):
+            above = np.flatnonzero(row > kth[query])
+            tied = np.flatnonzero(row == kth[query])[:count - len(above)]
+            chosen = np.concatenate((above, tied))
+            ranked = chosen[np.lexsort((chosen, -row[chosen]))]
+            results.append([(self.keys[phrase], float(row[phrase])) for phrase in ranked.tolist() if row[phrase] > 0])
+        return results
+
+    def _top_k_python(self, vector, k):
+        scores = {}
+        for feature, weight in vector:
+            for row, phrase_weight in self._postings[feature]:
+                scores[row] = scores.get(row, 0.0) + weight * phrase_weight
+        ranked = sorted((-score, row) for row, score in scores.items())[:k]
+        return [(self.keys[row], -score) for score, row in ranked]
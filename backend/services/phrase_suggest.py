@@ -0,0 +1,111 @@
+"""
+Prefix autocomplete over one language's dataset phrases.
+
+Phrases are kept in one sorted list, so the phrases starting with a prefix
+form a contiguous range found by two binary searches. A sparse table over
+the phrases' ranks answers "best phrase in this range" in O(1), and the top
+k are drawn from it with a small heap - so a keystroke costs O(log n + k log k)
+however many phrases share the prefix ("a" matches thousands).
+
+The static rank is how often a phrase occurs in the dataset, then shorter
+phrases first. Usage - how often teachers actually translated a phrase in
+this process - ranks above it and is tracked separately by PhraseUsage,
+since it changes on every request while the sorted list never does.
+"""
+
+import bisect
+import heapq
+import threading
+from array import array
+
+
+def normalize_prefix(text):
+    """Lowercase, leading whitespace dropped and inner runs collapsed; a trailing space is kept"""
+    text = text.lower().lstrip()
+    trailing = ' ' if text[-1:].isspace() else ''
+    return ' '.join(text.split()) + trailing
+
+
+def prefix_range(phrases, prefix):
+    """[start, end) of the sorted phrases beginning with prefix"""
+    start = bisect.bisect_left(phrases, prefix)
+    end = bisect.bisect_left(phrases, prefix + '\U0010ffff', start)
+    return start, end
+
+
+class PrefixIndex:
+    """Sorted phrases of one language, with the best-ranked phrase of any range in O(1)"""
+
+    def __init__(self, counts):
+        """counts: {normalized phrase: occurrences in the dataset}"""
+        self.phrases = sorted(counts)
+        self.counts = counts
+        ranked = sorted(range(len(self.phrases)),
+                        key=lambda i: (-counts[self.phrases[i]], len(self.phrases[i]), self.phrases[i]))
+        self._rank = array('i', [0]) * len(self.phrases)  # Higher is better
+        for position, i in enumerate(ranked):
+            self._rank[i] = len(ranked) - position
+        # _best[level][i]: phrase with the highest rank in phrases[i:i + 2**level]
+        self._best = [array('i', range(len(self.phrases)))]
+        width = 1
+        while width * 2 <= len(self.phrases):
+            previous = self._best[-1]
+            self._best.append(array('i', (self._better(previous[i], previous[i + width])
+                                          for i in range(len(self.phrases) - width * 2 + 1))))
+            width *= 2
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def _better(self, a, b):
+        return a if self._rank[a] >= self._rank[b] else b
+
+    def _best_in(self, start, end):
+        level = (end - start).bit_length() - 1
+        return self._better(self._best[level][start], self._best[level][end - (1 << level)])
+
+    def top(self, prefix, k):
+        """Up to k phrases starting with prefix, best ranked first"""
+        start, end = prefix_range(self.phrases, prefix)
+        if start >= end:
+            return []
+        best = self._best_in(start, end)
+        heap = [(-self._rank[best], best, start, end)]
+        results = []
+        while heap and len(results) < k:
+            _, best, start, end = heapq.heappop(heap)
+            results.append(self.phrases[best])
+            # The rest of the range is the two sides of the phrase just taken
+            for left, right in ((start, best), (best + 1, end)):
+                if left < right:
+                    child = self._best_in(left, right)
+                    heapq.heappush(heap, (-self._rank[child], child, left, right))
+        return results
+
+
+class PhraseUsage:
+    """How often each phrase of one language was translated, searchable by prefix; safe to share between threads"""
+
+    def __init__(self):
+        self.counts = {}
+        self._phrases = []  # Sorted; only phrases used at least once
+        self._lock = threading.Lock()
+
+    def record(self, phrase):
+        with self._lock:
+            if phrase not in self.counts:
+                bisect.insort(self._phrases, phrase)
+                self.counts[phrase] = 0
+            self.counts[phrase] += 1
+
+    def snapshot(self):
+        """Copy of the counts, taken under the lock so a concurrent record() can't change it mid-read"""
+        with self._lock:
+            return dict(self.counts)
+
+    def top(self, prefix, k, known):
+        """Up to k used phrases starting with prefix that are in `known`, most used first"""
+        phrases = self._phrases
+        start, end = prefix_range(phrases, prefix)
+        used = [(self.counts.get(phrase, 0), phrase) for phrase in phrases[start:end] if phrase in known]
+        return [phrase for _, phrase in heapq.nlargest(k, used, key=lambda item: (item[0], -len(item[1])))]
@@ -0,0 +1,98 @@
+class PhraseTrie:
+    """
+    Token-level trie over one source language's dataset phrases.
+
+    Each node is a dict of token -> child node; a node that ends a phrase stores
+    {target language: translation} under the _VALUE key, so a single walk finds
+    the longest match for every target at once. Lookups visit at most as many
+    nodes as the longest phrase, independent of how many phrases are stored.
+    """
+
+    _VALUE = ''  # Tokens are never empty, so this key cannot collide (and survives pickling)
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+        self.depth = 0  # Tokens in the longest phrase; no match can span more
+
+    def insert(self, tokens, target_lang, value):
+        """Add a phrase's translation; the first value stored per target wins"""
+        if not tokens:
+            return
+        self.depth = max(self.depth, len(tokens))
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        translations = node.get(self._VALUE)
+        if translations is None:
+            translations = node[self._VALUE] = {}
+            self.size += 1
+        translations.setdefault(target_lang, value)
+
+    def updated(self, changes):
+        """
+        Copy of the trie with changes applied, sharing every untouched subtree with this one.
+
+        changes: iterable of (tokens, target_lang, value); a value of None removes that target's
+        phrase. Only nodes on changed paths are copied, so readers of this trie are unaffected.
+        The depth is never lowered by a removal, which only makes it a looser bound.
+        """
+        trie = PhraseTrie()
+        trie.root = dict(self.root)
+        trie.size = self.size
+        trie.depth = self.depth
+        copied = {id(trie.root)}
+        for tokens, target_lang, value in changes:
+            node = trie.root
+            for token in tokens:
+                child = node.get(token)
+                if child is None:
+                    if value is None:
+                        break
+                    child = node[token] = {}
+                elif id(child) not in copied:
+                    child = node[token] = dict(child)
+                else:
+                    node = child
+                    continue
+                copied.add(id(child))
+                node = child
+            else:
+                if not tokens:
+                    continue
+                translations = dict(node.get(self._VALUE) or {})
+                if not translations and value is not None:
+                    trie.size += 1
+                if value is None:
+                    if translations.pop(target_lang, None) is not None and not translations:
+                        del node[self._VALUE]
+                        trie.size -= 1
+                        continue
+                else:
+                    translations[target_lang] = value
+                    trie.depth = max(trie.depth, len(tokens))
+                if translations:
+                    node[self._VALUE] = translations
+        return trie
+
+    def longest_matches(self, tokens, start=0):
+        """
+        Find, for each target, the longest stored phrase beginning at tokens[start].
+
+        Returns: {target language: (length, translation)}; empty if no phrase starts there
+        """
+        node = self.root
+        matches = {}
+        for position in range(start, len(tokens)):
+            node = node.get(tokens[position])
+            if node is None:
+                break
+            translations = node.get(self._VALUE)
+            if translations:
+                length = position - start + 1
+                for target_lang, value in translations.items():
+                    matches[target_lang] = (length, value)
+        return matches
+
+    def __len__(self):
+        return self.size
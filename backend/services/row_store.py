@@ -0,0 +1,120 @@
+import sys
+from array import array
+
+
+class RowStore:
+    """
+    Compact columnar storage for dataset rows.
+
+    Every distinct cell value is kept once in a shared string table and each
+    column is an array of 32-bit offsets into that table, so a row costs a few
+    bytes per column instead of a dict plus its own strings. Rows are addressed
+    by integer id (their position in the file); indexes built from the store
+    hold references to the same interned strings rather than copies.
+    """
+
+    __slots__ = ('columns', 'strings', '_string_ids', '_cells')
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.strings = ['']  # String id 0 is the empty cell
+        self._string_ids = {'': 0}
+        self._cells = {column: array('I') for column in self.columns}
+
+    def intern(self, value):
+        """Return the shared copy of value, adding it to the string table if new"""
+        return self.strings[self._intern_id(value)]
+
+    def _intern_id(self, value):
+        if self._string_ids is None:
+            self._string_ids = {string: string_id for string_id, string in enumerate(self.strings)}
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def append(self, row):
+        """Add a csv.DictReader row (cells are stripped); returns the new row id"""
+        for column in self.columns:
+            self._cells[column].append(self._intern_id((row.get(column) or '').strip()))
+        return len(self) - 1
+
+    def append_cells(self, cells):
+        """Add one row given as already-stripped values in column order; returns the new row id"""
+        for column, value in zip(self.columns, cells):
+            self._cells[column].append(self._intern_id(value))
+        return len(self) - 1
+
+    def freeze(self):
+        """Drop the build-time string lookup table once no more rows will be added"""
+        self._string_ids = None
+
+    def value(self, row_id, column):
+        """Cell value for a row id, '' for unknown columns"""
+        cells = self._cells.get(column)
+        if cells is None:
+            return ''
+        return self.strings[cells[row_id]]
+
+    def column(self, column):
+        """Iterate one column's values in row order without building row views"""
+        strings = self.strings
+        return (strings[string_id] for string_id in self._cells.get(column, ()))
+
+    def memory_bytes(self):
+        """Approximate resident size of the string table and column arrays"""
+        size = sys.getsizeof(self.strings) + sum(sys.getsizeof(string) for string in self.strings)
+        size += sum(sys.getsizeof(cells) for cells in self._cells.values())
+        if self._string_ids is not None:
+            size += sys.getsizeof(self._string_ids)
+        return size
+
+    def __len__(self):
+        return len(self._cells[self.columns[0]]) if self.columns else 0
+
+    def __getitem__(self, row_id):
+        if not -len(self) <= row_id < len(self):
+            raise IndexError(row_id)
+        return Row(self, row_id % len(self))
+
+    def __iter__(self):
+        for row_id in range(len(self)):
+            yield Row(self, row_id)
+
+    def __getstate__(self):
+        # The lookup table is rebuilt on demand, so snapshots don't carry it
+        return {'columns': self.columns, 'strings': self.strings, '_cells': self._cells}
+
+    def __setstate__(self, state):
+        self.columns = state['columns']
+        self.strings = state['strings']
+        self._cells = state['_cells']
+        self._string_ids = None
+
+
+class Row:
+    """Read-only view of one stored row with the dict-style access csv rows had"""
+
+    __slots__ = ('store', 'row_id')
+
+    def __init__(self, store, row_id):
+        self.store = store
+        self.row_id = row_id
+
+    def get(self, column, default=''):
+        if column not in self.store.columns:
+            return default
+        return self.store.value(self.row_id, column)
+
+    def __getitem__(self, column):
+        if column not in self.store.columns:
+            raise KeyError(column)
+        return self.store.value(self.row_id, column)
+
+    def to_dict(self):
+        return {column: self.store.value(self.row_id, column) for column in self.store.columns}
+
+    def __repr__(self):
+        return f"Row({self.row_id}, {self.to_dict()!r})"
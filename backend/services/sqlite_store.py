@@ -0,0 +1,658 @@
+"""
+On-disk SQLite storage engine for the translation indexes.
+
+The in-memory engine keeps every index as Python dicts in every worker, which
+stops scaling once regional vocabularies reach hundreds of thousands of rows.
+With TRANSLATION_ENGINE=sqlite the same indexes are compiled once into a
+SQLite file next to the CSV and every process only opens it: lookups are
+primary-key reads on (scope, normalized key) tables, memory-mapped so
+workers share the file's pages through the OS page cache. A small hot-row
+cache (TinyLFU, see services.translation_cache) sits in front of the file
+so the phrases a class repeats never touch SQLite.
+
+The store is compiled from the in-memory engine's finished indexes, so both
+engines give the same answers. Paraphrase lookups use an FTS5 trigram table
+to fetch a few candidate phrases, which are then scored exactly as
+services.phrase_similarity does; autocomplete reads key ranges of the
+indexed entries table. Runtime additions stay in memory on top of the file
+(see StoreMap.copy()) and are replayed from the journal on start.
+
+Build the store before starting the server, from backend/:
+    python -m services.sqlite_store build
+    python -m services.sqlite_store check
+A service that starts without a fresh store compiles it first, synchronously
+in a child process (so the server never holds the in-memory build) - which
+delays the first request by the whole compile. That is allowed only where
+TRANSLATION_SQLITE_COMPILE=1, the default outside FLASK_ENV=production; in
+production the service fails to start with StoreNotBuilt instead. When a CSV
+changes while running, the reload recompiles the store in the background.
+"""
+
+import argparse
+import json
+import math
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from collections.abc import Mapping
+from datetime import datetime, timezone
+
+from services.phrase_similarity import analyze, ngram_counts
+from services.translation_cache import TranslationCache
+from services.translation_indexes import LazyIndex, TranslationIndexes
+from services.translation_snapshot import _is_fresh, fingerprint
+
+# Bump whenever the schema or the meaning of a stored value changes
+STORE_VERSION = 1
+
+# Decoded rows kept in memory in front of the file
+HOT_ROWS = int(os.getenv('TRANSLATION_SQLITE_HOT_ROWS', '4096'))
+
+# Bytes of the file each process maps; mapped pages are shared between workers
+MMAP_BYTES = int(os.getenv('TRANSLATION_SQLITE_MMAP', str(1 << 30)))
+
+# Phrases fetched from the FTS5 table per query before exact scoring
+SIMILAR_CANDIDATES = 32
+
+# Rarest query trigrams searched for; common ones ("the") match most phrases and decide nothing
+SEARCH_GRAMS = 12
+
+_BACKEND_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE entries (lang TEXT, key TEXT, value TEXT, occurrences INTEGER, position INTEGER,
+                      PRIMARY KEY (lang, key)) WITHOUT ROWID;
+CREATE TABLE exact (source TEXT, target TEXT, key TEXT, value TEXT, pivot TEXT, position INTEGER,
+                    PRIMARY KEY (source, target, key)) WITHOUT ROWID;
+CREATE TABLE words (source TEXT, target TEXT, key TEXT, value TEXT, position INTEGER,
+                    PRIMARY KEY (source, target, key)) WITHOUT ROWID;
+CREATE TABLE folded (lang TEXT, key TEXT, value TEXT, position INTEGER, PRIMARY KEY (lang, key)) WITHOUT ROWID;
+CREATE TABLE tokens (key TEXT PRIMARY KEY, value TEXT, position INTEGER) WITHOUT ROWID;
+CREATE TABLE phrases (source TEXT, tokens TEXT, value TEXT, PRIMARY KEY (source, tokens)) WITHOUT ROWID;
+CREATE TABLE grams (source TEXT, gram TEXT, df INTEGER, PRIMARY KEY (source, gram)) WITHOUT ROWID;
+"""
+
+_REMOVED = object()  # A key popped from a StoreMap copy
+_MISSING = object()  # Cached "no such row"
+_KEY_SEPARATOR = '\x1f'  # Joins the database keys of an ambiguous folded key
+
+
+class StoreNotBuilt(RuntimeError):
+    """Raised when a store is missing or stale and may not be compiled on open"""
+
+
+def default_store_path(csv_path):
+    """Store lives next to the CSV it was compiled from"""
+    return os.path.splitext(csv_path)[0] + '.sqlite3'
+
+
+def _connect_read_only(path):
+    connection = sqlite3.connect(f"file:{urllib.parse.quote(path)}?mode=ro", uri=True, check_same_thread=False)
+    connection.execute(f"PRAGMA mmap_size = {MMAP_BYTES}")
+    return connection
+
+
+def _read_meta(path):
+    connection = _connect_read_only(path)
+    try:
+        return {name: json.loads(value) for name, value in connection.execute("SELECT name, value FROM meta")}
+    finally:
+        connection.close()
+
+
+def store_is_fresh(csv_paths, store_path=None):
+    """Whether the store exists in this format version and was compiled from exactly these CSVs"""
+    store_path = store_path or default_store_path(csv_paths[0])
+    if not os.path.exists(store_path) or not os.path.exists(csv_paths[0]):
+        return False
+    try:
+        metadata = _read_meta(store_path)
+    except sqlite3.Error as e:
+        print(f"[SQLITE] Error reading {store_path}: {e}")
+        return False
+    if metadata.get('version') != STORE_VERSION:
+        print(f"[SQLITE] Ignoring {store_path}: format v{metadata.get('version')}, expected v{STORE_VERSION}")
+        return False
+    return _is_fresh(metadata, csv_paths[0], csv_paths[1:])
+
+
+def open_store(csv_paths, store_path=None, hot_rows=HOT_ROWS, compile_stale=True):
+    """
+    The store for these CSVs, compiled first (in a child process, blocking) when missing or stale.
+
+    Raises: StoreNotBuilt when it is missing or stale and compile_stale is False
+    """
+    store_path = store_path or default_store_path(csv_paths[0])
+    if not store_is_fresh(csv_paths, store_path):
+        if not compile_stale:
+            raise StoreNotBuilt(f"{store_path} is missing or stale for {', '.join(csv_paths)}; build it with "
+                                f"`python -m services.sqlite_store build` (or set TRANSLATION_SQLITE_COMPILE=1 "
+                                f"to compile it on start)")
+        print(f"[SQLITE] Compiling {store_path}")
+        subprocess.run([sys.executable, '-m', 'services.sqlite_store', 'build', '--csv', *csv_paths,
+                        '--output', store_path], cwd=_BACKEND_DIR, check=True)
+    return SqliteStore(store_path, hot_rows)
+
+
+def compile_store(csv_path=None, store_path=None):
+    """Parse the CSV (or list of CSVs), build every index in memory and write them into a store"""
+    from services.translation_service import DATASET_PATH, DIRECTIONS, FOLDED_LANGUAGES, TranslationService
+
+    started = time.perf_counter()
+    service = TranslationService(csv_path=csv_path or DATASET_PATH, use_snapshot=False, engine='memory')
+    indexes = service.indexes
+    for direction in DIRECTIONS:
+        indexes.word_index[direction]
+        indexes.pivot_provenance[direction]
+        indexes.phrase_tries[direction[0]]
+    for lang in FOLDED_LANGUAGES:
+        indexes.folded_index[lang]
+    path = write_store(service, store_path or default_store_path(service.csv_path))
+    print(f"[SQLITE] Wrote {path} ({os.path.getsize(path)} bytes) in {time.perf_counter() - started:.3f}s")
+    return path
+
+
+def write_store(service, store_path):
+    """Write a memory-engine service's built indexes into a new store file (atomically replacing store_path)"""
+    from services.translation_service import DIRECTIONS, FOLDED_LANGUAGES, LANGUAGE_COLUMNS
+
+    indexes = service.indexes
+    rows = indexes.csv_rows
+    tmp_path = f"{store_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(_SCHEMA)
+        columns = [f"c{position}" for position in range(len(rows.columns))]
+        connection.execute(f"CREATE TABLE rows (row_id INTEGER PRIMARY KEY, {', '.join(columns)})")
+        connection.executemany(f"INSERT INTO rows VALUES (?, {', '.join('?' * len(columns))})",
+                               ((row_id,) + cells for row_id, cells in
+                                enumerate(zip(*(rows.column(column) for column in rows.columns)))))
+
+        for lang, entries in indexes.translation_db.items():
+            # Rows holding each key, as suggest() ranks by; runtime-only keys count once
+            occurrences = {}
+            column = LANGUAGE_COLUMNS.get(lang)
+            if column in rows.columns:
+                for value in rows.column(column):
+                    if value:
+                        key = service._normalize_text(value, lang)
+                        occurrences[key] = occurrences.get(key, 0) + 1
+            connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+                                   ((lang, key, json.dumps(entry, ensure_ascii=False), occurrences.get(key, 1),
+                                     position) for position, (key, entry) in enumerate(entries.items())))
+
+        for direction in DIRECTIONS:
+            pivots = indexes.pivot_provenance[direction]
+            connection.executemany("INSERT INTO exact VALUES (?, ?, ?, ?, ?, ?)",
+                                   (direction + (key, value, pivots.get(key), position) for position, (key, value)
+                                    in enumerate(indexes.exact_index[direction].items())))
+            connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?, ?)",
+                                   (direction + (key, value, position) for position, (key, value)
+                                    in enumerate(indexes.word_index[direction].items())))
+
+        for lang in FOLDED_LANGUAGES:
+            connection.executemany("INSERT INTO folded VALUES (?, ?, ?, ?)",
+                                   ((lang, folded, _KEY_SEPARATOR.join(keys) if isinstance(keys, tuple) else keys,
+                                     position) for position, (folded, keys)
+                                    in enumerate(indexes.folded_index[lang].items())))
+
+        connection.executemany("INSERT INTO tokens VALUES (?, ?, ?)",
+                               ((token, json.dumps(counts), position) for position, (token, counts)
+                                in enumerate(indexes.token_index.items())))
+
+        phrase_meta = {}
+        for source_lang in LANGUAGE_COLUMNS:
+            trie = indexes.phrase_tries[source_lang]
+            connection.executemany("INSERT INTO phrases VALUES (?, ?, ?)",
+                                   ((source_lang, ' '.join(tokens), json.dumps(translations, ensure_ascii=False))
+                                    for tokens, translations in _trie_phrases(trie.root, trie._VALUE)))
+            phrase_meta[source_lang] = {'depth': trie.depth, 'size': len(trie)}
+
+        similarity_meta = {}
+        for source_lang in LANGUAGE_COLUMNS:
+            similarity_meta[source_lang] = _write_phrase_search(
+                connection, source_lang, indexes.translation_db.get(source_lang, {}))
+
+        metadata = {
+            'version': STORE_VERSION,
+            'source': fingerprint(service.csv_path) if os.path.exists(service.csv_path) else {},
+            'extra_sources': [dict(fingerprint(path), path=os.path.abspath(path)) for path in service.csv_paths[1:]],
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'columns': list(rows.columns),
+            'rows': len(rows),
+            'phrases': phrase_meta,
+            'similarity': similarity_meta,
+            'load_report': service.load_report
+        }
+        connection.executemany("INSERT INTO meta VALUES (?, ?)",
+                               ((name, json.dumps(value, ensure_ascii=False)) for name, value in metadata.items()))
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    # Readers never see a partial store; open connections keep reading the file they opened
+    os.replace(tmp_path, store_path)
+    return store_path
+
+
+def _trie_phrases(node, value_key, tokens=()):
+    """(tokens, {target: translation}) for every phrase stored in a PhraseTrie subtree"""
+    for token, child in node.items():
+        if token == value_key:
+            yield tokens, child
+        else:
+            yield from _trie_phrases(child, value_key, tokens + (token,))
+
+
+def _write_phrase_search(connection, source_lang, entries):
+    """
+    FTS5 trigram table of one language's multi-word keys, plus the document frequencies
+    PhraseSimilarityIndex would compute over them. Returns {'phrases': count}.
+    """
+    table = f"phrase_search_{source_lang}"
+    connection.execute(f"CREATE VIRTUAL TABLE {table} USING fts5(text, key UNINDEXED, norm UNINDEXED, "
+                       f"tokenize = 'trigram')")
+    phrases = []
+    seen = set()
+    for key in entries:
+        if len(key.split()) < 2:
+            continue
+        text = analyze(key)
+        if text and text not in seen:
+            seen.add(text)
+            phrases.append((key, text, ngram_counts(text)))
+    document_frequency = {}
+    for _, _, counts in phrases:
+        for gram in counts:
+            document_frequency[gram] = document_frequency.get(gram, 0) + 1
+    idf = _idf_function(len(phrases))
+    rows = []
+    for row, (key, text, counts) in enumerate(phrases):
+        norm = math.sqrt(sum((count * idf(document_frequency[gram])) ** 2 for gram, count in counts.items()))
+        rows.append((row, f" {text} ", key, norm))
+    connection.executemany(f"INSERT INTO {table} (rowid, text, key, norm) VALUES (?, ?, ?, ?)", rows)
+    connection.executemany("INSERT INTO grams VALUES (?, ?, ?)",
+                           ((source_lang, gram, count) for gram, count in document_frequency.items()))
+    return {'phrases': len(phrases)}
+
+
+def _idf_function(total):
+    # Same smoothing as PhraseSimilarityIndex; df=0 gives its weight for trigrams no phrase has
+    return lambda count: math.log((1 + total) / (1 + count)) + 1
+
+
+class SqliteStore:
+    """An opened store file: read-only views over its tables, sharing one hot-row cache"""
+
+    def __init__(self, path, hot_rows=HOT_ROWS):
+        self.path = path
+        self.metadata = _read_meta(path)
+        self.hot_rows = TranslationCache(hot_rows)
+        self._local = threading.local()
+
+    def reset_after_fork(self):
+        """Fresh cache and connections in a forked worker (the parent's may be mid-use)"""
+        self.hot_rows = TranslationCache(self.hot_rows.capacity)
+        self._local = threading.local()
+
+    def connection(self):
+        """This thread's connection; sqlite3 connections are not shared between threads or processes"""
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.connection = _connect_read_only(self.path)
+            local.pid = os.getpid()
+        return local.connection
+
+    def lookup(self, sql, params, decode=None):
+        """First column of the first row of a query (decoded), or _MISSING; served from the hot rows when cached"""
+        cache_key = (sql, params)
+        value = self.hot_rows.get(cache_key)
+        if value is None:
+            row = self.connection().execute(sql, params).fetchone()
+            value = _MISSING if row is None else (decode(row[0]) if decode and row[0] is not None else row[0])
+            self.hot_rows.put(cache_key, value)
+        return value
+
+    def indexes(self, service):
+        """A TranslationIndexes generation whose indexes read this store"""
+        from services.translation_service import DIRECTIONS, FOLDED_LANGUAGES, LANGUAGE_COLUMNS
+
+        lock = threading.RLock()
+        translation_db = {lang: StoreMap(self, 'entries', (('lang', lang),), decode=json.loads)
+                          for lang in LANGUAGE_COLUMNS}
+        exact_index = LazyIndex('exact_index', DIRECTIONS, lambda direction: StoreMap(
+            self, 'exact', (('source', direction[0]), ('target', direction[1]))), lock)
+        return TranslationIndexes(
+            translation_db=translation_db,
+            csv_rows=StoreRows(self),
+            exact_index=exact_index,
+            pivot_provenance=LazyIndex('pivot_provenance', DIRECTIONS, lambda direction: StoreMap(
+                self, 'exact', (('source', direction[0]), ('target', direction[1])), value_column='pivot',
+                condition='pivot IS NOT NULL'), lock),
+            word_index=LazyIndex('word_index', DIRECTIONS, self.word_builder(service, exact_index, translation_db),
+                                 lock),
+            token_index=StoreMap(self, 'tokens', (), decode=json.loads),
+            phrase_tries=LazyIndex('phrase_tries', LANGUAGE_COLUMNS,
+                                   lambda source_lang: StorePhrases(self, source_lang), lock),
+            folded_index=LazyIndex('folded_index', FOLDED_LANGUAGES, self.folded_builder(service, translation_db),
+                                   lock)
+        )
+
+    def word_builder(self, service, exact_index, translation_db):
+        """Word maps of the store, with runtime-added single words applied as _build_word_direction() would"""
+        def build(direction):
+            source_lang, target_lang = direction
+            words = StoreMap(self, 'words', (('source', source_lang), ('target', target_lang)))
+            entries = translation_db.get(source_lang, {})
+            for key, entry in getattr(entries, 'changes', {}).items():
+                if entry is _REMOVED or len(key.split()) != 1 or key in exact_index[direction]:
+                    continue
+                value = entry.get(target_lang)
+                if value and value.strip():
+                    words[key] = value
+                else:
+                    words.pop(key, None)
+            return words
+        return build
+
+    def folded_builder(self, service, translation_db):
+        """Folded maps of the store, with runtime-added keys folded in as _build_folded_index() would"""
+        def build(lang):
+            folded_index = StoreMap(self, 'folded', (('lang', lang),), decode=_decode_folded)
+            entries = translation_db.get(lang, {})
+            for key in getattr(entries, 'added_keys', lambda: ())():
+                service._add_folded(folded_index, key, lang)
+            return folded_index
+        return build
+
+    def prefix_index(self, lang):
+        return StorePrefixIndex(self, lang)
+
+    def similarity_index(self, lang):
+        return StorePhraseSearch(self, lang)
+
+    def memory_bytes(self):
+        """Approximate bytes held by the hot rows"""
+        from services.translation_service import _deep_sizeof
+
+        with self.hot_rows._lock:
+            cached = list(self.hot_rows._entries.items())
+        return _deep_sizeof(cached)
+
+    def stats(self):
+        return {
+            "engine": "sqlite",
+            "path": self.path,
+            "bytes": os.path.getsize(self.path) if os.path.exists(self.path) else None,
+            "created_at": self.metadata.get('created_at'),
+            "hot_rows": self.hot_rows.stats()
+        }
+
+
+def _decode_folded(value):
+    keys = value.split(_KEY_SEPARATOR)
+    return tuple(keys) if len(keys) > 1 else value
+
+
+class StoreMap(Mapping):
+    """
+    {key: value} over one slice of a store table (e.g. the english->bodo exact entries).
+
+    Lookups go through the store's hot rows. The file is never written: copy() returns a
+    map whose assignments and pops are kept in memory on top of it, which is how runtime
+    additions are applied copy-on-write, just as to the plain dicts of the memory engine.
+    """
+
+    def __init__(self, store, table, scope, value_column='value', decode=None, condition=None, changes=None):
+        self.store = store
+        self.table = table
+        self.scope = tuple(scope)
+        self.value_column = value_column
+        self.decode = decode
+        self.condition = condition
+        self.changes = dict(changes or {})
+        where = ' AND '.join([f"{column} = ?" for column, _ in self.scope] + ([condition] if condition else [])) or '1'
+        self._params = tuple(value for _, value in self.scope)
+        self._get_sql = f"SELECT {value_column} FROM {table} WHERE {where} AND key = ?"
+        self._items_sql = f"SELECT key, {value_column} FROM {table} WHERE {where} ORDER BY position"
+        self._count_sql = f"SELECT COUNT(*) FROM {table} WHERE {where}"
+
+    def _stored(self, key):
+        return self.store.lookup(self._get_sql, self._params + (key,), self.decode)
+
+    def get(self, key, default=None):
+        value = self.changes.get(key, _MISSING) if self.changes else _MISSING
+        if value is _MISSING:
+            value = self._stored(key)
+        return default if value is _MISSING or value is _REMOVED else value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def items(self):
+        for key, value in self.store.connection().execute(self._items_sql, self._params):
+            if key in self.changes:
+                continue
+            yield key, self.decode(value) if self.decode and value is not None else value
+        for key, value in self.changes.items():
+            if value is not _REMOVED:
+                yield key, value
+
+    def values(self):
+        return (value for _, value in self.items())
+
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    def __len__(self):
+        count = self.store.connection().execute(self._count_sql, self._params).fetchone()[0]
+        for key, value in self.changes.items():
+            stored = self._stored(key) is not _MISSING
+            count += (value is not _REMOVED) - stored
+        return count
+
+    def added_keys(self):
+        """Keys set on this map that the file does not have"""
+        return [key for key, value in self.changes.items() if value is not _REMOVED and self._stored(key) is _MISSING]
+
+    def copy(self):
+        return StoreMap(self.store, self.table, self.scope, self.value_column, self.decode, self.condition,
+                        self.changes)
+
+    def __setitem__(self, key, value):
+        self.changes[key] = value
+
+    def pop(self, key, default=None):
+        value = self.get(key, default)
+        self.changes[key] = _REMOVED
+        return value
+
+
+class StorePhrases:
+    """PhraseTrie's lookup interface over one source language's phrases in a store"""
+
+    def __init__(self, store, source_lang):
+        self.store = store
+        self.source_lang = source_lang
+        phrases = store.metadata['phrases'].get(source_lang, {})
+        self.depth = phrases.get('depth', 0)
+        self.size = phrases.get('size', 0)
+
+    def longest_matches(self, tokens, start=0):
+        """
+        Same result as PhraseTrie.longest_matches(): every span of at least two tokens that
+        could be a phrase is looked up in one indexed query.
+        """
+        span = tuple(tokens[start:start + self.depth])
+        if len(span) < 2:
+            return {}
+        cache_key = ('phrases', self.source_lang, span)
+        matches = self.store.hot_rows.get(cache_key)
+        if matches is None:
+            candidates = [' '.join(span[:length]) for length in range(2, len(span) + 1)]
+            found = dict(self.store.connection().execute(
+                f"SELECT tokens, value FROM phrases WHERE source = ? AND tokens IN ({', '.join('?' * len(candidates))})",
+                (self.source_lang, *candidates)))
+            matches = {}
+            for length, candidate in enumerate(candidates, start=2):
+                if candidate in found:
+                    for target_lang, value in json.loads(found[candidate]).items():
+                        matches[target_lang] = (length, value)
+            self.store.hot_rows.put(cache_key, matches)
+        return matches
+
+    def __len__(self):
+        return self.size
+
+
+class StorePrefixIndex:
+    """PrefixIndex's interface over a store: a range read of the entries table's (lang, key) index"""
+
+    def __init__(self, store, lang):
+        self.store = store
+        self.lang = lang
+
+    def top(self, prefix, k):
+        cache_key = ('prefix', self.lang, prefix, k)
+        phrases = self.store.hot_rows.get(cache_key)
+        if phrases is None:
+            phrases = [key for key, in self.store.connection().execute(
+                "SELECT key FROM entries WHERE lang = ? AND key >= ? AND key < ? "
+                "ORDER BY occurrences DESC, length(key), key LIMIT ?",
+                (self.lang, prefix, prefix + '\U0010ffff', k))]
+            self.store.hot_rows.put(cache_key, phrases)
+        return phrases
+
+    def __len__(self):
+        return self.store.connection().execute("SELECT COUNT(*) FROM entries WHERE lang = ?", (self.lang,)).fetchone()[0]
+
+
+class StorePhraseSearch:
+    """
+    PhraseSimilarityIndex's top_k() over a store.
+
+    The FTS5 trigram table returns the SIMILAR_CANDIDATES phrases best matching the query's
+    SEARCH_GRAMS rarest trigrams; only those are scored, with the same TF-IDF cosine and tie
+    order as PhraseSimilarityIndex. A phrase close enough to be used shares most of the
+    query's trigrams, so it is found alike; weaker runners-up can differ.
+    """
+
+    def __init__(self, store, lang):
+        self.store = store
+        self.lang = lang
+        self.size = store.metadata['similarity'].get(lang, {}).get('phrases', 0)
+        self._idf = _idf_function(self.size)
+
+    def __len__(self):
+        return self.size
+
+    def top_k(self, queries, k=5):
+        return [self._top_k(query, k) for query in queries]
+
+    def _top_k(self, query, k):
+        counts = ngram_counts(analyze(query))
+        if not self.size or not counts:
+            return []
+        connection = self.store.connection()
+        grams = list(counts)
+        document_frequency = dict(connection.execute(
+            f"SELECT gram, df FROM grams WHERE source = ? AND gram IN ({', '.join('?' * len(grams))})",
+            (self.lang, *grams)))
+        weights = {gram: count * self._idf(document_frequency.get(gram, 0)) for gram, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        known = [gram for gram in grams if gram in document_frequency]
+        if not norm or not known:
+            return []
+        searched = sorted(known, key=lambda gram: document_frequency[gram])[:SEARCH_GRAMS]
+        match = ' OR '.join('"' + gram.replace('"', '""') + '"' for gram in searched)
+        # A shared trigram adds (query weight) x (phrase count x idf) / both norms
+        factors = {gram: weights[gram] / norm * self._idf(document_frequency[gram]) for gram in known}
+        scored = []
+        for row, key, text, phrase_norm in connection.execute(
+                f"SELECT rowid, key, text, norm FROM phrase_search_{self.lang} WHERE phrase_search_{self.lang} "
+                f"MATCH ? ORDER BY rank LIMIT ?", (match, SIMILAR_CANDIDATES)):
+            phrase_counts = ngram_counts(text[1:-1])
+            score = sum(factor * phrase_counts[gram] for gram, factor in factors.items() if gram in phrase_counts)
+            scored.append((-score / phrase_norm, row, key))
+        scored.sort()
+        return [(key, -score) for score, _, key in scored[:k]]
+
+
+class StoreRows:
+    """RowStore's read interface over the store's copy of the dataset rows"""
+
+    strings = ()
+
+    def __init__(self, store):
+        self.store = store
+        self.columns = tuple(store.metadata['columns'])
+        self._sql_columns = {column: f"c{position}" for position, column in enumerate(self.columns)}
+
+    def __len__(self):
+        return self.store.metadata['rows']
+
+    def column(self, column):
+        sql_column = self._sql_columns.get(column)
+        if sql_column is None:
+            return
+        for value, in self.store.connection().execute(f"SELECT {sql_column} FROM rows ORDER BY row_id"):
+            yield value
+
+    def value(self, row_id, column):
+        sql_column = self._sql_columns.get(column)
+        if sql_column is None:
+            return ''
+        row = self.store.connection().execute(f"SELECT {sql_column} FROM rows WHERE row_id = ?", (row_id,)).fetchone()
+        return row[0] if row else ''
+
+    def __getitem__(self, row_id):
+        row = self.store.connection().execute("SELECT * FROM rows WHERE row_id = ?", (row_id,)).fetchone()
+        if row is None:
+            raise IndexError(row_id)
+        return dict(zip(self.columns, row[1:]))
+
+    def intern(self, value):
+        return value
+
+    def freeze(self):
+        pass
+
+    def memory_bytes(self):
+        return 0
+
+
+def main(argv=None):
+    from services.translation_service import DATASET_PATH
+
+    parser = argparse.ArgumentParser(description="Compile the translation dataset into a SQLite store")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--csv", nargs='+', default=[DATASET_PATH], help="source dataset CSV(s), in precedence order")
+    parser.add_argument("--output", default=None, help="store path (default: next to the CSV)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        compile_store(args.csv, args.output)
+        return 0
+
+    fresh = store_is_fresh(args.csv, args.output)
+    print(f"[SQLITE] {'up to date' if fresh else 'missing or stale'}")
+    return 0 if fresh else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import threading
+from array import array
+from collections import OrderedDict
+
+
+class FrequencySketch:
+    """
+    Approximate access counts in fixed memory (count-min sketch, 4-bit counters).
+
+    Counters are halved every `sample_size` increments so popularity decays and a
+    phrase that was hot an hour ago does not stay privileged forever.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, width, sample_size):
+        self.width = max(16, width)
+        self.sample_size = max(1, sample_size)
+        self.table = array('B', bytes(self.width * self._DEPTH))
+        self.additions = 0
+
+    def _slots(self, key):
+        key_hash = hash(key)
+        for row in range(self._DEPTH):
+            # Cheap per-row rehash; good enough to decorrelate the rows
+            yield row * self.width + (hash((key_hash, row)) % self.width)
+
+    def increment(self, key):
+        for slot in self._slots(key):
+            if self.table[slot] < self._MAX_COUNT:
+                self.table[slot] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key):
+        return min(self.table[slot] for slot in self._slots(key))
+
+    def _age(self):
+        for slot in range(len(self.table)):
+            self.table[slot] >>= 1
+        self.additions //= 2
+
+    def clear(self):
+        self.table = array('B', bytes(self.width * self._DEPTH))
+        self.additions = 0
+
+
+class TranslationCache:
+    """
+    Bounded LRU cache of translation results with TinyLFU admission.
+
+    Every lookup is recorded in a frequency sketch. When the cache is full a new
+    result only replaces the least recently used entry if it has been requested
+    more often, so a stream of one-off sentences cannot flush the handful of
+    instructions a teacher repeats all lesson.
+    """
+
+    def __init__(self, capacity=2048):
+        self.capacity = max(0, capacity)
+        self._entries = OrderedDict()
+        self._sketch = FrequencySketch(width=self.capacity * 4, sample_size=self.capacity * 10)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Cached value for key, or None on a miss"""
+        if not self.capacity:
+            return None
+        with self._lock:
+            self._sketch.increment(key)
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store value unless the cache is full of entries used more often than key"""
+        if not self.capacity or value is None:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                return
+            if len(self._entries) >= self.capacity:
+                victim = next(iter(self._entries))
+                if self._sketch.frequency(key) <= self._sketch.frequency(victim):
+                    self.rejections += 1
+                    return
+                del self._entries[victim]
+                self.evictions += 1
+            self._entries[key] = value
+
+    def clear(self):
+        """Drop every entry and frequency; used when the underlying data changes"""
+        with self._lock:
+            self._entries.clear()
+            self._sketch.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "capacity": self.capacity,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "rejections": self.rejections,
+                "invalidations": self.invalidations
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,137 @@
+import itertools
+import time
+from collections.abc import Mapping
+
+# Everything built from the dataset; this is what a compiled snapshot stores
+INDEX_ATTRIBUTES = ('translation_db', 'csv_rows', 'exact_index', 'pivot_provenance', 'word_index', 'token_index',
+                    'phrase_tries', 'folded_index')
+
+_generations = itertools.count(1)
+
+
+class TranslationIndexes:
+    """
+    One immutable generation of the lookup indexes.
+
+    TranslationService publishes the current generation as a single attribute.
+    Readers take that reference once per request and use only it, so they never
+    lock and never see a half-applied change; writers build the next generation
+    with replace() - copying only the dicts they modify - and swap it in.
+    Nothing reachable from a published generation may be mutated afterwards.
+
+    exact_index, pivot_provenance, word_index, phrase_tries and folded_index are
+    LazyIndex maps, so a direction nobody translates in is never built.
+    """
+
+    __slots__ = INDEX_ATTRIBUTES + ('generation', 'fuzzy_indexes', 'similarity_indexes', 'suggest_indexes',
+                                    'dataset_version')
+
+    def __init__(self, translation_db, csv_rows, exact_index, word_index, token_index, phrase_tries,
+                 pivot_provenance=None, folded_index=None, fuzzy_indexes=None, similarity_indexes=None,
+                 suggest_indexes=None, dataset_version=None):
+        self.translation_db = translation_db
+        self.csv_rows = csv_rows
+        self.exact_index = exact_index
+        # {(source, target): {key: pivot language}} for exact_index entries filled by pivoting
+        self.pivot_provenance = pivot_provenance or {}
+        self.word_index = word_index
+        self.token_index = token_index
+        self.phrase_tries = phrase_tries
+        # {language: {diacritic-free key: database key, or tuple of keys in row order}}
+        self.folded_index = folded_index or {}
+        # Typo indexes derived from this generation, filled in lazily per source language
+        self.fuzzy_indexes = dict(fuzzy_indexes or {})
+        # Nearest-phrase (TF-IDF) indexes over the database's phrases, likewise per source language
+        self.similarity_indexes = dict(similarity_indexes or {})
+        # Sorted prefix indexes over the database's keys for autocomplete, likewise per source language
+        self.suggest_indexes = dict(suggest_indexes or {})
+        self.dataset_version = dataset_version  # Content hash of the CSV these indexes came from
+        self.generation = next(_generations)
+
+    def replace(self, **changes):
+        """New generation sharing every index not given in changes"""
+        fields = {name: getattr(self, name) for name in INDEX_ATTRIBUTES}
+        fields['fuzzy_indexes'] = self.fuzzy_indexes
+        fields['similarity_indexes'] = self.similarity_indexes
+        fields['suggest_indexes'] = self.suggest_indexes
+        fields['dataset_version'] = self.dataset_version
+        fields.update(changes)
+        return TranslationIndexes(**fields)
+
+    def export(self):
+        """{index name: index} for writing a compiled snapshot"""
+        return {name: getattr(self, name) for name in INDEX_ATTRIBUTES}
+
+
+class LazyIndex(Mapping):
+    """
+    {key: index} where each value is built the first time it is read, then memoized.
+
+    Keys (translation directions or source languages) are fixed up front, so
+    iterating them or testing membership builds nothing; reading a value builds
+    only that one. Builds are serialized on a lock shared by every lazy index
+    over the same rows (they intern into one RowStore). A built value is never
+    changed afterwards, so generations stay immutable to readers. Pickling
+    stores a plain dict of the values built so far.
+    """
+
+    __slots__ = ('name', '_keys', '_build', '_lock', '_built', 'build_seconds')
+
+    def __init__(self, name, keys, build, lock, built=None, build_seconds=None):
+        self.name = name
+        self._keys = tuple(keys)
+        self._build = build
+        self._lock = lock
+        self._built = dict(built or {})
+        self.build_seconds = dict(build_seconds or {})  # {key: seconds its build took}
+
+    def __getitem__(self, key):
+        value = self._built.get(key)
+        if value is not None:
+            return value
+        if key not in self._keys:
+            raise KeyError(key)
+        with self._lock:
+            value = self._built.get(key)
+            if value is None:
+                started = time.perf_counter()
+                value = self._build(key)
+                self.build_seconds[key] = round(time.perf_counter() - started, 4)
+                self._built[key] = value
+                print(f"[INDEX] Built {self.name} {key_label(key)} in {self.build_seconds[key] * 1000:.1f}ms")
+        return value
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def prime(self, key, value):
+        """Record a value computed while building another index; the caller holds the build lock"""
+        self._built.setdefault(key, value)
+
+    def built(self):
+        """{key: value} for the keys built so far, without building any others"""
+        return dict(self._built)
+
+    def pending(self):
+        """Keys not built yet"""
+        return [key for key in self._keys if key not in self._built]
+
+    def derive(self, build, built):
+        """Same keys and lock with another builder, starting from the given built values"""
+        return LazyIndex(self.name, self._keys, build, self._lock, built,
+                         {key: seconds for key, seconds in self.build_seconds.items() if key in built})
+
+    def __reduce__(self):
+        # Snapshots keep what has been built; the rest is built lazily again after loading
+        return dict, (self.built(),)
+
+
+def key_label(key):
+    """'english->bodo' for a direction, the language itself for a per-language index"""
+    return '->'.join(key) if isinstance(key, tuple) else key
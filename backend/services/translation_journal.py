@@ -0,0 +1,266 @@
+"""
+Append-only journal of translations added at runtime.
+
+add_translation() writes each entry here before applying it, so additions
+survive restarts and reach every worker process: a service replays the
+journal on top of the base dataset when it loads, then tails the file for
+entries appended by other processes. Compaction folds the journal into the
+compiled snapshot and records how far it got, so a cold start only replays
+what was appended since.
+
+After that snapshot is written, the journal is rotated so it stays bounded:
+it is rewritten with one entry per (source, target, text) - the latest - and
+whatever was appended after the snapshot's offset, under a new id. Replaying
+a rotated journal from its start gives the same translations as replaying
+every line ever appended, and the header records where the old journal was
+cut, so readers of the old one (processes, snapshots) continue at the same
+point of the new one.
+
+Format: one JSON object per line. The first line is a header carrying the
+journal's id (and, once rotated, the id and offset it continues from); a
+snapshot compacted from an unrelated journal is not reused.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends still work, but the journal is never rotated
+    fcntl = None
+
+# Entries applied per batch when reading the journal back
+READ_BATCH = 1000
+
+
+def default_journal_path(csv_path):
+    """Journal lives next to the CSV it extends"""
+    return os.path.splitext(csv_path)[0] + '.journal'
+
+
+class TranslationJournal:
+    """Reader/appender for one journal file; safe to share between threads"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _exclusive(self):
+        """Only this thread, in this process, appends to or rotates the journal meanwhile"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.path + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def append(self, entry):
+        """Durably append one entry (flushed and fsynced before returning)"""
+        line = json.dumps(dict(entry, added_at=datetime.utcnow().isoformat()), ensure_ascii=False) + '\n'
+        with self._exclusive():
+            self._ensure_header()
+            # O_APPEND keeps each single write whole even with other processes appending
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _ensure_header(self):
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            return
+        header = json.dumps({'journal': uuid.uuid4().hex, 'created_at': datetime.utcnow().isoformat()}) + '\n'
+        # Create-or-fail so two processes starting a journal can't both write a header
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(header)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def header(self):
+        """The header record ({} if the journal doesn't exist yet)"""
+        try:
+            with open(self.path, 'rb') as f:
+                return _parse_header(f.readline())
+        except OSError:
+            return {}
+
+    def read_id(self):
+        """Id from the header line, or None if the journal doesn't exist yet"""
+        return self.header().get('journal')
+
+    def read(self, journal_id, offset):
+        """
+        Stream the entries appended after byte offset of journal `journal_id`.
+
+        If the journal has been rotated since, reading continues at the same point of the
+        rotated one (see _continue_at()); journal_id None reads it from the start. A trailing
+        line still being written by another process is left for the next read.
+        Yields: (entries, journal id, offset after them), at most READ_BATCH entries at a time
+        """
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            header_line = f.readline()
+            header = _parse_header(header_line)
+            current = header.get('journal')
+            if current is None:
+                return
+            if current != journal_id:
+                offset = _continue_at(f, header_line, header, journal_id, offset)
+                if offset is None:
+                    if journal_id is not None:
+                        print(f"[JOURNAL] {self.path} is not a continuation of {journal_id}; replaying it from the start")
+                    offset = len(header_line)
+            elif offset > os.fstat(f.fileno()).st_size:
+                print(f"[JOURNAL] {self.path} shrank; replaying it from the start")
+                offset = len(header_line)
+            else:
+                offset = max(offset, len(header_line))
+            f.seek(offset)
+
+            entries = []
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line.decode('utf-8')))
+                except ValueError as e:
+                    print(f"[JOURNAL] Skipping unreadable line in {self.path}: {e}")
+                    continue
+                if len(entries) >= READ_BATCH:
+                    yield entries, current, offset
+                    entries = []
+            if entries or current != journal_id:
+                yield entries, current, offset
+
+    def resume(self, journal_id, offset):
+        """
+        Where to continue reading for a state that has applied journal_id up to offset.
+
+        Returns: (current journal id, byte offset in it), or None when it does not continue journal_id
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                header_line = f.readline()
+                header = _parse_header(header_line)
+                if header.get('journal') == journal_id:
+                    return journal_id, offset
+                position = _continue_at(f, header_line, header, journal_id, offset)
+                return (header['journal'], position) if position is not None else None
+        except OSError:
+            return None
+
+    def rotate(self, journal_id, offset):
+        """
+        Rewrite the journal as its latest entry per (source, target, text) up to offset, then the rest.
+
+        Call it only once a snapshot holding journal_id up to offset is durably written.
+        Returns: the new journal id, or None if the journal is no longer journal_id (another
+        process rotated it first) or cannot be rotated here
+        """
+        if fcntl is None:
+            return None
+        with self._exclusive():
+            try:
+                f = open(self.path, 'rb')
+            except FileNotFoundError:
+                return None
+            with f:
+                header_line = f.readline()
+                if _parse_header(header_line).get('journal') != journal_id:
+                    return None
+                latest = {}  # Keeps each key where it first appeared, with its last entry
+                position = len(header_line)
+                while position < offset:
+                    line = f.readline()
+                    if not line:
+                        break
+                    position += len(line)
+                    try:
+                        entry = json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        continue
+                    latest[(entry['source_lang'], entry['target_lang'], entry['text'])] = entry
+
+                new_id = uuid.uuid4().hex
+                header = {'journal': new_id, 'created_at': datetime.utcnow().isoformat(),
+                          'continues': journal_id, 'from_offset': offset, 'compacted_entries': len(latest)}
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as out:
+                    out.write(json.dumps(header).encode('utf-8') + b'\n')
+                    for entry in latest.values():
+                        out.write(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n')
+                    # Appends made after the snapshot was taken carry over unchanged
+                    f.seek(position)
+                    shutil.copyfileobj(f, out)
+                    out.flush()
+                    os.fsync(out.fileno())
+            os.replace(tmp_path, self.path)
+            _fsync_directory(self.path)
+        print(f"[JOURNAL] Rotated {self.path}: {position} bytes compacted into {len(latest)} entries")
+        return new_id
+
+
+def _continue_at(f, header_line, header, journal_id, offset):
+    """
+    Offset in a rotated journal (f, read up to its header) matching offset in the journal_id it
+    continues: past the compacted entries by however far offset is past the rotation point,
+    since that tail was copied unchanged. A state from before the rotation point replays the
+    journal from its start, which is always correct. None if f does not continue journal_id.
+    """
+    if journal_id is None or header.get('continues') != journal_id:
+        return None
+    if offset < header['from_offset']:
+        return len(header_line)
+    position = len(header_line)
+    for _ in range(header['compacted_entries']):
+        position += len(f.readline())
+    return position + offset - header['from_offset']
+
+
+def _parse_header(line):
+    if not line.endswith(b'\n'):
+        return {}  # Missing, or still being written
+    try:
+        record = json.loads(line.decode('utf-8'))
+    except ValueError:
+        return {}
+    return record if isinstance(record, dict) and 'journal' in record else {}
+
+
+def _fsync_directory(path):
+    """Make a rename in path's directory durable (a no-op where directories can't be opened)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
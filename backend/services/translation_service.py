@@ -1,13 +1,327 @@
-import json
+import hashlib
 import os
-import csv
-import re
 import string
+import sys
+import threading
+import time
+import unicodedata
+from datetime import datetime
+
+from services.dataset_ingest import ingest_datasets
+from services.dataset_reload import rebuild_indexes
+from services.fuzzy_index import FuzzyWordIndex
+from services.phrase_similarity import PhraseSimilarityIndex
+from services.phrase_suggest import PhraseUsage, PrefixIndex, normalize_prefix
+from services.phrase_trie import PhraseTrie
+from services.sqlite_store import open_store
+from services.translation_cache import TranslationCache
+from services.translation_indexes import INDEX_ATTRIBUTES, LazyIndex, TranslationIndexes, key_label
+from services.translation_journal import TranslationJournal, default_journal_path
+from services.translation_snapshot import fingerprint, load_snapshot, write_snapshot
+from services.transliteration import latin_key
+
+# Dataset column holding each supported language
+LANGUAGE_COLUMNS = {'english': 'English', 'bodo': 'Bodo', 'mizo': 'Mizo'}
+
+# Every (source, target) pair; per-direction indexes are built on first use
+DIRECTIONS = tuple((source_lang, target_lang) for source_lang in LANGUAGE_COLUMNS
+                   for target_lang in LANGUAGE_COLUMNS if source_lang != target_lang)
+
+# Indexes built lazily per direction (per source language for phrase tries and folded keys)
+LAZY_INDEXES = ('exact_index', 'pivot_provenance', 'word_index', 'phrase_tries', 'folded_index')
+
+# Languages whose keys are also indexed by a looser spelling: Mizo without its diacritics ("ṭha"
+# typed as "tha") and Bodo romanized ("nwng" for "नों"), see _fold_text()
+FOLDED_LANGUAGES = ('mizo', 'bodo')
+
+# Languages whose tokens vote in detection. Bodo is written in Devanagari; its Latin cells are mostly
+# borrowed English, so Latin text reaches Bodo only through its romanized keys (see _detect_folded())
+LATIN_LANGUAGES = ('english', 'mizo')
+
+# Token votes by which another language must beat English in detection: Mizo cells keep many English
+# words ("board", "phone", "a", "in"), so a word both languages share is taken as English
+DETECT_ENGLISH_MARGIN = 0.5
+
+# Ambiguous folded keys listed individually in the status; the rest are only counted
+MAX_REPORTED_AMBIGUOUS = 20
+
+DATASET_COLUMNS = ('ID', 'English', 'Bodo', 'Mizo', 'Category')
+
+DATASET_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'classroom_dataset_complete.csv'))
+
+# Edits tolerated when correcting a misspelled word of 8+ characters; shorter ones allow 1 (0 turns correction off)
+FUZZY_MAX_DISTANCE = int(os.getenv('TRANSLATION_FUZZY_DISTANCE', '2'))
+
+# Cosine score at which a paraphrase is answered with its closest dataset phrase (0 turns this off)
+SIMILARITY_MIN_SCORE = float(os.getenv('TRANSLATION_SIMILARITY_MIN_SCORE', '0.8'))
+
+# Closest phrases considered per sentence; the best one translated into the target wins
+SIMILARITY_TOP_K = 5
+
+# Words a paraphrase may add or leave out without changing what is asked, per source language
+SIMILARITY_FILLER_WORDS = {
+    'english': frozenset({'a', 'an', 'the', 'please', 'kindly', 'now', 'just', 'ok', 'okay', 'so', 'and',
+                          'all', 'everyone', 'everybody', 'your', 'my', 'our', 'their'})
+}
+
+# Words that negate a sentence; a similar phrase stands in for it only if both are negated or neither is
+NEGATION_WORDS = {
+    'english': frozenset({'not', 'no', 'never', 'nothing', 'nobody', 'cannot',
+                          "don't", "doesn't", "didn't", "can't", "won't", "isn't", "aren't", "wasn't", "weren't",
+                          "shouldn't", "couldn't", "wouldn't", "mustn't", "haven't", "hasn't", "hadn't",
+                          'dont', 'doesnt', 'didnt', 'cant', 'wont', 'isnt', 'arent', 'wasnt', 'werent',
+                          'shouldnt', 'couldnt', 'wouldnt', 'mustnt', 'havent', 'hasnt', 'hadnt'}),
+    'mizo': frozenset({'lo', 'loh', 'suh'})
+}
+
+# Completions returned per keystroke by suggest()
+SUGGEST_TOP_K = 8
+
+# Journal entries applied before add_translation() folds them into the snapshot
+JOURNAL_COMPACT_EVERY = int(os.getenv('TRANSLATION_JOURNAL_COMPACT_EVERY', '200'))
+
+# Where the indexes live: 'memory' (Python dicts) or 'sqlite' (an on-disk store, see services.sqlite_store)
+TRANSLATION_ENGINE = os.getenv('TRANSLATION_ENGINE', 'memory').lower()
+ENGINES = ('memory', 'sqlite')
+
+# Whether a starting service may compile a missing or stale SQLite store itself, delaying its first
+# request by the whole compile; off by default in production, where it should be built ahead
+SQLITE_COMPILE_ON_START = os.getenv('TRANSLATION_SQLITE_COMPILE',
+                                    '0' if os.getenv('FLASK_ENV') == 'production' else '1') != '0'
 
 class TranslationService:
-    def __init__(self):
-        self.translation_db = self._load_translation_database()
-        self.csv_rows = self._load_csv_rows()  # Keep original CSV rows for bidirectional lookup
+    def __init__(self, csv_path=None, use_snapshot=True, journal_path=None, engine=None):
+        started = time.perf_counter()
+        self.engine = (engine or TRANSLATION_ENGINE).lower()
+        if self.engine not in ENGINES:
+            raise ValueError(f"Unknown translation engine {self.engine!r}; expected one of {', '.join(ENGINES)}")
+        self._lock = threading.Lock()  # Serializes writers; readers never take it
+        # One CSV or a list of them (e.g. one per subject); the first anchors the snapshot and journal
+        self.csv_paths = [csv_path] if isinstance(csv_path, str) else list(csv_path or [DATASET_PATH])
+        self.csv_path = self.csv_paths[0]
+        self.load_report = None  # Row counts, skips, duplicates and conflicts from the last CSV ingest
+        # Runtime additions are only persisted when a journal is given (the shared service uses one)
+        self.journal = TranslationJournal(journal_path) if journal_path else None
+        self._journal_id = None  # Journal (it changes when rotated) that _journal_offset is into
+        self._journal_offset = 0  # Bytes of the journal already applied
+        self._journal_uncompacted = 0
+        self._unjournaled = 0  # Runtime additions held only in memory, which other processes can't replay
+        self.store = None  # The SQLite store, when that engine is used
+        
+        indexes = None
+        if self.engine == 'memory' and use_snapshot:
+            indexes = load_snapshot(self.csv_path, extra_sources=self.csv_paths[1:])
+        position = indexes.get('journal_position') if indexes is not None else None
+        if position:
+            resumed = self.journal.resume(position['journal'], position['offset']) if self.journal else None
+            if resumed is None:
+                print("[JOURNAL] Snapshot holds runtime additions from a journal not in use here; loading the CSV instead")
+                indexes = None
+            else:
+                self._journal_id, self._journal_offset = resumed
+        if self.engine == 'sqlite':
+            self.store = open_store(self.csv_paths, compile_stale=SQLITE_COMPILE_ON_START)
+            self._indexes = self.store.indexes(self)
+            self.load_report = self.store.metadata.get('load_report')
+            self.loaded_from = 'sqlite'
+        elif indexes is not None:
+            self._install_indexes(indexes)
+            self.loaded_from = 'snapshot'
+        else:
+            csv_rows = self._load_csv_rows()  # Compact row store, shared by every index below
+            translation_db = self._load_translation_database(csv_rows)
+            # Detection needs the database and token index for any request; per-direction
+            # indexes are only built once a request uses their direction
+            self._indexes = TranslationIndexes(
+                translation_db=translation_db,
+                csv_rows=csv_rows,
+                token_index=self._build_token_index(csv_rows),
+                **self._lazy_indexes(csv_rows, translation_db)
+            )
+            self.loaded_from = 'csv'
+        self._indexes.dataset_version = self._dataset_version()
+        self.cache = TranslationCache(int(os.getenv('TRANSLATION_CACHE_SIZE', '2048')))
+        # Phrases translated in this process, per source language; they rank first in suggest()
+        self.phrase_usage = {lang: PhraseUsage() for lang in LANGUAGE_COLUMNS}
+        if self.journal is not None:
+            replayed = self.sync_journal()
+            print(f"[JOURNAL] Replayed {replayed} runtime additions from {self.journal.path}")
+        self.load_seconds = time.perf_counter() - started
+        self.loaded_at = datetime.utcnow().isoformat()
+        self._measure_memory()
+    
+    def __getattr__(self, name):
+        # service.word_index etc. read the current generation (see TranslationIndexes)
+        if name in INDEX_ATTRIBUTES:
+            return getattr(self._indexes, name)
+        raise AttributeError(name)
+    
+    @property
+    def indexes(self):
+        """The current immutable index generation; take it once and use it for a whole request"""
+        return self._indexes
+    
+    @property
+    def dataset_version(self):
+        """Short content hash of the CSV behind the current indexes"""
+        return self._indexes.dataset_version
+    
+    def _dataset_version(self):
+        hashes = [fingerprint(path)['sha256'] for path in self.csv_paths if os.path.exists(path)]
+        if not hashes:
+            return 'builtin'
+        if len(self.csv_paths) == 1:
+            return hashes[0][:12]
+        return hashlib.sha256(''.join(hashes).encode('ascii')).hexdigest()[:12]
+    
+    def export_indexes(self):
+        """All dataset-derived state, for writing a compiled snapshot"""
+        return self._indexes.export()
+    
+    def _install_indexes(self, indexes):
+        # A snapshot holds the directions built when it was written; the rest are built on use
+        self._indexes = TranslationIndexes(
+            translation_db=indexes['translation_db'],
+            csv_rows=indexes['csv_rows'],
+            token_index=indexes['token_index'],
+            **self._lazy_indexes(indexes['csv_rows'], indexes['translation_db'], built=indexes)
+        )
+    
+    def _lazy_indexes(self, rows, translation_db, built=None):
+        """
+        exact_index, pivot_provenance, word_index, phrase_tries and folded_index as LazyIndex maps over rows.
+        
+        `built` carries values already computed (from a snapshot or a reload patch); every
+        other direction is built from rows the first time a request reads it.
+        """
+        built = built or {}
+        lock = threading.RLock()  # Builds nest (words need the exact index) and intern into rows
+        pivot_provenance = LazyIndex('pivot_provenance', DIRECTIONS, lambda direction: build_provenance(direction),
+                                     lock, built.get('pivot_provenance'))
+        
+        def build_exact(direction):
+            entries = self._build_exact_direction(rows, *direction)
+            filled = self._pivot_entries(rows, direction[0], direction[1], entries)
+            pivot_lang = self._pivot_language(*direction)
+            pivot_provenance.prime(direction, {key: pivot_lang for key in filled})
+            entries.update(filled)
+            return entries
+        
+        def build_provenance(direction):
+            exact_index[direction]  # Building a direction records its pivots
+            return pivot_provenance.built()[direction]
+        
+        exact_index = LazyIndex('exact_index', DIRECTIONS, build_exact, lock, built.get('exact_index'))
+        return {
+            'exact_index': exact_index,
+            'pivot_provenance': pivot_provenance,
+            'word_index': LazyIndex('word_index', DIRECTIONS, self._word_builder(exact_index, translation_db),
+                                    lock, built.get('word_index')),
+            'phrase_tries': LazyIndex('phrase_tries', LANGUAGE_COLUMNS,
+                                      lambda source_lang: self._build_phrase_trie(source_lang, exact_index),
+                                      lock, built.get('phrase_tries')),
+            'folded_index': LazyIndex('folded_index', FOLDED_LANGUAGES, self._folded_builder(translation_db),
+                                      lock, built.get('folded_index'))
+        }
+    
+    def _word_builder(self, exact_index, translation_db):
+        if self.store is not None:
+            return self.store.word_builder(self, exact_index, translation_db)
+        return lambda direction: self._build_word_direction(exact_index[direction], translation_db, *direction)
+    
+    def _folded_builder(self, translation_db):
+        if self.store is not None:
+            return self.store.folded_builder(self, translation_db)
+        return lambda source_lang: self._build_folded_index(translation_db, source_lang)
+    
+    def warm_indexes(self, directions=None):
+        """
+        Build the lazy indexes of some directions (default: all) ahead of their first request.
+        
+        Returns: seconds spent
+        """
+        started = time.perf_counter()
+        indexes = self._indexes
+        for direction in directions or DIRECTIONS:
+            if direction not in indexes.exact_index:
+                print(f"[INDEX] Unknown direction {direction!r}; not warmed")
+                continue
+            indexes.word_index[direction]
+            indexes.phrase_tries[direction[0]]
+            if direction[0] in indexes.folded_index:
+                indexes.folded_index[direction[0]]
+            if SIMILARITY_MIN_SCORE:
+                self._similarity_index(direction[0], indexes)
+        self._freeze_rows(indexes)
+        self._measure_memory()
+        return time.perf_counter() - started
+    
+    def _freeze_rows(self, indexes):
+        # Lazy builds intern into the row store, so its lookup table stays until nothing is left to build
+        if not any(getattr(indexes, name).pending() for name in LAZY_INDEXES):
+            indexes.csv_rows.freeze()
+    
+    def get_status(self):
+        """Readiness details: when the dataset was loaded, how long it took and its memory footprint"""
+        indexes = self._indexes
+        return {
+            "ready": True,
+            "loaded_at": self.loaded_at,
+            "loaded_from": self.loaded_from,
+            "load_seconds": round(self.load_seconds, 4),
+            "index_generation": indexes.generation,
+            "dataset_version": indexes.dataset_version,
+            "memory_bytes": self._footprint['bytes'],
+            "memory_generation": self._footprint['generation'],
+            "phrases": {source: len(trie) for source, trie in indexes.phrase_tries.built().items()},
+            "lazy_indexes": {
+                name: {
+                    "build_seconds": {key_label(key): seconds
+                                      for key, seconds in getattr(indexes, name).build_seconds.items()},
+                    "pending": [key_label(key) for key in getattr(indexes, name).pending()]
+                } for name in LAZY_INDEXES
+            },
+            "csv_rows": len(indexes.csv_rows),
+            "cache": self.cache.stats(),
+            "load_report": self.load_report,
+            "storage": self.store.stats() if self.store is not None else {"engine": "memory"},
+            "fuzzy_vocabulary": {source: len(index) for source, index in indexes.fuzzy_indexes.items()},
+            "similarity_phrases": {source: len(index) for source, index in indexes.similarity_indexes.items()},
+            "suggest_phrases": {source: len(index) for source, index in indexes.suggest_indexes.items()},
+            "phrase_uses": {source: sum(usage.snapshot().values()) for source, usage in self.phrase_usage.items()},
+            "pivot_entries": {key_label(direction): len(keys)
+                              for direction, keys in indexes.pivot_provenance.built().items()},
+            "folded_ambiguous": {lang: self._ambiguous_folded(folded_index)
+                                 for lang, folded_index in indexes.folded_index.built().items()},
+            "journal": {
+                "path": self.journal.path,
+                "id": self._journal_id,
+                "offset": self._journal_offset,
+                "uncompacted_entries": self._journal_uncompacted
+            } if self.journal is not None else None,
+            "entries": {lang: len(entries) for lang, entries in indexes.translation_db.items()}
+        }
+    
+    def _measure_memory(self):
+        """
+        Record the current generation's footprint for get_status().
+        
+        Sizing walks every index, so it runs when a dataset is loaded, reloaded or warmed
+        rather than per status request; runtime additions and lazy builds since then are
+        not counted until the next measurement.
+        """
+        indexes = self._indexes
+        self._footprint = {'bytes': self._memory_bytes(indexes), 'generation': indexes.generation}
+    
+    def _memory_bytes(self, indexes):
+        if self.store is not None:
+            # Indexes stay in the file; what this process holds is the hot rows (runtime additions aside)
+            return self.store.memory_bytes()
+        # Strings interned in the row store are counted once there, not per index
+        seen = set(id(string) for string in indexes.csv_rows.strings)
+        return indexes.csv_rows.memory_bytes() + _deep_sizeof(
+            [indexes.translation_db, indexes.exact_index.built(), indexes.word_index.built(), indexes.token_index,
+             [trie.root for trie in indexes.phrase_tries.built().values()], indexes.folded_index.built()], seen)
     
     def _normalize_text(self, text, lang='english'):
         """Normalize text for searching"""
@@ -18,129 +332,305 @@ class TranslationService:
         text = text.lower()
         return text
     
-    def _detect_language(self, text):
+    def _tokenize(self, text):
+        """Split text into lowercase words with surrounding punctuation removed"""
+        tokens = []
+        for word in text.lower().split():
+            clean_word = word.strip(string.punctuation)
+            if clean_word:
+                tokens.append(clean_word)
+        return tokens
+    
+    def _fold_text(self, text, lang='mizo'):
         """
-        Detect the language of the input text.
-        Checks for exact phrase matches first, then checks individual words.
+        Looser spelling of normalized text that folded-index keys are compared by.
         
-        Returns: 'english', 'bodo', 'mizo', or None if unable to detect
+        Bodo text becomes its Latin-script key (services.transliteration), so romanized input
+        finds Devanagari entries. Other languages are NFKD-decomposed and stripped of
+        combining marks - their diacritics. (Devanagari vowel signs are combining marks
+        too, which is why Bodo is never folded this way.)
         """
-        if not text:
+        if lang == 'bodo':
+            return latin_key(self._normalize_text(text))
+        decomposed = unicodedata.normalize('NFKD', self._normalize_text(text))
+        return ''.join(char for char in decomposed if not unicodedata.combining(char))
+    
+    def _build_folded_index(self, translation_db, source_lang):
+        """
+        {folded key: database key} for one language; keys folding to the same text share a tuple.
+        
+        Such ambiguous keys are reported in the status, and the first (in row order) is used.
+        """
+        folded_index = {}
+        for key in translation_db.get(source_lang, {}):
+            self._add_folded(folded_index, key, source_lang)
+        ambiguous = sum(1 for keys in folded_index.values() if isinstance(keys, tuple))
+        print(f"[FOLDED] {source_lang}: {len(folded_index)} folded keys, {ambiguous} ambiguous")
+        return folded_index
+    
+    def _add_folded(self, folded_index, key, source_lang):
+        folded = self._fold_text(key, source_lang)
+        if not folded:
+            return  # Nothing left to match by (e.g. a key of only punctuation)
+        keys = folded_index.get(folded)
+        if keys is None:
+            folded_index[folded] = key
+        elif isinstance(keys, tuple):
+            folded_index[folded] = keys + (key,)
+        else:
+            folded_index[folded] = (keys, key)
+    
+    def _folded_key(self, text, source_lang, indexes):
+        """Database key with the same folded spelling as text (the first one if several have it), or None"""
+        if source_lang not in indexes.folded_index:
             return None
+        folded = self._fold_text(text, source_lang)
+        if not folded:
+            return None
+        keys = indexes.folded_index[source_lang].get(folded)
+        return keys[0] if isinstance(keys, tuple) else keys
+    
+    def _ambiguous_folded(self, folded_index):
+        ambiguous = [(folded, keys) for folded, keys in folded_index.items() if isinstance(keys, tuple)]
+        return {
+            'count': len(ambiguous),
+            'samples': [{'folded': folded, 'keys': list(keys)} for folded, keys in ambiguous[:MAX_REPORTED_AMBIGUOUS]]
+        }
+    
+    def detect_language(self, text, indexes=None):
+        """
+        Detect the language of the input text in O(tokens).
         
-        text_normalized = text.strip()
-        text_lower = text_normalized.lower()
+        Devanagari script is decided as Bodo straight away (it is the only language in the
+        dataset written in it). Latin text is resolved by an exact English or Mizo phrase hit
+        if only one of them has it, otherwise by English and Mizo token votes from the
+        load-time token index, leaning towards English; romanized Bodo is only detected
+        when no token votes.
         
-        # Split into words for word-by-word checking
-        words = text_lower.split()
+        Returns: {'language': 'english' | 'bodo' | 'mizo' | None, 'confidence': 0.0-1.0}
+        """
+        if not text or not text.strip():
+            return {'language': None, 'confidence': 0.0}
+        indexes = indexes or self._indexes
         
-        # Check in CSV rows for exact matches or word matches
-        for row in self.csv_rows:
-            # Check English column
-            english_val = row.get('English', '').strip().lower()
-            if english_val:
-                if english_val == text_lower or any(word in english_val.split() for word in words):
-                    return 'english'
-            
-            # Check Bodo column (case-insensitive)
-            bodo_val = row.get('Bodo', '').strip().lower()
-            if bodo_val and bodo_val != '?':
-                if bodo_val == text_lower or any(word == bodo_val.split()[0] if bodo_val.split() else False for word in words):
-                    return 'bodo'
-            
-            # Check Mizo column (case-insensitive)
-            mizo_val = row.get('Mizo', '').strip().lower()
-            if mizo_val and mizo_val != '?':
-                if mizo_val == text_lower or any(word == mizo_val.split()[0] if mizo_val.split() else False for word in words):
-                    return 'mizo'
+        letters = [char for char in text if char.isalpha()]
+        devanagari = sum(1 for char in letters if '\u0900' <= char <= '\u097f')
+        if devanagari:
+            return {'language': 'bodo', 'confidence': round(devanagari / len(letters), 3)}
         
-        return None
+        text_normalized = self._normalize_text(text)
+        # The database has every dataset phrase of a language (and runtime additions) without
+        # building any per-direction index
+        phrase_languages = [lang for lang in LATIN_LANGUAGES
+                            if text_normalized in indexes.translation_db.get(lang, {})]
+        if len(phrase_languages) == 1:
+            return {'language': phrase_languages[0], 'confidence': 1.0}
+        
+        # Each token splits one vote across the languages it appears in,
+        # weighted by how often it occurs in each language's column
+        tokens = self._tokenize(text)
+        scores = {}
+        for token in tokens:
+            counts = indexes.token_index.get(token) or {}
+            total = sum(counts.get(lang, 0) for lang in LATIN_LANGUAGES)
+            for lang in LATIN_LANGUAGES:
+                if counts.get(lang):
+                    scores[lang] = scores.get(lang, 0) + counts[lang] / total
+        if not scores:
+            return self._detect_folded(text_normalized, tokens, indexes)
+        
+        best = max(scores, key=scores.get)
+        if 'english' in scores and scores[best] - scores['english'] < DETECT_ENGLISH_MARGIN:
+            best = 'english'
+        return {'language': best, 'confidence': round(scores[best] / len(tokens), 3)}
+    
+    def _detect_folded(self, text_normalized, tokens, indexes):
+        """
+        Detection for text with no token as typed in any language: Mizo without diacritics or romanized Bodo.
+        
+        The whole text matching a folded key decides; otherwise the language whose folded keys match
+        the most tokens, if only one does.
+        """
+        if not tokens:
+            return {'language': None, 'confidence': 0.0}
+        matches = {}
+        for lang in FOLDED_LANGUAGES:
+            if self._folded_key(text_normalized, lang, indexes) is not None:
+                matches[lang] = len(tokens)
+            else:
+                matches[lang] = sum(1 for token in tokens if self._folded_key(token, lang, indexes) is not None)
+        best = max(matches.values())
+        leaders = [lang for lang, count in matches.items() if count == best]
+        if not best or len(leaders) > 1:
+            return {'language': None, 'confidence': 0.0}
+        return {'language': leaders[0], 'confidence': round(best / len(tokens), 3)}
+    
+    def _detect_language(self, text, indexes=None):
+        """
+        Detect the language of the input text.
+        
+        Returns: 'english', 'bodo', 'mizo', or None if unable to detect
+        """
+        return self.detect_language(text, indexes)['language']
+    
+    def _build_phrase_trie(self, source_lang, exact_index):
+        """Build a token trie of every multi-word dataset phrase of one source language"""
+        trie = PhraseTrie()
+        for target_lang in LANGUAGE_COLUMNS:
+            if target_lang == source_lang:
+                continue
+            for key, value in exact_index[(source_lang, target_lang)].items():
+                tokens = self._tokenize(key)
+                if len(tokens) > 1:
+                    trie.insert(tokens, target_lang, value)
+        return trie
+    
+    def _build_token_index(self, rows):
+        """Build {token: {language: occurrences}} over every dataset column for detection"""
+        index = {}
+        for lang, col in LANGUAGE_COLUMNS.items():
+            for value in rows.column(col):
+                if not value or value == '?':
+                    continue
+                for token in self._tokenize(value):
+                    counts = index.setdefault(token, {})
+                    counts[lang] = counts.get(lang, 0) + 1
+        return index
     
     def _load_csv_rows(self):
-        """Load CSV rows for bidirectional lookup"""
-        rows = []
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'classroom_dataset_complete.csv')
+        """Stream every dataset CSV once into a compact RowStore (see services.dataset_ingest)"""
+        rows, report = ingest_datasets(self.csv_paths, DATASET_COLUMNS, LANGUAGE_COLUMNS, self._normalize_text)
+        self.load_report = report
         
-        if os.path.exists(csv_path):
-            try:
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Skip rows where all language columns are empty
-                        english = row.get('English', '').strip()
-                        bodo = row.get('Bodo', '').strip()
-                        mizo = row.get('Mizo', '').strip()
-                        
-                        if english or (bodo and bodo != '?') or (mizo and mizo != '?'):
-                            rows.append(row)
-                
-                print(f"[CSV LOADER] Loaded {len(rows)} CSV rows for bidirectional lookup")
-                return rows
-            except Exception as e:
-                print(f"[CSV LOADER] Error loading CSV rows: {e}")
-                return []
-        return []
+        skipped = sum(report['skipped'].values())
+        print(f"[CSV LOADER] Loaded {len(rows)} CSV rows from {len(self.csv_paths)} source(s) "
+              f"in {report['seconds']:.3f}s ({skipped} skipped)")
+        for source in report['sources']:
+            if source.get('error'):
+                print(f"[CSV LOADER] {source['path']}: {source['error']}")
+        conflicts = sum(report['conflicts'].values())
+        if conflicts:
+            print(f"[CSV LOADER] {conflicts} rows repeat an earlier key with a different translation; the first row wins")
+        return rows
+    
+    def _build_exact_direction(self, rows, source_lang, target_lang):
+        """
+        Build {normalized source text: translation} for one direction.
+        
+        Rows are visited in file order and a key is only set once, so the first row with a
+        usable (non-empty, non-'?') translation wins - the same result a linear scan gives.
+        """
+        entries = {}
+        for source_value, target_value in zip(rows.column(LANGUAGE_COLUMNS[source_lang]),
+                                              rows.column(LANGUAGE_COLUMNS[target_lang])):
+            if not source_value or source_value == '?':
+                continue
+            if not target_value or target_value == '?':
+                continue
+            entries.setdefault(rows.intern(self._normalize_text(source_value)), target_value)
+        return entries
+    
+    def _pivot_language(self, source_lang, target_lang):
+        return next(lang for lang in LANGUAGE_COLUMNS if lang not in (source_lang, target_lang))
     
-    def _load_translation_database(self):
-        """Load translation database from CSV file with improved error handling"""
-        db = {'english': {}, 'bodo': {}, 'mizo': {}}
+    def _pivot_entries(self, rows, source_lang, target_lang, entries, pivot_entries=None):
+        """
+        Fill gaps in one direction by pivoting through the row's third language.
         
-        # Try to load from the comprehensive dataset
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'classroom_dataset_complete.csv')
+        A row whose target cell is empty or '?' can still be translated when its other
+        cell (English for Bodo<->Mizo) has a direct translation into the target: e.g. a
+        Bodo phrase with no Mizo cell gets the Mizo translation of its English cell.
+        Only keys without a direct entry in `entries` are filled, first row wins, and pivots
+        are never chained. `pivot_entries` are the direct (pivot, target) entries; without
+        them just the pivot texts needed are looked up in rows.
         
-        if os.path.exists(csv_path):
-            try:
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    count = 0
-                    skipped = 0
-                    
-                    for row in reader:
-                        try:
-                            # Handle both column names (ID,English,Bodo,Mizo,Category format)
-                            english = row.get('English', '').strip()
-                            bodo = row.get('Bodo', '').strip()
-                            mizo = row.get('Mizo', '').strip()
-                            
-                            # Skip empty entries
-                            if not english and not bodo and not mizo:
-                                skipped += 1
-                                continue
-                            
-                            # Add to English index (lowercase for case-insensitive search)
-                            if english:
-                                english_lower = self._normalize_text(english, 'english')
-                                if english_lower not in db['english']:
-                                    db['english'][english_lower] = {'bodo': bodo, 'mizo': mizo}
-                            
-                            # Add to Bodo index (lowercase for case-insensitive search)
-                            if bodo and bodo != '?':  # Skip placeholder values
-                                bodo_lower = self._normalize_text(bodo, 'bodo')
-                                if bodo_lower not in db['bodo']:
-                                    db['bodo'][bodo_lower] = {'english': english, 'mizo': mizo}
-                            
-                            # Add to Mizo index (lowercase for case-insensitive search)
-                            if mizo and mizo != '?':  # Skip placeholder values
-                                mizo_lower = self._normalize_text(mizo, 'mizo')
-                                if mizo_lower not in db['mizo']:
-                                    db['mizo'][mizo_lower] = {'english': english, 'bodo': bodo}
-                            
-                            count += 1
-                        except Exception as row_error:
-                            skipped += 1
-                            continue
+        Returns: {key: translation} for the pivot-filled keys
+        """
+        pivot_lang = self._pivot_language(source_lang, target_lang)
+        source_col = LANGUAGE_COLUMNS[source_lang]
+        pivot_col = LANGUAGE_COLUMNS[pivot_lang]
+        target_col = LANGUAGE_COLUMNS[target_lang]
+        
+        # Only rows with a gap in the target column can need a pivot
+        candidates = []
+        for row_id, target_value in enumerate(rows.column(target_col)):
+            if target_value and target_value != '?':
+                continue
+            source_value = rows.value(row_id, source_col)
+            pivot_value = rows.value(row_id, pivot_col)
+            if not source_value or source_value == '?' or not pivot_value or pivot_value == '?':
+                continue
+            key = self._normalize_text(source_value)
+            if key not in entries:
+                candidates.append((key, self._normalize_text(pivot_value)))
+        if not candidates:
+            return {}
+        
+        if pivot_entries is None:
+            wanted = {pivot_key for _, pivot_key in candidates}
+            pivot_entries = {}
+            for pivot_value, target_value in zip(rows.column(pivot_col), rows.column(target_col)):
+                if not pivot_value or pivot_value == '?' or not target_value or target_value == '?':
+                    continue
+                pivot_key = self._normalize_text(pivot_value)
+                if pivot_key in wanted:
+                    pivot_entries.setdefault(pivot_key, target_value)
+        
+        filled = {}
+        for key, pivot_key in candidates:
+            if key in filled:
+                continue
+            value = pivot_entries.get(pivot_key)
+            if value:
+                filled[rows.intern(key)] = value
+        return filled
+    
+    def _build_word_direction(self, entries, translation_db, source_lang, target_lang):
+        """
+        Build {word: translation} for word-by-word fallback in one direction.
+        
+        Single-token CSV entries take precedence; translation_db fills in words the CSV
+        has no usable translation for, mirroring the lookup order of _translate_word().
+        """
+        words = {key: value for key, value in entries.items() if len(key.split()) == 1}
+        for key, entry in translation_db.get(source_lang, {}).items():
+            if key in words or len(key.split()) != 1:
+                continue
+            value = entry.get(target_lang)
+            if value and value.strip():
+                words[key] = value
+        return words
+    
+    def _load_translation_database(self, rows):
+        """Build the per-language translation database from the loaded rows"""
+        if any(os.path.exists(path) for path in self.csv_paths):
+            db = {'english': {}, 'bodo': {}, 'mizo': {}}
+            # Share strings with the row store instead of holding a second copy of each cell
+            intern = rows.intern
+            for english, bodo, mizo in zip(rows.column('English'), rows.column('Bodo'), rows.column('Mizo')):
+                # Add to English index (lowercase for case-insensitive search)
+                if english:
+                    english_lower = intern(self._normalize_text(english, 'english'))
+                    if english_lower not in db['english']:
+                        db['english'][english_lower] = {'bodo': bodo, 'mizo': mizo}
                 
-                print(f"[SUCCESS] Loaded {count} translations from CSV")
-                print(f"  - English entries: {len(db['english'])}")
-                print(f"  - Bodo entries: {len(db['bodo'])}")
-                print(f"  - Mizo entries: {len(db['mizo'])}")
-                print(f"  - Skipped: {skipped}")
+                # Add to Bodo index (lowercase for case-insensitive search)
+                if bodo and bodo != '?':  # Skip placeholder values
+                    bodo_lower = intern(self._normalize_text(bodo, 'bodo'))
+                    if bodo_lower not in db['bodo']:
+                        db['bodo'][bodo_lower] = {'english': english, 'mizo': mizo}
                 
-                return db
-            except Exception as e:
-                print(f"[WARNING] Error loading CSV: {e}")
-                import traceback
-                traceback.print_exc()
+                # Add to Mizo index (lowercase for case-insensitive search)
+                if mizo and mizo != '?':  # Skip placeholder values
+                    mizo_lower = intern(self._normalize_text(mizo, 'mizo'))
+                    if mizo_lower not in db['mizo']:
+                        db['mizo'][mizo_lower] = {'english': english, 'bodo': bodo}
+            
+            print(f"[SUCCESS] Loaded {len(rows)} translations from CSV")
+            print(f"  - English entries: {len(db['english'])}")
+            print(f"  - Bodo entries: {len(db['bodo'])}")
+            print(f"  - Mizo entries: {len(db['mizo'])}")
+            return db
         
         # Fallback to hardcoded translations
         print("[WARNING] Using fallback translation database")
@@ -225,7 +715,7 @@ class TranslationService:
             }
         }
     
-    def _translate_word(self, word, source_lang, target_lang):
+    def _translate_word(self, word, source_lang, target_lang, indexes=None):
         """
         Translate a single word.
         
@@ -234,44 +724,321 @@ class TranslationService:
         clean_word = word.strip().lower().strip(string.punctuation)
         if not clean_word:
             return ''
+        indexes = indexes or self._indexes
         
-        # Try CSV first
-        for row in self.csv_rows:
-            if source_lang == 'english':
-                source_col = 'English'
-            elif source_lang == 'bodo':
-                source_col = 'Bodo'
-            elif source_lang == 'mizo':
-                source_col = 'Mizo'
-            else:
+        words = indexes.word_index.get((source_lang, target_lang))
+        if words is not None:
+            word_translation = words.get(clean_word, '')
+            counts = indexes.token_index.get(clean_word)
+            # Typed without diacritics, or romanized Bodo - unless it is a word of another language
+            if not word_translation and (not counts or source_lang in counts):
+                folded_key = self._folded_key(clean_word, source_lang, indexes)
+                if folded_key is not None:
+                    word_translation = words.get(folded_key, '')
+            return word_translation
+        
+        # Direction without a precomputed index (e.g. added at runtime) - try database
+        translation_entry = indexes.translation_db.get(source_lang, {}).get(clean_word, {})
+        word_translation = translation_entry.get(target_lang)
+        if word_translation and word_translation.strip():
+            return word_translation
+        
+        return ''
+    
+    def _split_words(self, text):
+        """Original words (kept for echoing misses) and their punctuation-free lowercase tokens"""
+        kept_words = []
+        tokens = []
+        for word in text.split():
+            clean_word = word.strip().lower().strip(string.punctuation)
+            if clean_word:
+                kept_words.append(word)
+                tokens.append(clean_word)
+        return kept_words, tokens
+    
+    def find_corrections(self, text, source_lang, indexes=None):
+        """
+        Misspelled words in text and what typo correction replaces them with.
+        
+        Returns: list of {'word', 'correction', 'distance'} in text order
+        """
+        return self._correct_tokens(self._split_words(text or '')[1], source_lang, indexes)[1]
+    
+    def _correct_tokens(self, tokens, source_lang, indexes=None, start=0):
+        """
+        Replace misspelled tokens from `start` on, left to right.
+        
+        Each correction sees the corrected tokens before it and the tokens after it as typed,
+        so tokens[:start] must already be corrected (incremental sessions resume there).
+        
+        Returns: (tokens with misspellings replaced, list of corrections made)
+        """
+        indexes = indexes or self._indexes
+        tokens = list(tokens)
+        corrections = []
+        for position in range(start, len(tokens)):
+            correction = self._correction(tokens, position, source_lang, indexes)
+            if correction:
+                corrections.append({'word': tokens[position], 'correction': correction[0], 'distance': correction[1]})
+                tokens[position] = correction[0]
+        return tokens, corrections
+    
+    def _correction(self, tokens, position, source_lang, indexes):
+        """
+        (word, edit distance) for an unknown tokens[position]; None if it is known, nothing is close
+        or the closest words are ambiguous.
+        
+        A candidate that completes a dataset phrase with its neighbours ("opne your notebooks" ->
+        "open") beats closer and more frequent ones; otherwise the closest wins, ties going to a
+        clearly more frequent word (FuzzyWordIndex.best()).
+        """
+        token = tokens[position]
+        if not FUZZY_MAX_DISTANCE or self._is_known_word(token, source_lang, indexes):
+            return None
+        if any(char.isdigit() for char in token):
+            return None
+        index = self._fuzzy_index(source_lang, indexes)
+        candidates = index.candidates(token)
+        in_phrase = [candidate for candidate in candidates
+                     if self._completes_phrase(tokens, position, candidate[0], source_lang, indexes)]
+        correction = index.best(in_phrase or candidates)
+        try:
+            if correction:
+                print(f"[FUZZY] {source_lang}: '{token}' -> '{correction[0]}' (distance {correction[1]})")
+            elif candidates:
+                print(f"[FUZZY] {source_lang}: '{token}' left as typed; "
+                      f"{', '.join(word for word, _ in candidates[:3])} are equally close")
+        except:
+            pass
+        return correction
+    
+    def _completes_phrase(self, tokens, position, word, source_lang, indexes):
+        """Whether a dataset phrase covers `position` once tokens[position] is replaced by word"""
+        trie = indexes.phrase_tries.get(source_lang)
+        if not trie or trie.depth < 2:
+            return False
+        # Only tokens within one phrase length of the position can take part
+        first = max(0, position - trie.depth + 1)
+        window = tokens[first:position] + [word] + tokens[position + 1:position + trie.depth]
+        offset = position - first
+        for start in range(offset + 1):
+            if any(length > offset - start for length, _ in trie.longest_matches(window, start).values()):
+                return True
+        return False
+    
+    def _is_known_word(self, token, source_lang, indexes):
+        """
+        Exact hit in the dataset vocabulary or the database; typo correction only runs after a miss.
+        
+        A word from another dataset language counts as known too: it is code-switching, not a typo.
+        (Every word-index key is a database key, so this matches checking the word index
+        without building it.) So does a known word typed without diacritics or romanized.
+        """
+        if token in indexes.token_index or token in indexes.translation_db.get(source_lang, {}):
+            return True
+        return self._folded_key(token, source_lang, indexes) is not None
+    
+    def _fuzzy_index(self, source_lang, indexes=None):
+        """Deletion index over every word of a source language, built on first use per generation"""
+        indexes = indexes or self._indexes
+        index = indexes.fuzzy_indexes.get(source_lang)
+        if index is not None:
+            return index
+        started = time.perf_counter()
+        index = FuzzyWordIndex(FUZZY_MAX_DISTANCE)
+        for token, counts in indexes.token_index.items():
+            if source_lang in counts:
+                index.add(token, counts[source_lang])
+        # Database keys cover every word-index key (runtime additions included) without building it
+        for word in indexes.translation_db.get(source_lang, {}):
+            if word not in index and len(word.split()) == 1:
+                index.add(word)
+        # Concurrent first lookups may both build it; either result is the same
+        indexes.fuzzy_indexes[source_lang] = index
+        print(f"[FUZZY] Built {source_lang} typo index ({len(index)} words) in "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return index
+    
+    def _similarity_index(self, source_lang, indexes=None):
+        """TF-IDF index over the multi-word database keys of a source language, built on first use per generation"""
+        indexes = indexes or self._indexes
+        index = indexes.similarity_indexes.get(source_lang)
+        if index is not None:
+            return index
+        started = time.perf_counter()
+        if self.store is not None:
+            index = self.store.similarity_index(source_lang)
+        else:
+            index = PhraseSimilarityIndex(key for key in indexes.translation_db.get(source_lang, {})
+                                          if len(key.split()) > 1)
+        # Concurrent first lookups may both build it; either result is the same
+        indexes.similarity_indexes[source_lang] = index
+        print(f"[SIMILAR] Built {source_lang} phrase index ({len(index)} phrases) in "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return index
+    
+    def find_similar(self, texts, source_lang, k=SIMILARITY_TOP_K, indexes=None):
+        """
+        Closest dataset phrases of many texts, scored together in one batch.
+        
+        Returns: list in input order of [(phrase key, cosine score)], best first
+        """
+        return self._similarity_index(source_lang.lower(), indexes).top_k(texts, k)
+    
+    def _similar_translation(self, tokens, source_lang, target_lang, matches, indexes):
+        """
+        Translation of the closest phrase scoring at least SIMILARITY_MIN_SCORE that covers the
+        sentence's tokens (see _covers()), as (key, score, translation)
+        """
+        for key, score in matches:
+            if score < SIMILARITY_MIN_SCORE:
+                break
+            if not self._covers(key, tokens, source_lang, indexes):
                 continue
-            
-            source_value = row.get(source_col, '').strip()
-            if source_value and self._normalize_text(source_value) == clean_word:
-                # Found in CSV
-                if source_lang == 'english':
-                    word_translation = row.get('Bodo' if target_lang == 'bodo' else 'Mizo', '').strip()
-                elif source_lang == 'bodo':
-                    word_translation = row.get('English' if target_lang == 'english' else 'Mizo', '').strip()
-                elif source_lang == 'mizo':
-                    word_translation = row.get('English' if target_lang == 'english' else 'Bodo', '').strip()
-                else:
-                    word_translation = ''
-                
-                if word_translation and word_translation != '?':
-                    return word_translation
+            translation = self._key_translation(key, source_lang, target_lang, indexes)
+            if translation:
+                return key, score, translation
+        return None
+    
+    def _covers(self, key, tokens, source_lang, indexes):
+        """
+        Whether a similar phrase says everything the sentence's tokens say: each token but
+        filler words is in it (up to a typo), and it is negated exactly when they are. A high
+        trigram score alone would answer "don't open your notebooks" with "open your notebooks".
+        """
+        negations = NEGATION_WORDS.get(source_lang, frozenset())
+        fillers = SIMILARITY_FILLER_WORDS.get(source_lang, frozenset())
+        key_tokens = self._tokenize(key)
         
-        # If not found in CSV, try database
-        if source_lang in self.translation_db:
-            if clean_word in self.translation_db[source_lang]:
-                translation_entry = self.translation_db[source_lang][clean_word]
-                if target_lang in translation_entry:
-                    word_translation = translation_entry[target_lang]
-                    if word_translation and word_translation.strip():
-                        return word_translation
+        def negated(words):
+            return any(word.replace('\u2019', "'") in negations for word in words)
         
+        if negated(tokens) != negated(key_tokens):
+            return False
+        fuzzy = self._fuzzy_index(source_lang, indexes)
+        for token in tokens:
+            if token in fillers or token.replace('\u2019', "'") in negations:
+                continue
+            if not any(fuzzy.matches(token, key_token) for key_token in key_tokens):
+                return False
+        return True
+    
+    def _key_translation(self, key, source_lang, target_lang, indexes):
+        """Translation of a database key (exact index first, as in translate()), '' when it has none"""
+        translation = indexes.exact_index.get((source_lang, target_lang), {}).get(key)
+        if not translation:
+            translation = indexes.translation_db[source_lang][key].get(target_lang)
+        if translation and translation.strip() and translation != '?':
+            return translation
         return ''
     
+    def _suggest_index(self, source_lang, indexes=None):
+        """Sorted prefix index over every database key of a source language, built on first use per generation"""
+        indexes = indexes or self._indexes
+        index = indexes.suggest_indexes.get(source_lang)
+        if index is not None:
+            return index
+        started = time.perf_counter()
+        if self.store is not None:
+            # Read from the store's key index per prefix; runtime additions are not suggested
+            index = self.store.prefix_index(source_lang)
+        else:
+            # Ranked by how many dataset rows hold the phrase; runtime additions count once
+            occurrences = {}
+            column = LANGUAGE_COLUMNS.get(source_lang)
+            if column in indexes.csv_rows.columns:
+                for value in indexes.csv_rows.column(column):
+                    if value:
+                        key = self._normalize_text(value, source_lang)
+                        occurrences[key] = occurrences.get(key, 0) + 1
+            index = PrefixIndex({key: occurrences.get(key, 1) for key in indexes.translation_db.get(source_lang, {})})
+        # Concurrent first lookups may both build it; either result is the same
+        indexes.suggest_indexes[source_lang] = index
+        print(f"[SUGGEST] Built {source_lang} prefix index ({len(index)} phrases) in "
+              f"{(time.perf_counter() - started) * 1000:.1f}ms")
+        return index
+    
+    def suggest(self, prefix, source_lang='english', target_langs=('bodo', 'mizo'), k=SUGGEST_TOP_K):
+        """
+        Dataset phrases starting with what has been typed so far, for autocomplete.
+        
+        Phrases translated most often in this process come first (see record_phrase_use()),
+        then the ones most frequent in the dataset, shorter first. The prefix is matched
+        case-insensitively; a trailing space only matches phrases continuing with a new word.
+        
+        Returns: [{'text': phrase, 'uses': n, 'translations': {target: str}}], best first
+        """
+        source_lang = source_lang.lower()
+        target_langs = [target_lang.lower() for target_lang in target_langs]
+        indexes = self._indexes
+        prefix = normalize_prefix(prefix or '')
+        source_entries = indexes.translation_db.get(source_lang)
+        if not prefix or not source_entries or k <= 0:
+            return []
+        
+        usage = self.phrase_usage.get(source_lang)
+        phrases = usage.top(prefix, k, source_entries) if usage is not None else []
+        for phrase in self._suggest_index(source_lang, indexes).top(prefix, k + len(phrases)):
+            if len(phrases) >= k:
+                break
+            if phrase not in phrases:
+                phrases.append(phrase)
+        
+        return [{
+            'text': phrase,
+            'uses': usage.counts.get(phrase, 0) if usage is not None else 0,
+            'translations': {target_lang: phrase if target_lang == source_lang
+                             else self._key_translation(phrase, source_lang, target_lang, indexes)
+                             for target_lang in target_langs}
+        } for phrase in phrases]
+    
+    def record_phrase_use(self, text, source_lang):
+        """Count a translated text towards suggest() ranking; only dataset phrases are counted"""
+        key = self._normalize_text(text, source_lang)
+        usage = self.phrase_usage.get(source_lang)
+        if usage is None or key not in self._indexes.translation_db.get(source_lang, {}):
+            return False
+        usage.record(key)
+        return True
+    
+    def _segment(self, tokens, source_lang, target_lang, walks=None, start=0, indexes=None):
+        """
+        Split tokens into the longest known dataset phrases in one left-to-right pass.
+        
+        Multi-word phrases come from the source language's phrase trie; anything else is
+        looked up as a single word. One trie walk answers every target, so callers
+        translating the same tokens into several targets pass a shared `walks` dict
+        ({position: matches}) and each position is walked only once.
+        
+        `start` resumes segmentation at a known phrase boundary (incremental sessions).
+        
+        Returns: list of (start, end, translation) with translation '' for unknown words
+        """
+        indexes = indexes or self._indexes
+        trie = indexes.phrase_tries.get(source_lang)
+        if walks is None:
+            walks = {}
+        segments = []
+        position = start
+        while position < len(tokens):
+            matches = walks.get(position)
+            if matches is None:
+                matches = walks[position] = trie.longest_matches(tokens, position) if trie else {}
+            length, phrase_translation = matches.get(target_lang, (0, None))
+            if length > 1:
+                segments.append((position, position + length, phrase_translation))
+                position += length
+                continue
+            word_translation = self._translate_word(tokens[position], source_lang, target_lang, indexes)
+            segments.append((position, position + 1, word_translation))
+            position += 1
+        return segments
+    
+    def max_phrase_tokens(self, source_lang, indexes=None):
+        """Length in tokens of the longest dataset phrase for a source language (at least 1)"""
+        trie = (indexes or self._indexes).phrase_tries.get(source_lang)
+        return max(trie.depth if trie else 0, 1)
+    
     def translate(self, text, source_lang=None, target_lang="mizo"):
         """
         Translate text from source language to target language.
@@ -293,91 +1060,178 @@ class TranslationService:
         
         text_normalized = self._normalize_text(text)
         target_lang = target_lang.lower()
+        if source_lang is not None:
+            source_lang = source_lang.lower()
+        
+        # One index generation serves the whole call, even if a writer swaps in the next one
+        indexes = self._indexes
+        
+        # Repeated instructions are served from the result cache, detection included
+        cache_key = (text.strip(), source_lang, target_lang, indexes.generation)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached[0]
         
         # Auto-detect source language if not provided
-        if source_lang is None:
-            source_lang = self._detect_language(text)
-            if source_lang is None:
-                # If detection fails, default to English
-                source_lang = 'english'
-                try:
-                    print(f"[AUTO-DETECT] Could not detect language for '{text}', defaulting to English")
-                except:
-                    pass
-        else:
-            source_lang = source_lang.lower()
+        source_lang = self._resolve_source(text, source_lang, indexes)
         
         # If source and target are the same, return original text
         if source_lang == target_lang:
             return text.strip()
         
-        # ========== STEP 1: Search CSV for exact match ==========
-        for row in self.csv_rows:
-            match_key = None
-            match_data = None
-            
-            # Determine which column to search based on source language
-            if source_lang == 'english':
-                source_col = 'English'
-                bodo_col = 'Bodo'
-                mizo_col = 'Mizo'
-            elif source_lang == 'bodo':
-                source_col = 'Bodo'
-                bodo_col = 'Bodo'
-                mizo_col = 'Mizo'
-                english_col = 'English'
-            elif source_lang == 'mizo':
-                source_col = 'Mizo'
-                bodo_col = 'Bodo'
-                mizo_col = 'Mizo'
-                english_col = 'English'
-            else:
+        result = self._translate_from(text, text_normalized, source_lang, target_lang, indexes=indexes)
+        self.cache.put(cache_key, result)
+        return result[0]
+    
+    def _resolve_source(self, text, source_lang, indexes=None):
+        """Requested source language, or the detected one (English if detection fails)"""
+        if source_lang is not None:
+            return source_lang
+        source_lang = self._detect_language(text, indexes)
+        if source_lang is None:
+            # If detection fails, default to English
+            source_lang = 'english'
+            try:
+                print(f"[AUTO-DETECT] Could not detect language for '{text}', defaulting to English")
+            except:
+                pass
+        return source_lang
+    
+    def translate_batch(self, texts, source_lang=None, target_langs=('bodo', 'mizo')):
+        """
+        Translate many texts into several target languages, sharing work between them.
+        
+        Identical texts (after trimming) are translated once. Each distinct text is
+        detected, tokenized and phrase-segmented once for all targets; only the final
+        per-target lookups are repeated. Sentences without an exact match are scored
+        for similar dataset phrases together, one batch per source language. Results
+        are cached exactly like translate().
+        
+        `found` is True only when the dataset covered the whole text: an exact (or folded)
+        match, a similar phrase, or a known phrase or word for every segment. Word-by-word
+        output that echoes unknown words is still returned, with found False. `approximate`
+        is True where a similar dataset phrase was translated instead, `matched_phrase` names it.
+        
+        Returns: list in input order of
+            {'text': str, 'source_lang': str, 'translations': {target: str}, 'found': {target: bool},
+             'approximate': {target: bool}, 'matched_phrase': {target: str or None},
+             'corrections': [{'word', 'correction', 'distance'}]}
+        """
+        if source_lang is not None:
+            source_lang = source_lang.lower()
+        target_langs = [target_lang.lower() for target_lang in target_langs]
+        
+        indexes = self._indexes
+        distinct = list(dict.fromkeys((text or '').strip() for text in texts))
+        sources = {key: self._resolve_source(key, source_lang, indexes) if key else source_lang for key in distinct}
+        similar = self._batch_similar(distinct, sources, source_lang, target_langs, indexes)
+        
+        by_text = {key: self._translate_targets(key, source_lang, target_langs, sources[key], similar.get(key))
+                   for key in distinct}
+        return [dict(by_text[(text or '').strip()], text=text) for text in texts]
+    
+    def _batch_similar(self, texts, sources, source_lang, target_langs, indexes):
+        """{text: closest phrases} for the uncached multi-word texts with no exact match, scored per source language"""
+        if not SIMILARITY_MIN_SCORE:
+            return {}
+        pending = {}
+        for text in texts:
+            resolved_source = sources[text]
+            if len(text.split()) < 2 or self._normalize_text(text) in indexes.translation_db.get(resolved_source, {}):
                 continue
-            
-            # Get the value from the source column and normalize
-            source_value = row.get(source_col, '').strip()
-            if not source_value or source_value == '?':
+            if any(target_lang != resolved_source and
+                   self.cache.get((text, source_lang, target_lang, indexes.generation)) is None
+                   for target_lang in target_langs):
+                pending.setdefault(resolved_source, []).append(text)
+        similar = {}
+        for resolved_source, pending_texts in pending.items():
+            similar.update(zip(pending_texts, self.find_similar(pending_texts, resolved_source, indexes=indexes)))
+        return similar
+    
+    def translate_stream(self, lines, source_lang=None, target_langs=('bodo', 'mizo')):
+        """
+        Lazily translate an iterable of lines, yielding one result per line as soon as it is ready.
+        
+        Nothing is accumulated, so memory stays constant however long the input is;
+        repeated lines are served by the result cache instead of batch deduplication.
+        
+        Yields: {'line': n, 'text', 'source_lang', 'translations', 'found', 'approximate', 'matched_phrase',
+                 'corrections'} (line numbers start at 1)
+        """
+        if source_lang is not None:
+            source_lang = source_lang.lower()
+        target_langs = [target_lang.lower() for target_lang in target_langs]
+        
+        for line_number, line in enumerate(lines, start=1):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8', errors='replace')
+            text = line.strip()
+            result = self._translate_targets(text, source_lang, target_langs)
+            yield dict(result, line=line_number, text=text)
+    
+    def _translate_targets(self, text, source_lang, target_langs, resolved_source=None, similar=None):
+        """One text into every target; shares detection, tokens, trie walks and similar phrases"""
+        indexes = self._indexes
+        translations = {}
+        found = {}
+        matched_phrases = {}
+        if resolved_source is None:
+            resolved_source = self._resolve_source(text, source_lang, indexes) if text else source_lang
+        shared = {'similar': similar} if similar is not None else {}
+        for target_lang in target_langs:
+            if not text:
+                translations[target_lang], found[target_lang], matched_phrases[target_lang] = '', False, None
                 continue
-            
-            # Compare normalized values (case-insensitive)
-            if self._normalize_text(source_value) == text_normalized:
-                # Found a match! Now return the target language translation
-                if source_lang == 'english':
-                    if target_lang == 'bodo':
-                        target_value = row.get('Bodo', '').strip()
-                    elif target_lang == 'mizo':
-                        target_value = row.get('Mizo', '').strip()
-                    else:
-                        continue
-                elif source_lang == 'bodo':
-                    if target_lang == 'english':
-                        target_value = row.get('English', '').strip()
-                    elif target_lang == 'mizo':
-                        target_value = row.get('Mizo', '').strip()
-                    else:
-                        continue
-                elif source_lang == 'mizo':
-                    if target_lang == 'english':
-                        target_value = row.get('English', '').strip()
-                    elif target_lang == 'bodo':
-                        target_value = row.get('Bodo', '').strip()
-                    else:
-                        continue
-                else:
-                    continue
-                
-                # Skip if target is empty or placeholder
-                if target_value and target_value != '?':
-                    try:
-                        print(f"[CSV MATCH] {source_lang}->{target_lang}: '{text}' = '{target_value}'")
-                    except:
-                        pass
-                    return target_value
+            if resolved_source == target_lang:
+                translations[target_lang], found[target_lang], matched_phrases[target_lang] = text, True, None
+                continue
+            cache_key = (text, source_lang, target_lang, indexes.generation)
+            result = self.cache.get(cache_key)
+            if result is None:
+                result = self._translate_from(text, self._normalize_text(text), resolved_source,
+                                              target_lang, shared, indexes)
+                self.cache.put(cache_key, result)
+            translations[target_lang], found[target_lang], matched_phrases[target_lang] = result
+        corrections = shared.get('corrections')
+        if corrections is None:
+            corrections = self.find_corrections(text, resolved_source, indexes) if text else []
+        return {
+            'source_lang': resolved_source,
+            'translations': translations,
+            'found': found,
+            'approximate': {target_lang: phrase is not None for target_lang, phrase in matched_phrases.items()},
+            'matched_phrase': matched_phrases,
+            'corrections': corrections
+        }
+    
+    def _translate_from(self, text, text_normalized, source_lang, target_lang, shared=None, indexes=None):
+        """
+        Lookup steps of translate() once the source language is known.
+        
+        `shared` memoizes the tokenization and trie walks of this text so further
+        targets for the same text can reuse them; a live session also passes its
+        segmentation per target ({'segments': {target: segments}}, see _segment()).
+        
+        Returns: (translation, found, matched_phrase) - found is False when the translation is
+        empty or echoes words the dataset does not know; matched_phrase is the dataset phrase
+        translated instead when the text was answered as a paraphrase of it (see STEP 5), else None
+        """
+        indexes = indexes or self._indexes
+        translation_db = indexes.translation_db
+        
+        # ========== STEP 1: Exact match via precomputed CSV index ==========
+        target_value = indexes.exact_index.get((source_lang, target_lang), {}).get(text_normalized)
+        if target_value:
+            try:
+                print(f"[CSV MATCH] {source_lang}->{target_lang}: '{text}' = '{target_value}'")
+            except:
+                pass
+            return target_value, True, None
         
         # ========== STEP 2: Try database lookup (fallback) ==========
-        if source_lang in self.translation_db:
-            if text_normalized in self.translation_db[source_lang]:
-                translation_entry = self.translation_db[source_lang][text_normalized]
+        if source_lang in translation_db:
+            if text_normalized in translation_db[source_lang]:
+                translation_entry = translation_db[source_lang][text_normalized]
                 if target_lang in translation_entry:
                     result = translation_entry[target_lang]
                     if result and result.strip() and result != '?':
@@ -385,65 +1239,406 @@ class TranslationService:
                             print(f"[DB MATCH] {source_lang}->{target_lang}: '{text}' = '{result}'")
                         except:
                             pass
-                        return result
+                        return result, True, None
+        
+        # ========== STEP 3: Same text typed without diacritics (or romanized, for Bodo) ==========
+        # Only for text whose words are not already a known phrase as typed
+        folded_key = None
+        if ' '.join(self._tokenize(text)) not in translation_db.get(source_lang, {}):
+            folded_key = self._folded_key(text_normalized, source_lang, indexes)
+        if folded_key is not None and folded_key != text_normalized:
+            result = self._key_translation(folded_key, source_lang, target_lang, indexes)
+            if result:
+                try:
+                    print(f"[FOLDED MATCH] {source_lang}->{target_lang}: '{text}' ~ '{folded_key}' = '{result}'")
+                except:
+                    pass
+                return result, True, None
         
-        # ========== STEP 3: Word-by-word translation (for phrases) ==========
-        # Split text into words and translate each one
+        # ========== STEP 4: Phrase segmentation + word-by-word (for sentences) ==========
+        # Split text into words and translate the longest known phrases, then single words
         words = text.split()  # Keep original case/punctuation
         
-        if len(words) > 1 or (len(words) == 1 and text_normalized not in self.translation_db.get(source_lang, {})):
-            # Try word-by-word translation
-            translated_words = []
-            found_translations = 0
-            total_words = 0
+        if len(words) > 1 or (len(words) == 1 and text_normalized not in translation_db.get(source_lang, {})):
+            # Remove punctuation for matching but keep the original word for echoing misses
+            if shared is None:
+                shared = {}
+            if 'tokens' not in shared:
+                shared['kept_words'], tokens = self._split_words(text)
+                # Misspelled words are swapped for their closest known word before phrase matching
+                shared['tokens'], shared['corrections'] = self._correct_tokens(tokens, source_lang, indexes)
+                shared['walks'] = {}
+            kept_words, tokens = shared['kept_words'], shared['tokens']
             
-            for word in words:
-                # Remove punctuation for matching but keep track of it
-                clean_word = word.strip().lower().strip(string.punctuation)
-                if not clean_word:
-                    continue
-                
-                total_words += 1
-                word_translation = self._translate_word(clean_word, source_lang, target_lang)
-                
-                if word_translation:
-                    translated_words.append(word_translation)
-                    found_translations += 1
+            translated_words = []
+            found_segments = 0
+            segments = shared.get('segments', {}).get(target_lang)
+            if segments is None:
+                segments = self._segment(tokens, source_lang, target_lang, shared['walks'], indexes=indexes)
+            for start, end, segment_translation in segments:
+                if segment_translation:
+                    translated_words.append(segment_translation)
+                    found_segments += 1
                 else:
                     # Keep original word if not found
-                    translated_words.append(word)
+                    translated_words.append(kept_words[start])
             
-            # Return word-by-word translation (even if some words not found)
+            # ========== STEP 5: Closest dataset phrase (for paraphrased sentences) ==========
+            # Word-by-word output keeps the source word order. When no dataset phrase carried the
+            # sentence, or words were left untranslated, a near-identical dataset sentence that says
+            # the same thing is better; the caller is told which phrase was translated instead.
+            if SIMILARITY_MIN_SCORE and len(words) > 1 and (
+                    found_segments < len(segments) or all(end - start == 1 for start, end, _ in segments)):
+                if 'similar' not in shared:
+                    shared['similar'] = self.find_similar([text], source_lang, indexes=indexes)[0]
+                similar = self._similar_translation(tokens, source_lang, target_lang, shared['similar'], indexes)
+                if similar:
+                    key, score, result = similar
+                    try:
+                        print(f"[SIMILAR] {source_lang}->{target_lang}: '{text}' ~ '{key}' ({score:.2f}) = '{result}'")
+                    except:
+                        pass
+                    return result, True, key
+            
+            # Return segment-by-segment translation (even if some words not found)
             if translated_words:
                 result = ' '.join(translated_words)
                 try:
-                    print(f"[WORD-BY-WORD] {source_lang}->{target_lang}: {found_translations}/{total_words} words translated")
+                    print(f"[WORD-BY-WORD] {source_lang}->{target_lang}: {found_segments}/{len(segments)} segments "
+                          f"translated ({len(tokens)} words)")
                 except:
                     pass
-                return result
+                return result, found_segments == len(segments), None
         
-        # ========== STEP 4: Not found ==========
+        # ========== STEP 6: Not found ==========
         try:
             print(f"[NOT FOUND] {source_lang}->{target_lang}: '{text}' not found in dataset")
         except:
             pass
-        return ''
+        return '', False, None
     
     def get_supported_languages(self):
         """Get list of supported languages"""
         return ['english', 'bodo', 'mizo']
     
     def add_translation(self, text, source_lang, target_lang, translation):
-        """Add new translation to database"""
-        text_lower = text.lower().strip()
-        source_lang = source_lang.lower()
-        target_lang = target_lang.lower()
-        
-        if source_lang not in self.translation_db:
-            self.translation_db[source_lang] = {}
+        """
+        Add new translation to database.
         
-        if text_lower not in self.translation_db[source_lang]:
-            self.translation_db[source_lang][text_lower] = {}
+        With a journal, the entry is appended durably first and then applied by
+        reading the journal back, together with anything other workers appended
+        meanwhile, so every process applies additions in the same order.
+        """
+        entry = {
+            'text': text.lower().strip(),
+            'source_lang': source_lang.lower(),
+            'target_lang': target_lang.lower(),
+            'translation': translation
+        }
+        if self.journal is not None:
+            try:
+                self.journal.append(entry)
+            except OSError as e:
+                # e.g. a read-only serverless filesystem: still serve it from this process
+                print(f"[JOURNAL] Could not write {self.journal.path}: {e}; keeping the entry in memory only")
+            else:
+                self.sync_journal()
+                if self._journal_uncompacted >= JOURNAL_COMPACT_EVERY:
+                    self.compact_journal()
+                return True
         
-        self.translation_db[source_lang][text_lower][target_lang] = translation
+        with self._lock:
+            self._apply_translations([entry])
+            self._unjournaled += 1
         return True
+    
+    def data_position(self):
+        """
+        Where this service's data stands: (dataset version, journal id, journal offset).
+        
+        Another service over the same CSVs and journal holds the same data once it has
+        caught up to it (see catch_up()). None while runtime additions are held only in
+        memory, since no other process can reproduce those.
+        """
+        if self._unjournaled:
+            return None
+        return self._indexes.dataset_version, self._journal_id, self._journal_offset
+    
+    def catch_up(self, position):
+        """Reload the CSVs and replay the journal as needed to hold at least the data at position"""
+        dataset_version, journal_id, journal_offset = position
+        if self.dataset_version != dataset_version:
+            self.reload_dataset()
+        if (self._journal_id, self._journal_offset) != (journal_id, journal_offset):
+            self.sync_journal()
+    
+    def sync_journal(self):
+        """Apply journal entries appended since the last sync (by any process); returns how many"""
+        if self.journal is None:
+            return 0
+        if self.journal.size() == self._journal_offset and self.journal.read_id() == self._journal_id:
+            return 0
+        with self._lock:
+            return self._replay_journal(self._journal_id, self._journal_offset)
+    
+    def _replay_journal(self, journal_id, offset):
+        """Apply the journal from a position, one generation per batch read; the caller holds self._lock"""
+        applied = 0
+        for entries, self._journal_id, self._journal_offset in self.journal.read(journal_id, offset):
+            if entries:
+                self._apply_translations(entries)
+                applied += len(entries)
+        self._journal_uncompacted += applied
+        return applied
+    
+    def compact_journal(self):
+        """
+        Write a snapshot that already contains every applied journal entry, so cold starts skip them,
+        then rotate the journal so it only keeps the latest entry per key.
+        
+        Returns: the snapshot path (None with the SQLite engine, whose journal is only rotated)
+        """
+        if self.journal is None or self._journal_id is None:
+            return None
+        with self._lock:
+            indexes = self._indexes.export()
+            position = {'journal': self._journal_id, 'offset': self._journal_offset}
+            self._journal_uncompacted = 0
+        path = None
+        if self.store is None:
+            # Generations are immutable, so the slow write happens outside the lock
+            indexes['journal_position'] = position
+            path = write_snapshot(indexes, self.csv_path, extra_sources=self.csv_paths[1:])
+            print(f"[JOURNAL] Compacted {self.journal.path} up to byte {position['offset']} into {path}")
+        # The SQLite store is compiled from the CSVs alone; its processes replay the rotated journal on start
+        self.journal.rotate(position['journal'], position['offset'])
+        return path
+    
+    def reload_dataset(self, force=False):
+        """
+        Re-read the CSV and swap in indexes for it without interrupting readers.
+        
+        Only keys from changed rows are rebuilt (see services.dataset_reload); requests
+        already running finish on the generation they started with. Runtime additions
+        are replayed from the journal on top of the new data.
+        
+        Returns: stats dict with 'reloaded', 'dataset_version', 'mode' and timing
+        """
+        started = time.perf_counter()
+        with self._lock:
+            current = self._indexes
+            version = self._dataset_version()
+            if version == current.dataset_version and not force:
+                return {'reloaded': False, 'dataset_version': version, 'mode': 'unchanged'}
+            if self.store is not None:
+                # Recompiled into a new file; requests still running keep reading the old one
+                self.store = open_store(self.csv_paths)
+                indexes, stats = self.store.indexes(self), {'mode': 'sqlite'}
+                indexes.dataset_version = version
+            else:
+                rows = self._load_csv_rows()
+                indexes, stats = rebuild_indexes(self, current, rows, version)
+            if indexes is None:
+                # Same rows (e.g. whitespace or line-ending edits): just record the new version
+                indexes = current.replace(dataset_version=version)
+            else:
+                self._freeze_rows(indexes)
+            self._indexes = indexes
+            if self.journal is not None:
+                self._replay_journal(None, 0)
+            self.cache.clear()
+        stats.update(reloaded=True, dataset_version=version, seconds=round(time.perf_counter() - started, 4))
+        print(f"[RELOAD] Dataset {current.dataset_version} -> {version} ({stats['mode']}) "
+              f"in {stats['seconds']:.3f}s")
+        self._measure_memory()
+        return stats
+    
+    def start_dataset_watcher(self, interval=5.0):
+        """Poll the CSVs' size/mtime in a daemon thread and reload them when one changes"""
+        def stat():
+            try:
+                return tuple((info.st_size, info.st_mtime_ns) for info in map(os.stat, self.csv_paths))
+            except OSError:
+                return None
+        
+        def watch():
+            last_seen = stat()
+            while True:
+                time.sleep(interval)
+                seen = stat()
+                if seen is None or seen == last_seen:
+                    continue
+                last_seen = seen
+                try:
+                    self.reload_dataset()
+                except Exception as e:
+                    print(f"[RELOAD] Error reloading {self.csv_path}: {e}")
+        
+        thread = threading.Thread(target=watch, name="translation-dataset-watcher", daemon=True)
+        thread.start()
+        return thread
+    
+    def start_journal_follower(self, interval=2.0):
+        """Tail the journal in a daemon thread so additions made by other workers show up here"""
+        if self.journal is None:
+            return None
+        
+        def follow():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.sync_journal()
+                except Exception as e:
+                    print(f"[JOURNAL] Error following {self.journal.path}: {e}")
+        
+        thread = threading.Thread(target=follow, name="translation-journal", daemon=True)
+        thread.start()
+        return thread
+    
+    def _apply_translations(self, entries):
+        """
+        Publish a new index generation with entries applied; the caller holds self._lock.
+        
+        Copy-on-write: only the dicts on the path to a changed entry are copied (once
+        per batch), the rest is shared with the current generation, and the result is
+        published in a single reference swap. Concurrent translate() calls see either
+        all of the change or none of it.
+        """
+        current = self._indexes
+        translation_db = dict(current.translation_db)
+        # Only directions already built need patching; the others are built from the new database
+        word_index = current.word_index.built()
+        fuzzy_indexes = dict(current.fuzzy_indexes)
+        similarity_indexes = dict(current.similarity_indexes)
+        suggest_indexes = dict(current.suggest_indexes)
+        folded_index = current.folded_index.built()
+        copied = set()  # Dicts already copied into this generation
+        
+        for entry in entries:
+            text_lower = entry['text']
+            source_lang = entry['source_lang']
+            target_lang = entry['target_lang']
+            translation = entry['translation']
+            is_new_key = text_lower not in current.translation_db.get(source_lang, {})
+            
+            if ('db', source_lang) not in copied:
+                # .copy() rather than dict(): a store's map copies only its in-memory changes
+                translation_db[source_lang] = translation_db.get(source_lang, {}).copy()
+                copied.add(('db', source_lang))
+            source_entries = translation_db[source_lang]
+            if ('entry', source_lang, text_lower) not in copied:
+                source_entries[text_lower] = dict(source_entries.get(text_lower, {}))
+                copied.add(('entry', source_lang, text_lower))
+            source_entries[text_lower][target_lang] = translation
+            
+            # Keep the word index in step with the database fallback it mirrors
+            words = word_index.get((source_lang, target_lang))
+            if words is not None and len(text_lower.split()) == 1:
+                if text_lower not in current.exact_index[(source_lang, target_lang)]:
+                    if ('words', source_lang, target_lang) not in copied:
+                        words = word_index[(source_lang, target_lang)] = words.copy()
+                        copied.add(('words', source_lang, target_lang))
+                    if translation and translation.strip():
+                        words[text_lower] = translation
+                    else:
+                        words.pop(text_lower, None)
+            
+            # A new word must become a correction candidate, so that typo index is rebuilt on demand
+            index = fuzzy_indexes.get(source_lang)
+            if index is not None and len(text_lower.split()) == 1 and text_lower not in index:
+                del fuzzy_indexes[source_lang]
+            # Likewise a new phrase must become a similarity candidate
+            if len(text_lower.split()) > 1 and is_new_key:
+                similarity_indexes.pop(source_lang, None)
+            # ...and any new key a completion
+            if is_new_key:
+                suggest_indexes.pop(source_lang, None)
+            
+            # ...and a new key must be found by its diacritic-free spelling
+            folded = folded_index.get(source_lang)
+            if folded is not None and is_new_key and ('folded key', source_lang, text_lower) not in copied:
+                if ('folded', source_lang) not in copied:
+                    folded = folded_index[source_lang] = folded.copy()
+                    copied.add(('folded', source_lang))
+                self._add_folded(folded, text_lower, source_lang)
+                copied.add(('folded key', source_lang, text_lower))
+        
+        word_index = current.word_index.derive(self._word_builder(current.exact_index, translation_db), word_index)
+        folded_index = current.folded_index.derive(self._folded_builder(translation_db), folded_index)
+        self._indexes = current.replace(translation_db=translation_db, word_index=word_index,
+                                        folded_index=folded_index, fuzzy_indexes=fuzzy_indexes,
+                                        similarity_indexes=similarity_indexes, suggest_indexes=suggest_indexes)
+        
+        # Cache keys carry the generation, so old results can no longer be served; free them
+        self.cache.clear()
+
+
+def _deep_sizeof(obj, seen=None):
+    """Approximate resident size of nested dicts/lists/strings in bytes"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _deep_sizeof(item, seen)
+    return size
+
+
+# =============================
+# SHARED INSTANCE
+# =============================
+# One warm service per process. Building it parses the whole dataset, so
+# request handlers must go through get_translation_service() instead of
+# constructing their own TranslationService.
+_shared_service = None
+_shared_lock = threading.Lock()
+
+
+def get_translation_service():
+    """Return the process-wide TranslationService, loading it on first use"""
+    global _shared_service
+    service = _shared_service
+    if service is None:
+        with _shared_lock:
+            if _shared_service is None:
+                # TRANSLATION_DATASETS lists the CSVs to merge (os.pathsep-separated, earlier ones win)
+                csv_paths = [path for path in os.getenv('TRANSLATION_DATASETS', DATASET_PATH).split(os.pathsep) if path] or [DATASET_PATH]
+                # TRANSLATION_JOURNAL=0 keeps runtime additions in memory only; any other value is a path
+                journal_path = os.getenv('TRANSLATION_JOURNAL', default_journal_path(csv_paths[0]))
+                # Published only once it is ready, so until then no other thread can use it
+                loaded = TranslationService(csv_path=csv_paths,
+                                            journal_path=None if journal_path == '0' else journal_path)
+                # Indexes are built per direction on first use; TRANSLATION_WARM_DIRECTIONS builds some
+                # up front instead ("english->bodo,english->mizo", or "all")
+                warm = os.getenv('TRANSLATION_WARM_DIRECTIONS', '')
+                if warm:
+                    directions = None if warm == 'all' else [tuple(direction.strip().split('->'))
+                                                             for direction in warm.split(',') if direction.strip()]
+                    seconds = loaded.warm_indexes(directions)
+                    print(f"[TRANSLATION] Warmed {warm} indexes in {seconds:.3f}s")
+                # Bulk workers fork now, before the threads below start (see services.batch_pool)
+                from services.batch_pool import start_batch_pool
+                start_batch_pool(loaded)
+                loaded.start_journal_follower(float(os.getenv('TRANSLATION_JOURNAL_POLL', '2')))
+                # TRANSLATION_RELOAD_POLL=0 turns off reloading when the CSV changes
+                reload_poll = float(os.getenv('TRANSLATION_RELOAD_POLL', '5'))
+                if reload_poll > 0:
+                    loaded.start_dataset_watcher(reload_poll)
+                print(f"[TRANSLATION] Shared service ready in {loaded.load_seconds:.3f}s")
+                _shared_service = loaded
+            service = _shared_service
+    return service
+
+
+def get_translation_status():
+    """Readiness probe for the shared service; never triggers a load"""
+    service = _shared_service
+    if service is None:
+        return {"ready": False}
+    return service.get_status()
@@ -0,0 +1,210 @@
+"""
+Incremental translation of growing live captions.
+
+The teacher's speech recognizer sends the whole transcript so far on every
+update. Re-translating it from scratch makes each update cost O(transcript).
+A session remembers the previous words, tokens and phrase segmentation per
+target; on the next update only the tail after the last stable phrase
+boundary is tokenized and segmented again, and the client receives just the
+segments that changed.
+
+Greedy longest-match never looks more than W tokens past a segment's start
+(W = longest phrase length). After an update with N tokens, the text before
+token K = N - W becomes the stable prefix. If the next update still starts
+with it, every segment starting at p with p + W <= K was decided by that
+prefix alone and is reused, and segmentation resumes where the last of them
+ended. If the recognizer revised anything inside the prefix, the session
+starts over.
+
+Typo correction looks up to W - 1 tokens to the right of a word, so the last
+W - 1 tokens of the stable prefix are corrected again on the next update, and
+the segments reused are those decided before them.
+
+The segments then go through the rest of translate() for the whole transcript
+(exact and folded matches, the closest dataset phrase), so every update gives
+what translate() gives for the same text. A new index generation (a runtime
+addition or a dataset reload) or a change in the detected source language
+starts the session over.
+"""
+
+import bisect
+import re
+import string
+import threading
+import time
+
+_WORD = re.compile(r'\S+')
+
+
+class TranslationSession:
+    """Translation state of one live class (one join code)"""
+
+    def __init__(self, service, source_lang, target_langs):
+        self.service = service
+        self.source_lang = source_lang  # As requested; None means auto-detect
+        self.target_langs = list(target_langs)
+        self.resolved_source = None
+        self.generation = None  # Index generation the segments were translated with
+        self.text = ''
+        self.words = []  # (char offset, original word) per token
+        self.tokens = []
+        self.segments = {target_lang: [] for target_lang in self.target_langs}
+        self.rendered = {target_lang: [] for target_lang in self.target_langs}  # Output text per segment
+        # Targets whose client holds one whole-text translation instead of the segments
+        self.sent_whole = {target_lang: False for target_lang in self.target_langs}
+        self.stable_chars = 0  # Text before this offset can no longer change any segment
+        self.lock = threading.Lock()
+        self.updated_at = time.time()
+
+    def update(self, text):
+        """
+        Translate the new transcript, reusing everything before the stable boundary.
+
+        Returns: {'reset', 'source_lang', 'retranslated_words', 'targets':
+                  {target: {'replace_from', 'segments', 'translation'}}}
+        """
+        with self.lock:
+            self.updated_at = time.time()
+            return self._update((text or '').strip())
+
+    def _update(self, text):
+        indexes = self.service.indexes  # One index generation for the whole update
+        resolved_source = self.service._resolve_source(text, self.source_lang, indexes) if text else self.source_lang
+        reset = (not self.stable_chars or text[:self.stable_chars] != self.text[:self.stable_chars]
+                 or indexes.generation != self.generation or resolved_source != self.resolved_source)
+        if reset:
+            self.resolved_source = resolved_source
+            self.generation = indexes.generation
+            keep_tokens = 0
+            self.stable_chars = 0
+        window = self.service.max_phrase_tokens(self.resolved_source, indexes)
+        if not reset:
+            # Corrections near the boundary looked at tokens after it, so those are redone too
+            keep_tokens = max(self._token_at(self.stable_chars) - (window - 1), 0)
+
+        # Only the unstable tail is tokenized and corrected again
+        resume_chars = self.words[keep_tokens][0] if keep_tokens < len(self.words) else self.stable_chars
+        del self.words[keep_tokens:]
+        del self.tokens[keep_tokens:]
+        for match in _WORD.finditer(text, resume_chars):
+            clean_word = match.group().lower().strip(string.punctuation)
+            if clean_word:
+                self.words.append((match.start(), match.group()))
+                self.tokens.append(clean_word)
+        context = max(keep_tokens - window, 0)  # Corrected tokens the first redone correction can see
+        self.tokens[context:] = self.service._correct_tokens(self.tokens[context:], self.resolved_source, indexes,
+                                                             start=keep_tokens - context)[0]
+        self.text = text
+
+        if len(self.tokens) <= window:
+            targets = self._translate_whole(text)
+            self.stable_chars = 0
+            return self._delta(reset, targets, len(self.tokens))
+
+        targets = {}
+        shared = {'kept_words': [word for _, word in self.words], 'tokens': self.tokens, 'walks': {}, 'segments': {}}
+        for target_lang in self.target_langs:
+            previous = self.segments[target_lang]
+            # Keep segments decided entirely by the unchanged prefix; redo the rest
+            keep = bisect.bisect_left(previous, (keep_tokens - window + 1,))
+            resume = previous[keep - 1][1] if keep else 0
+            tail = self.service._segment(self.tokens, self.resolved_source, target_lang, shared['walks'],
+                                         start=resume, indexes=indexes)
+            rendered_tail = [translation or self.words[start][1] for start, _, translation in tail]
+            del previous[keep:]
+            previous.extend(tail)
+            rendered = self.rendered[target_lang]
+            del rendered[keep:]
+            rendered.extend(rendered_tail)
+            shared['segments'][target_lang] = previous
+            translation = self._translate_full(text, target_lang, shared, indexes)
+            if translation != ' '.join(rendered):
+                # Answered as a whole (e.g. by a similar dataset phrase); the segments stay for reuse
+                targets[target_lang] = (0, [translation], translation)
+                self.sent_whole[target_lang] = True
+            elif self.sent_whole[target_lang]:
+                targets[target_lang] = (0, list(rendered), translation)
+                self.sent_whole[target_lang] = False
+            else:
+                targets[target_lang] = (keep, rendered_tail, translation)
+
+        # Any segment starting a full window before the end saw every token its match depends on
+        self.stable_chars = self.words[len(self.tokens) - window][0]
+        return self._delta(reset, targets, len(self.tokens) - keep_tokens)
+
+    def _translate_full(self, text, target_lang, shared, indexes):
+        """translate() of the whole transcript, with the session's tokens and segments"""
+        if self.resolved_source == target_lang:
+            return text
+        return self.service._translate_from(text, self.service._normalize_text(text), self.resolved_source,
+                                            target_lang, shared, indexes)[0]
+
+    def _translate_whole(self, text):
+        """Short transcripts may still be an exact dataset phrase, so translate them whole"""
+        targets = {}
+        for target_lang in self.target_langs:
+            translation = self.service.translate(text, self.resolved_source, target_lang) if text else ''
+            # Recorded as one unstable segment so the next update redoes it
+            self.segments[target_lang] = [(0, len(self.tokens), translation)] if self.tokens else []
+            self.rendered[target_lang] = [translation] if self.tokens else []
+            self.sent_whole[target_lang] = False
+            targets[target_lang] = (0, [translation] if self.tokens else [], translation)
+        return targets
+
+    def _token_at(self, char_offset):
+        """Index of the first token at or after char_offset"""
+        return bisect.bisect_left(self.words, (char_offset,))
+
+    def _delta(self, reset, targets, retranslated_words):
+        return {
+            'reset': reset,
+            'source_lang': self.resolved_source,
+            'retranslated_words': retranslated_words,
+            'targets': {
+                target_lang: {'replace_from': replace_from, 'segments': segments, 'translation': translation}
+                for target_lang, (replace_from, segments, translation) in targets.items()
+            }
+        }
+
+
+class TranslationSessionStore:
+    """Live sessions keyed by join code, with idle expiry and a size cap"""
+
+    def __init__(self, service_getter, max_sessions=500, idle_seconds=3 * 3600):
+        self._service_getter = service_getter
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def update(self, session_id, text, source_lang=None, target_langs=('bodo', 'mizo')):
+        """Apply a transcript update to a session, starting a new one if needed"""
+        return self._get(session_id, source_lang, target_langs).update(text)
+
+    def end(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _get(self, session_id, source_lang, target_langs):
+        service = self._service_getter()
+        source_lang = source_lang.lower() if source_lang else None
+        target_langs = [target_lang.lower() for target_lang in target_langs]
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if (session is None or session.service is not service or session.source_lang != source_lang
+                    or session.target_langs != target_langs):
+                self._expire()
+                session = self._sessions[session_id] = TranslationSession(service, source_lang, target_langs)
+            return session
+
+    def _expire(self):
+        now = time.time()
+        for session_id, session in list(self._sessions.items()):
+            if now - session.updated_at > self.idle_seconds:
+                del self._sessions[session_id]
+        while len(self._sessions) >= self.max_sessions:
+            oldest = min(self._sessions, key=lambda session_id: self._sessions[session_id].updated_at)
+            del self._sessions[oldest]
+
+    def __len__(self):
+        return len(self._sessions)
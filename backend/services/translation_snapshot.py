@@ -0,0 +1,160 @@
+"""
+Compiled binary snapshot of the translation dataset.
+
+Parsing classroom_dataset_complete.csv and building every lookup index is the
+bulk of a cold start. This module serialises the finished indexes into a single
+versioned file that TranslationService loads instead, falling back to the CSV
+whenever the snapshot is missing, from another format version, or built from a
+different CSV.
+
+Build it after editing the dataset (run from backend/):
+    python -m services.translation_snapshot build
+    python -m services.translation_snapshot check
+
+Snapshots are not committed (see .gitignore); the Vercel deploy builds one in
+backend/vercel.json's buildCommand and bundles it next to the CSV.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import struct
+import sys
+import time
+from datetime import datetime
+
+# Bump whenever the shape of any snapshotted index changes
+SNAPSHOT_VERSION = 7
+
+_MAGIC = b'CRTS'
+_HEADER = struct.Struct('>4sHI')  # magic, format version, JSON metadata length
+
+
+def default_snapshot_path(csv_path):
+    """Snapshot lives next to the CSV it was compiled from"""
+    return os.path.splitext(csv_path)[0] + '.snapshot'
+
+
+def fingerprint(csv_path):
+    """Size, mtime and content hash of the source CSV"""
+    stat = os.stat(csv_path)
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+
+
+def _read_metadata(f):
+    magic, version, metadata_length = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError('not a translation snapshot')
+    return version, json.loads(f.read(metadata_length).decode('utf-8'))
+
+
+def _is_fresh(metadata, csv_path, extra_sources=()):
+    """Every source CSV must be the one the snapshot was built from"""
+    recorded = metadata.get('extra_sources', [])
+    if [source.get('path') for source in recorded] != [os.path.abspath(path) for path in extra_sources]:
+        return False
+    return all(_source_is_fresh(source, path) for source, path in
+               [(metadata.get('source', {}), csv_path)] + list(zip(recorded, extra_sources)))
+
+
+def _source_is_fresh(source, csv_path):
+    """Cheap size/mtime check first; only hash the CSV when those disagree"""
+    if not os.path.exists(csv_path):
+        return False
+    stat = os.stat(csv_path)
+    if stat.st_size != source.get('size'):
+        return False
+    if stat.st_mtime_ns == source.get('mtime_ns'):
+        return True
+    return fingerprint(csv_path)['sha256'] == source.get('sha256')
+
+
+def write_snapshot(indexes, csv_path, snapshot_path=None, extra_sources=()):
+    """Serialise a dict of index name -> index for the given source CSV (plus any further CSVs merged in)"""
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    metadata = json.dumps({
+        'source': fingerprint(csv_path),
+        'extra_sources': [dict(fingerprint(path), path=os.path.abspath(path)) for path in extra_sources],
+        'created_at': datetime.utcnow().isoformat(),
+        'indexes': sorted(indexes)
+    }).encode('utf-8')
+
+    # Write to a temp file and rename so readers never see a partial snapshot
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(metadata)))
+        f.write(metadata)
+        pickle.dump(indexes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Durable before the rename: journal compaction drops entries once a snapshot holds them
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, snapshot_path)
+    return snapshot_path
+
+
+def load_snapshot(csv_path, snapshot_path=None, extra_sources=()):
+    """
+    Load precomputed indexes if the snapshot is current for csv_path and extra_sources.
+
+    Returns: dict of index name -> index, or None when the CSV must be parsed instead
+    """
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    if not os.path.exists(snapshot_path) or not os.path.exists(csv_path):
+        return None
+    try:
+        with open(snapshot_path, 'rb') as f:
+            version, metadata = _read_metadata(f)
+            if version != SNAPSHOT_VERSION:
+                print(f"[SNAPSHOT] Ignoring {snapshot_path}: format v{version}, expected v{SNAPSHOT_VERSION}")
+                return None
+            if not _is_fresh(metadata, csv_path, extra_sources):
+                print(f"[SNAPSHOT] Ignoring stale {snapshot_path}: CSV changed since it was built")
+                return None
+            indexes = pickle.load(f)
+    except Exception as e:
+        print(f"[SNAPSHOT] Error loading {snapshot_path}: {e}")
+        return None
+
+    print(f"[SNAPSHOT] Loaded indexes from {snapshot_path} (built {metadata.get('created_at')})")
+    return indexes
+
+
+def compile_snapshot(csv_path=None, snapshot_path=None):
+    """Parse the CSV (or list of CSVs), build every index and write the snapshot"""
+    from services.translation_service import DATASET_PATH, TranslationService
+
+    started = time.perf_counter()
+    service = TranslationService(csv_path=csv_path or DATASET_PATH, use_snapshot=False)
+    service.warm_indexes()  # A compiled snapshot carries every direction
+    path = write_snapshot(service.export_indexes(), service.csv_path, snapshot_path, service.csv_paths[1:])
+    elapsed = time.perf_counter() - started
+    print(f"[SNAPSHOT] Wrote {path} ({os.path.getsize(path)} bytes) in {elapsed:.3f}s")
+    return path
+
+
+def main(argv=None):
+    from services.translation_service import DATASET_PATH
+
+    parser = argparse.ArgumentParser(description="Compile the translation dataset into a binary snapshot")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--csv", nargs='+', default=[DATASET_PATH], help="source dataset CSV(s), in precedence order")
+    parser.add_argument("--output", default=None, help="snapshot path (default: next to the CSV)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        compile_snapshot(args.csv, args.output)
+        return 0
+
+    fresh = load_snapshot(args.csv[0], args.output, args.csv[1:]) is not None
+    print(f"[SNAPSHOT] {'up to date' if fresh else 'missing or stale'}")
+    return 0 if fresh else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Deterministic Latin-script keys for Bodo text.
+
+Students and teachers often type Bodo in Latin script ("nayni phormakhou
+kheo"), while the dataset spells it in Devanagari. romanize() turns
+Devanagari into Latin letters, dropping the inherent vowel where it is
+not pronounced. latin_key() then folds the spellings people use
+interchangeably - long and short vowels, ph/f, sh/s, w/o/ou/au for the
+Bodo vowel /ɯ/ - into one canonical key. The same function serves both sides:
+romanize() leaves Latin text untouched, so a dataset entry and a typed
+query meet at the same key. Nothing here depends on the dataset.
+"""
+
+import re
+import unicodedata
+
+_CONSONANTS = {
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'w', 'श': 'sh', 'ष': 'sh', 'स': 's', 'ह': 'h'
+}
+
+# Consonant + nukta (NFD splits precomposed forms such as 'ड़' into these pairs)
+_NUKTA_CONSONANTS = {'क': 'k', 'ख': 'kh', 'ग': 'g', 'ज': 'z', 'ड': 'r', 'ढ': 'rh', 'फ': 'f', 'य': 'y'}
+
+_VOWELS = {
+    'अ': 'a', 'आ': 'a', 'इ': 'i', 'ई': 'i', 'उ': 'u', 'ऊ': 'u', 'ऋ': 'ri',
+    'ए': 'e', 'ऐ': 'ai', 'ऑ': 'o', 'ओ': 'o', 'औ': 'ou'
+}
+
+_VOWEL_SIGNS = {
+    'ा': 'a', 'ि': 'i', 'ी': 'i', 'ु': 'u', 'ू': 'u', 'ृ': 'ri',
+    'ॅ': 'e', 'े': 'e', 'ै': 'ai', 'ॉ': 'o', 'ो': 'o', 'ौ': 'ou'
+}
+
+_VIRAMA = '्'
+_NUKTA = '़'
+_ANUSVARA = 'ं'
+_OTHER_MARKS = {'ँ': 'n', 'ः': 'h', '।': '.', '॥': '.'}
+_DIGITS = {chr(0x0966 + digit): str(digit) for digit in range(10)}
+
+# Anusvara is pronounced like the nasal of the consonant that follows it
+_LABIALS = set('पफबभम')
+_VELARS = set('कखगघ')
+
+# Interchangeable Latin spellings, folded in this order; w, ou and au all end up as o, which is
+# how Bodo's /ɯ/ is variously written ("nwng" / "नों")
+_FOLDS = (('ph', 'f'), ('sh', 's'), ('ee', 'i'), ('oo', 'u'), ('v', 'w'), ('ou', 'o'), ('au', 'o'), ('w', 'o'))
+_REPEATED_VOWELS = re.compile(r'([aeiou])\1+')
+_NOT_KEY = re.compile(r'[^a-z0-9 ]+')
+
+
+def romanize(text):
+    """Latin letters for the Devanagari in text; anything else is kept as it is"""
+    text = unicodedata.normalize('NFD', text)
+    out = []
+    after_vowel = False  # The previous syllable ended in a vowel (inherent or written)
+    position = 0
+    while position < len(text):
+        char = text[position]
+        if char in _CONSONANTS:
+            latin = _CONSONANTS[char]
+            following = position + 1
+            if following < len(text) and text[following] == _NUKTA:
+                latin = _NUKTA_CONSONANTS.get(char, latin)
+                following += 1
+            sign = text[following] if following < len(text) else ''
+            if sign in _VOWEL_SIGNS:
+                out.append(latin + _VOWEL_SIGNS[sign])
+                following += 1
+                after_vowel = True
+            elif sign == _VIRAMA:
+                out.append(latin)
+                following += 1
+                after_vowel = False
+            elif _silent_inherent_vowel(text, following, after_vowel, bool(out) and out[-1] != ' '):
+                out.append(latin)
+                after_vowel = False
+            else:
+                out.append(latin + 'a')
+                after_vowel = True
+            position = following
+            continue
+        if char in _VOWELS:
+            out.append(_VOWELS[char])
+            after_vowel = True
+        elif char == _ANUSVARA:
+            following = text[position + 1] if position + 1 < len(text) else ''
+            out.append('m' if following in _LABIALS else 'ng' if following in _VELARS or following not in _CONSONANTS
+                       else 'n')
+            after_vowel = False
+        elif char in _OTHER_MARKS or char in _DIGITS:
+            out.append(_OTHER_MARKS.get(char) or _DIGITS[char])
+            after_vowel = False
+        elif char != _NUKTA:
+            out.append(char)
+            after_vowel = False
+        position += 1
+    return ''.join(out)
+
+
+def _silent_inherent_vowel(text, following, after_vowel, in_word):
+    """
+    Whether a consonant's inherent 'a' goes unpronounced: at the end of a word of more than
+    one syllable ("बिहान" = bihan), or between vowels and a consonant carrying its own vowel
+    sign ("नायनि" = nayni, not nayani).
+    """
+    next_char = text[following] if following < len(text) else ''
+    if next_char not in _CONSONANTS and next_char not in _VOWEL_SIGNS and next_char not in (_ANUSVARA, _NUKTA):
+        return in_word
+    if not after_vowel or next_char not in _CONSONANTS:
+        return False
+    after = following + 1
+    if after < len(text) and text[after] == _NUKTA:
+        after += 1
+    return after < len(text) and text[after] in _VOWEL_SIGNS
+
+
+def latin_key(text):
+    """Canonical lowercase ASCII key of Devanagari or Latin Bodo text; equal keys mean the same spelling"""
+    text = unicodedata.normalize('NFKD', romanize(text.lower()))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = ' '.join(_NOT_KEY.sub(' ', text).split())
+    for variant, canonical in _FOLDS:
+        text = text.replace(variant, canonical)
+    return _REPEATED_VOWELS.sub(r'\1', text)
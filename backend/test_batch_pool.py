@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Batch pool test: workers forked once keep up with runtime additions and CSV reloads.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.batch_pool as batch_pool
+import services.translation_service as translation_service
+from services.batch_pool import BatchPool, get_batch_pool
+from services.translation_indexes import key_label
+from services.translation_service import DATASET_PATH, LAZY_INDEXES, TranslationService
+
+TARGETS = ['bodo', 'mizo']
+
+
+def test_workers_follow_new_data_without_refork():
+    """Pooled results equal in-process ones after an addition and a reload, on the same workers"""
+    workdir = tempfile.mkdtemp()
+    pool = None
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        shutil.copy(DATASET_PATH, csv_path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            texts = [key for key in ts.translation_db['english'] if key][:300]
+            texts += ['blorpword', 'close the window please', 'open your notebooks blorpword']
+            pool = BatchPool(ts, workers=2, threshold=1)
+            pool.start()
+            workers = set(pool._pool._processes)
+            assert len(workers) == 2
+
+            assert pool.translate_batch(texts, 'english', TARGETS) == ts.translate_batch(texts, 'english', TARGETS)
+            ts.add_translation('blorpword', 'english', 'mizo', 'Blorp')
+            with open(csv_path, 'a', encoding='utf-8') as f:
+                f.write('99001,Close the window please,खिरकिखौ बन्द खालाम,Tukverh khar rawh,instruction\n')
+            ts.reload_dataset()
+            pooled = pool.translate_batch(texts, 'english', TARGETS)
+            expected = ts.translate_batch(texts, 'english', TARGETS)
+
+        assert pooled == expected
+        assert expected[-2]['translations']['mizo'] == 'Tukverh khar rawh'
+        assert expected[-3]['translations']['mizo'] == 'Blorp'
+        assert set(pool._pool._processes) == workers
+        print(f"✓ {len(texts)} texts match in-process translation on the same {len(workers)} workers")
+    finally:
+        if pool is not None:
+            pool.close()
+        shutil.rmtree(workdir)
+
+
+def test_default_service_starts_no_pool():
+    """The shared service keeps every direction pending and forks nothing unless workers are configured"""
+    workdir = tempfile.mkdtemp()
+    settings = {'TRANSLATION_DATASETS': os.path.join(workdir, 'dataset.csv'),
+                'TRANSLATION_JOURNAL': '0', 'TRANSLATION_RELOAD_POLL': '0'}
+    saved = {name: os.environ.get(name) for name in settings}
+    try:
+        shutil.copy(DATASET_PATH, settings['TRANSLATION_DATASETS'])
+        os.environ.update(settings)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = translation_service.get_translation_service()
+            pool = get_batch_pool()
+
+        assert batch_pool.BATCH_WORKERS == 0
+        assert pool.service is ts and pool._pool is None
+        lazy = ts.get_status()['lazy_indexes']
+        for name in LAZY_INDEXES:
+            assert lazy[name]['pending'] == [key_label(key) for key in getattr(ts.indexes, name)]
+            assert lazy[name]['build_seconds'] == {}
+        print("✓ Default service forks no workers and builds no direction")
+    finally:
+        translation_service._shared_service = None
+        batch_pool._shared_pool = None
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_workers_follow_new_data_without_refork()
+    test_default_service_starts_no_pool()
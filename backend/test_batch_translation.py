@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Batch translation test: `found` reports dataset coverage, not just a non-empty result.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+
+TEXTS = ["xyzzy qqq", "zzq", "Good morning", "good morning ", "good morning zzq",
+         "open your notebooks and write this down"]
+
+
+def test_found_means_covered_by_the_dataset():
+    """Unknown words are echoed back but never reported as found, cached or not"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        first = ts.translate_batch(TEXTS, 'english', ['bodo', 'mizo'])
+        again = ts.translate_batch(TEXTS, 'english', ['bodo', 'mizo'])  # Served from the result cache
+        streamed = list(ts.translate_stream(TEXTS, 'english', ['bodo', 'mizo']))
+
+    expected = [False, False, True, True, False, True]
+    for results in (first, again, streamed):
+        assert [result['found'] == {'bodo': covered, 'mizo': covered}
+                for result, covered in zip(results, expected)] == [True] * len(TEXTS), results
+    assert first[0]['translations'] == {'bodo': 'xyzzy qqq', 'mizo': 'xyzzy qqq'}
+    assert first[2]['translations'] == first[3]['translations']
+    assert ts.cache.stats()['hits'] > 0
+    print(f"✓ found matches dataset coverage for {len(TEXTS)} texts")
+
+
+if __name__ == "__main__":
+    test_found_means_covered_by_the_dataset()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Bulk translation test: caption files keep every cue number, timing line and blank line.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.batch_pool import BatchPool
+from services.bulk_translate import BulkStats, translate_file
+from services.translation_service import TranslationService
+
+LESSON_VTT = """WEBVTT
+
+NOTE opening of the lesson
+
+intro
+00:00.000 --> 00:02.000 align:start
+Good morning
+Thank you
+
+00:02.500 --> 00:04.000
+Good morning
+
+00:04.500 --> 00:06.000
+Good morning zzqx
+"""
+
+# Caption text lines; the last is only partly covered by the dataset
+CAPTIONS = ('Good morning', 'Thank you', 'Good morning zzqx')
+
+
+def test_captions_keep_structure():
+    """Only caption text lines change; a window smaller than the file gives the same output; coverage is exact"""
+    workdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(workdir, 'lesson.vtt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(LESSON_VTT)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(use_snapshot=False)
+            pool = BatchPool(ts, workers=0)
+            stats = BulkStats(['mizo'])
+            written = translate_file(pool, path, 'english', ['mizo'], stats, window=1)
+        with open(written[0], 'r', encoding='utf-8') as f:
+            translated = f.read()
+
+        expected = ''.join(ts.translate(line.strip(), 'english', 'mizo') + '\n' if line.strip() in CAPTIONS else line
+                           for line in LESSON_VTT.splitlines(keepends=True))
+        assert translated == expected, translated
+        # The partly covered line is written, but not counted as translated
+        assert stats.lines == 4 and stats.translated['mizo'] == 3
+        assert '3/4 lines translated (75.0%)' in stats.report(1.0)
+        print(f"✓ {written[0]} keeps every cue and timing line")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_captions_keep_structure()
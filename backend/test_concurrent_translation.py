@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Stress test: translate() from many threads while add_translation() keeps writing.
+
+Readers must only ever see a complete index generation - an added entry is
+either fully there or not there at all, and unrelated translations never change.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+
+READERS = 8
+WRITES = 300
+STABLE_TEXTS = [
+    ("good morning", "english", "bodo"),
+    ("please open your books", "english", "mizo"),
+    ("open your notebooks and write this down", "english", "bodo"),
+    ("दङ", "bodo", "english"),
+    ("hei", "mizo", "english"),
+]
+
+
+def test_concurrent_translate_and_add():
+    """Hammer translate() from several threads while entries are added and replaced"""
+    switch_interval = sys.getswitchinterval()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService()
+        expected = {case: ts.translate(*case) for case in STABLE_TEXTS}
+        ts.add_translation("zorbleflux", "english", "bodo", "value-0")
+
+        errors = []
+        done = threading.Event()
+
+        def reader():
+            while not done.is_set():
+                try:
+                    for case, translation in expected.items():
+                        if ts.translate(*case) != translation:
+                            errors.append(f"{case} changed")
+                    value = ts.translate("zorbleflux", "english", "bodo")
+                    if value not in ("value-0", "value-1"):
+                        errors.append(f"toggled word read as {value!r}")
+                    # A runtime entry is either absent or complete
+                    indexes = ts.indexes
+                    for key, entry in list(indexes.translation_db["english"].items())[-5:]:
+                        if key.startswith("stressword") and entry.get("mizo") != key.upper():
+                            errors.append(f"half-added entry {key}: {entry!r}")
+                except Exception as e:
+                    errors.append(repr(e))
+
+        def writer():
+            for n in range(WRITES):
+                ts.add_translation("zorbleflux", "english", "bodo", f"value-{n % 2}")
+                ts.add_translation(f"stressword{n}", "english", "mizo", f"STRESSWORD{n}")
+            done.set()
+
+        sys.setswitchinterval(1e-5)  # Force frequent thread switches
+        try:
+            threads = [threading.Thread(target=reader) for _ in range(READERS)]
+            threads.append(threading.Thread(target=writer))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=120)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    assert not errors, errors[:5]
+    assert ts.translate(f"stressword{WRITES - 1}", "english", "mizo") == f"STRESSWORD{WRITES - 1}"
+    print(f"✓ {READERS} readers, {WRITES * 2} writes, generation {ts.indexes.generation}")
+
+
+if __name__ == "__main__":
+    test_concurrent_translate_and_add()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Ingest test: several CSV sources load in one pass, earlier sources win, and the report says why.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+SCIENCE = [
+    ('1', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),
+    ('2', 'Sit down', 'फुं', 'Thu rawh'),
+    ('3', '', '?', '?'),  # Placeholders only
+    ('4', '', '', ''),
+]
+MATHS = [
+    ('10', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),  # Duplicate of science row 1
+    ('11', 'Sit down', 'फुं', 'Tho rawh'),  # Conflicts with science row 2, which keeps winning
+    ('12', 'Count to ten', 'जि सिम सान', 'Sawm thleng chhiar rawh'),
+]
+
+
+def _write(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(DATASET_COLUMNS)
+        writer.writerows(row + ('instruction',) for row in rows)
+
+
+def test_sources_ingest_in_order_with_report():
+    """Rows from every source are served; repeats and skips are counted per source and overall"""
+    workdir = tempfile.mkdtemp()
+    try:
+        paths = [os.path.join(workdir, name) for name in ('science.csv', 'maths.csv', 'missing.csv')]
+        _write(paths[0], SCIENCE)
+        _write(paths[1], MATHS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(paths, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert ts.translate('Count to ten', 'english', 'mizo') == 'Sawm thleng chhiar rawh'
+            assert ts.translate('Sit down', 'english', 'mizo') == 'Thu rawh'
+            assert ts.translate('फुं', 'bodo', 'mizo') == 'Thu rawh'
+        report = ts.load_report
+
+        assert [(source['rows_read'], source['rows_loaded']) for source in report['sources']] == [(4, 2), (3, 3), (0, 0)]
+        assert report['sources'][2]['error'] == 'file not found'
+        assert report['skipped'] == {'empty': 1, 'placeholder_only': 1}
+        assert (report['rows_read'], report['rows_loaded']) == (7, 5)
+        # "Open the door" repeats in every language; "Sit down" only conflicts once its Mizo differs
+        assert report['duplicates'] == {'english': 1, 'bodo': 1, 'mizo': 1}
+        assert report['conflicts'] == {'english': 1, 'bodo': 1, 'mizo': 0}
+        sample = report['conflict_samples'][0]
+        assert (sample['kept']['translation'], sample['shadowed']['translation']) == ('Thu rawh', 'Tho rawh')
+        assert sample['shadowed']['at'] == 'maths.csv:3'
+        print(f"✓ {report['rows_loaded']} rows from {len(paths)} sources, repeats reported")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_sources_ingest_in_order_with_report()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Hot reload test: indexes patched from only the changed CSV rows must equal a full rebuild.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, DATASET_PATH, TranslationService
+
+
+def _trie_phrases(trie):
+    """{token tuple: {target: translation}} for every phrase stored in a PhraseTrie"""
+    phrases = {}
+    stack = [((), trie.root)]
+    while stack:
+        tokens, node = stack.pop()
+        for token, child in node.items():
+            if token == trie._VALUE:
+                phrases[tokens] = child
+            else:
+                stack.append((tokens + (token,), child))
+    return phrases
+
+
+def _edit_rows(rows):
+    """A teacher's typical edit: fix a translation, drop a row, add a couple of new ones"""
+    rows = [dict(row) for row in rows]
+    rows[10]['Bodo'] = 'बिदिनथि सुद्रायनाय'
+    rows[25]['English'] = rows[3]['English']  # Now a duplicate key; the earlier row must still win
+    del rows[40]
+    rows.insert(60, {'ID': '99001', 'English': 'Close the window please', 'Bodo': 'खिरकिखौ बन्द खालाम',
+                     'Mizo': 'Tukverh khar rawh', 'Category': 'instruction'})
+    rows.insert(61, {'ID': '99002', 'English': 'window', 'Bodo': 'खिरकि', 'Mizo': 'Tukverh',
+                     'Category': 'vocabulary'})
+    return rows
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=DATASET_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_incremental_reload_matches_full_build():
+    """Reloading an edited CSV patches the live indexes to exactly what a fresh load builds"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(DATASET_PATH, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        _write_csv(csv_path, rows)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path=csv_path, use_snapshot=False)
+            old_indexes = ts.indexes
+            old_version = ts.dataset_version
+            before = ts.translate("Close the window please", "english", "mizo")
+
+            _write_csv(csv_path, _edit_rows(rows))
+            stats = ts.reload_dataset()
+            fresh = TranslationService(csv_path=csv_path, use_snapshot=False)
+
+        assert stats['reloaded'] and stats['mode'] == 'incremental', stats
+        assert ts.dataset_version == fresh.dataset_version != old_version
+        reloaded = ts.indexes
+        assert reloaded.translation_db == fresh.translation_db
+        assert reloaded.exact_index == fresh.exact_index
+        assert reloaded.word_index == fresh.word_index
+        assert reloaded.token_index == fresh.token_index
+        for source_lang, trie in fresh.phrase_tries.items():
+            assert _trie_phrases(reloaded.phrase_tries[source_lang]) == _trie_phrases(trie), source_lang
+
+        # The old generation is untouched for requests still using it
+        assert old_indexes.exact_index[('english', 'mizo')].get('close the window please') is None
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert ts.translate("Close the window please", "english", "mizo") == "Tukverh khar rawh" != before
+            assert ts.reload_dataset()['reloaded'] is False
+        print(f"✓ Incremental reload ({stats['removed_rows']} rows out, {stats['added_rows']} in) "
+              f"matches a full rebuild")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_incremental_reload_matches_full_build()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Exact index test: a key repeated across rows translates as the earliest row with a usable cell.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Good morning', 'सुबुं बिहान', '?'),  # No Mizo: a later row's Mizo is used
+    ('2', ' GOOD MORNING ', 'बिहान', 'Zing tlâm ṭha'),  # Same key once trimmed and lowercased
+    ('3', 'Good morning!', 'सुबुं', 'Chibai'),  # Punctuation makes it another key
+    ('4', 'Good morning', 'मोजां', 'Zing ṭha'),
+    ('5', 'Stand up', 'दिं', 'Ding rawh'),
+    ('6', 'Stand up', 'दिं', 'Tho rawh'),
+]
+
+
+def test_earliest_row_wins():
+    """Duplicated English keys take the first usable row per target, as the row scan did"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('instruction',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert ts.translate('Good Morning', 'english', 'bodo') == 'सुबुं बिहान'
+            assert ts.translate('  good morning ', 'english', 'mizo') == 'Zing tlâm ṭha'
+            assert ts.translate('Good morning!', 'english', 'mizo') == 'Chibai'
+            assert ts.translate('stand up', 'english', 'mizo') == 'Ding rawh'
+            # The other way round the first row for a Bodo key wins too
+            assert ts.translate('दिं', 'bodo', 'mizo') == 'Ding rawh'
+            assert ts.translate('दिं', 'bodo', 'english') == 'Stand up'
+        print("✓ The earliest usable row wins for duplicated keys")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_earliest_row_wins()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Folded lookup test: Mizo typed without diacritics finds the dataset entry, ambiguous spellings are reported.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Good', '', 'Ṭha'),
+    ('2', 'Thank you', '', 'Ka lâwm e'),
+    ('3', 'Happy', '', 'Lâwm'),
+    ('4', 'Pleased', '', 'Làwm'),  # Folds to "lawm" too; row 3 comes first
+    ('5', 'Agree', '', 'Pawm'),
+]
+
+
+def test_mizo_without_diacritics():
+    """Plain-letter input gets the entry's translation and is detected as Mizo; typed spellings win"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('vocabulary',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert ts.translate('tha', 'mizo', 'english') == 'Good'
+            assert ts.translate('Ka lawm e', 'mizo', 'english') == 'Thank you'
+            assert ts.translate('tha', None, 'english') == 'Good'
+            assert ts.detect_language('ka lawm e')['language'] == 'mizo'
+            # Folded spellings shared by two entries go to the first row; an exact spelling to its own
+            assert ts.translate('lawm', 'mizo', 'english') == 'Happy'
+            assert ts.translate('làwm', 'mizo', 'english') == 'Pleased'
+            ambiguous = ts.get_status()['folded_ambiguous']['mizo']
+
+        assert ambiguous == {'count': 1, 'samples': [{'folded': 'lawm', 'keys': ['lâwm', 'làwm']}]}
+        print("✓ Mizo without diacritics finds its entries")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_mizo_without_diacritics()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Detection test: English words that Mizo cells borrow, or Bodo cells keep in Latin script, stay English.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+
+# English cells of the dataset that Bodo cells also hold in Latin script
+BODO_LATIN_WORDS = ['empty', 'cook', 'outside', 'inside', 'left']
+# English cells whose words appear more often in Mizo cells
+MIZO_SHARED_WORDS = ['I', 'a', 'in', 'group', 'phone', 'Board', 'Classroom']
+
+
+def test_detection_by_script_and_vote():
+    """Shared Latin words lean English; Devanagari is Bodo; Mizo with diacritics is Mizo"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        for word in BODO_LATIN_WORDS + MIZO_SHARED_WORDS:
+            assert ts.detect_language(word)['language'] == 'english', word
+        assert ts.translate('empty', None, 'english') == 'empty'
+        assert ts.translate('empty', None, 'bodo') == ts.translate('empty', 'english', 'bodo')
+
+        assert ts.detect_language('नमस्कार, बेयो मा?') == {'language': 'bodo', 'confidence': 1.0}
+        sentence = "Naupangte u, in lehkhabu ṭha takin chhiar rawh"
+        assert ts._normalize_text(sentence) not in ts.translation_db['mizo']
+        assert ts.detect_language(sentence)['language'] == 'mizo'
+        # A Mizo sentence built from shared words still outvotes English
+        assert ts.detect_language("I phone dah rawh")['language'] == 'mizo'
+    print(f"✓ {len(BODO_LATIN_WORDS + MIZO_SHARED_WORDS)} shared words detected as English")
+
+
+if __name__ == "__main__":
+    test_detection_by_script_and_vote()
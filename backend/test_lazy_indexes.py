@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Lazy index test: a direction is built on its first request, and runtime additions reach unbuilt ones too.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_indexes import key_label
+from services.translation_service import DIRECTIONS, LAZY_INDEXES, TranslationService
+
+
+def _built(ts):
+    """{index name: keys built so far, by the status's pending lists}"""
+    lazy = ts.get_status()['lazy_indexes']
+    return {name: sorted(set(map(key_label, getattr(ts.indexes, name))) - set(lazy[name]['pending']))
+            for name in LAZY_INDEXES}
+
+
+def test_directions_build_on_first_use():
+    """Only english->mizo and the English phrase trie are built; additions patch built directions only"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        status = ts.get_status()['lazy_indexes']
+        assert all(status[name]['build_seconds'] == {} for name in LAZY_INDEXES)
+        assert len(status['exact_index']['pending']) == len(DIRECTIONS)
+
+        assert ts.translate("Please open your notebooks quickly", 'english', 'mizo')
+        # The English phrase trie holds the English phrases of every target, so it reads english->bodo too
+        english = ['english->bodo', 'english->mizo']
+        assert _built(ts) == {'exact_index': english, 'pivot_provenance': english,
+                              'word_index': ['english->mizo'], 'phrase_tries': ['english'], 'folded_index': []}
+        build_seconds = ts.get_status()['lazy_indexes']['word_index']['build_seconds']
+        assert list(build_seconds) == ['english->mizo'] and build_seconds['english->mizo'] >= 0
+
+        ts.add_translation('blorpword', 'english', 'mizo', 'Blorp')
+        ts.add_translation('blorpword', 'english', 'bodo', 'ब्लर्प')
+        # The new generation carries the built direction, patched, and builds nothing else
+        assert _built(ts)['word_index'] == ['english->mizo']
+        assert ts.indexes.word_index.built()[('english', 'mizo')]['blorpword'] == 'Blorp'
+        assert 'english->bodo' in ts.get_status()['lazy_indexes']['word_index']['pending']
+
+        assert ts.translate('blorpword', 'english', 'bodo') == 'ब्लर्प'
+        assert ts.translate('open blorpword', 'english', 'bodo').endswith('ब्लर्प')
+        assert ts.indexes.word_index.built()[('english', 'bodo')]['blorpword'] == 'ब्लर्प'
+        assert 'english->bodo' in ts.get_status()['lazy_indexes']['word_index']['build_seconds']
+    print("✓ Directions build on first use and pick up earlier additions")
+
+
+if __name__ == "__main__":
+    test_directions_build_on_first_use()
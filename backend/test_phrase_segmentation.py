@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Segmentation test: sentences split into the longest known dataset phrases, left to right.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Open', 'खेव', 'Hawng'),
+    ('2', 'Door', 'दरजा', 'Kawngkhar'),
+    ('3', 'Open the', 'खेव बे', 'Hawng ang'),
+    ('4', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),
+    ('5', 'The door is red', 'दरजाआ गोजा', 'Kawngkhar a sen'),
+    ('6', 'Red', 'गोजा', 'Sen'),
+]
+
+
+def test_longest_phrases_win():
+    """Known phrases inside a sentence stay whole, the longer of two overlapping ones wins, unknown words pass"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('instruction',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            tokens = ['zzq', 'open', 'the', 'door', 'is', 'red', 'blorp']
+            # "open the door" beats "open the" and "open"; "the door is red" starts inside it, so only "red" is left
+            assert ts._segment(tokens, 'english', 'mizo') == [
+                (0, 1, ''), (1, 4, 'Kawngkhar hawng rawh'), (4, 5, ''), (5, 6, 'Sen'), (6, 7, '')]
+            assert ts._segment(['the', 'door', 'is', 'red'], 'english', 'mizo') == [(0, 4, 'Kawngkhar a sen')]
+            assert ts._segment(['open', 'the', 'red'], 'english', 'bodo') == [(0, 2, 'खेव बे'), (2, 3, 'गोजा')]
+
+            assert ts.translate('Zzq, open the DOOR is red Blorp!', 'english', 'mizo') == \
+                'Zzq, Kawngkhar hawng rawh is Sen Blorp!'
+            assert ts.translate('Zzq the door is red', 'english', 'bodo') == 'Zzq दरजाआ गोजा'
+            assert ts.translate('door blorp', 'english', 'mizo') == 'Kawngkhar blorp'
+        print("✓ Longest dataset phrases win, unknown words pass through")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_longest_phrases_win()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Similar-phrase test: a paraphrase is answered with a dataset phrase only when it says the same thing.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.phrase_similarity as phrase_similarity
+from services.phrase_similarity import PhraseSimilarityIndex
+from services.translation_service import TranslationService
+
+
+def test_similar_phrase_must_cover_the_sentence():
+    """Reordered words match and are flagged; a negation or an extra word falls back to word-by-word"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        texts = ["notebooks your open", "don't open your notebooks", "open your notebooks zzq"]
+        reordered, negated, extra = ts.translate_batch(texts, 'english', ['mizo'])
+        expected = ts.translate("open your notebooks", 'english', 'mizo')
+
+    assert reordered['translations']['mizo'] == expected
+    assert reordered['approximate'] == {'mizo': True}
+    assert reordered['matched_phrase'] == {'mizo': 'open your notebooks'}
+    for result in (negated, extra):
+        assert result['translations']['mizo'] != expected
+        assert result['approximate'] == {'mizo': False} and result['matched_phrase'] == {'mizo': None}
+        assert result['found'] == {'mizo': False}
+    assert extra['translations']['mizo'].endswith(' zzq')
+    print("✓ Only paraphrases that keep the meaning are answered with a dataset phrase")
+
+
+def test_ties_keep_dataset_order():
+    """Phrases tied on score rank in dataset order, with and without NumPy"""
+    # Each suffix is unique down to its trigrams, so every phrase scores the same against "xy"
+    phrases = [f"xy {chr(0x4e00 + 2 * i)}{chr(0x4e01 + 2 * i)}" for i in range(1000)]
+    numpy = phrase_similarity.np
+    try:
+        for np in {numpy, None}:
+            phrase_similarity.np = np
+            for ordered in (phrases, phrases[::-1]):
+                ranked = PhraseSimilarityIndex(ordered).top_k(['xy'], k=5)[0]
+                assert len({score for _, score in ranked}) == 1
+                assert [key for key, _ in ranked] == ordered[:5]
+    finally:
+        phrase_similarity.np = numpy
+    print("✓ Tied phrases keep dataset order")
+
+
+if __name__ == "__main__":
+    test_similar_phrase_must_cover_the_sentence()
+    test_ties_keep_dataset_order()
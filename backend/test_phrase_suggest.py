@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Suggest test: completions rank used phrases first, then dataset frequency, then shorter phrases.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.phrase_suggest import PhraseUsage, PrefixIndex
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Open your books', 'नायनि किताबखौ खेव', 'I lehkhabu hawng rawh'),
+    ('2', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),
+    ('3', 'Open', 'खेव', 'Hawng'),
+    ('4', 'Opening prayer', 'गिबि आरज', 'Tawngtaina'),
+    ('5', 'Open your books', 'नायनि किताबखौ खेवनो', 'In lehkhabu hawng rawh'),  # Second row of the same phrase
+    ('6', 'Close the door', 'दरजाखौ बन्द खालाम', 'Kawngkhar khar rawh'),
+]
+
+
+def _texts(suggestions):
+    return [suggestion['text'] for suggestion in suggestions]
+
+
+def test_suggest_ranking():
+    """Frequency and length order completions until teachers' usage overrides them"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('instruction',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert _texts(ts.suggest('Op', k=3)) == ['open your books', 'open', 'open the door']
+            # A trailing space only continues with a new word
+            assert _texts(ts.suggest('open ')) == ['open your books', 'open the door']
+            assert ts.suggest('close', target_langs=['mizo']) == [
+                {'text': 'close the door', 'uses': 0, 'translations': {'mizo': 'Kawngkhar khar rawh'}}]
+            assert ts.suggest('zz') == [] and ts.suggest('') == []
+
+            assert ts.record_phrase_use('Opening prayer', 'english')
+            assert ts.record_phrase_use('opening prayer ', 'english')
+            assert not ts.record_phrase_use('opening hymn', 'english')
+            suggestions = ts.suggest('op', k=2)
+            assert ts.get_status()['phrase_uses']['english'] == 2
+        assert _texts(suggestions) == ['opening prayer', 'open your books']
+        assert suggestions[0]['uses'] == 2
+        print("✓ Suggestions ranked by usage, then frequency, then length")
+    finally:
+        shutil.rmtree(workdir)
+
+
+def test_prefix_index_matches_scan():
+    """Random prefixes over the real dataset give what a full sort of the matching phrases gives"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        index = ts._suggest_index('english')
+    rng = random.Random(5)
+    for _ in range(300):
+        phrase = rng.choice(index.phrases)
+        prefix = phrase[:rng.randint(1, min(len(phrase), 6))]
+        matching = [p for p in index.phrases if p.startswith(prefix)]
+        expected = sorted(matching, key=lambda p: (-index.counts[p], len(p), p))[:8]
+        assert index.top(prefix, 8) == expected, prefix
+    assert PrefixIndex({}).top('a', 8) == []
+    print("✓ 300 prefixes match a full scan")
+
+
+def test_usage_snapshot_during_records():
+    """Counts read while other threads record new phrases never fail mid-read and end at the full total"""
+    usage = PhraseUsage()
+    go = threading.Event()
+
+    def record(worker):
+        go.wait()
+        for i in range(20000):
+            usage.record(f'phrase {worker} {i}')
+
+    threads = [threading.Thread(target=record, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    totals = []
+    go.set()
+    while any(thread.is_alive() for thread in threads):
+        totals.append(sum(usage.snapshot().values()))
+    for thread in threads:
+        thread.join()
+    assert totals == sorted(totals)
+    assert sum(usage.snapshot().values()) == 80000
+    print(f"✓ {len(totals)} snapshots taken during 80000 concurrent records")
+
+
+if __name__ == "__main__":
+    test_suggest_ranking()
+    test_prefix_index_matches_scan()
+    test_usage_snapshot_during_records()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Pivot test: Bodo<->Mizo gaps are filled through the row's English cell, never over a direct entry.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),
+    ('2', 'Open the door', 'दरजा खेवना', '?'),  # No Mizo cell: pivots through "open the door"
+    ('3', 'Go home', '?', 'In haw rawh'),
+    ('4', 'Go home', 'न सिम थां', ''),  # Bodo for row 3's Mizo, and the other way round
+    ('5', 'Sit down', 'फुं', '?'),  # English has no Mizo anywhere: stays untranslated
+    ('6', 'Stand up', 'दिं', 'Ding rawh'),
+    ('7', 'Rise', 'दिं', 'Tho rawh'),  # Bodo "दिं" already has a direct Mizo entry from row 6
+]
+
+
+def test_pivots_fill_only_gaps():
+    """Every gap with an English route is filled and recorded as a pivot; direct entries win"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('instruction',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert ts.translate('दरजा खेवना', 'bodo', 'mizo') == 'Kawngkhar hawng rawh'
+            assert ts.translate('In haw rawh', 'mizo', 'bodo') == 'न सिम थां'
+            assert ts.translate('न सिम थां', 'bodo', 'mizo') == 'In haw rawh'
+            assert ts.translate('दिं', 'bodo', 'mizo') == 'Ding rawh'
+            assert ts.translate('फुं', 'bodo', 'mizo') == ''
+            provenance = ts._indexes.pivot_provenance
+
+        assert provenance[('bodo', 'mizo')] == {ts._normalize_text(bodo): 'english'
+                                                for bodo in ('दरजा खेवना', 'न सिम थां')}
+        assert provenance[('mizo', 'bodo')] == {'in haw rawh': 'english'}
+        assert provenance[('english', 'mizo')] == {}
+        print("✓ Pivots fill Bodo<->Mizo gaps only")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_pivots_fill_only_gaps()
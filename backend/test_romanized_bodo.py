@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Romanized Bodo test: Latin-script Bodo, spelled any of the usual ways, is detected and translated.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+from services.transliteration import latin_key
+
+# Dataset Bodo phrase -> ways people type it in Latin script
+SPELLINGS = {
+    'नायनि फोरमाखौ खेव': ['nayni phormakhou khew', 'Nayni Formakho Kheo'],
+    'अननानै फुं': ['annanai phung', 'annanai fung'],
+    'गासै दिंना': ['gasai dinna'],
+}
+
+
+def test_romanized_input_finds_devanagari_entries():
+    """Every spelling gets the Devanagari entry's translations, with or without a given source"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        for bodo, spellings in SPELLINGS.items():
+            english = ts.translate(bodo, 'bodo', 'english')
+            mizo = ts.translate(bodo, 'bodo', 'mizo')
+            assert english and mizo
+            for text in spellings:
+                assert latin_key(text) == latin_key(bodo), text
+                assert ts.detect_language(text)['language'] == 'bodo', text
+                assert ts.translate(text, None, 'english') == english, text
+                assert ts.translate(text, 'bodo', 'mizo') == mizo, text
+        # Half typed in each script still meets the same key
+        assert ts.translate('नायनि phormakhou kheo', 'bodo', 'english') == ts.translate('नायनि फोरमाखौ खेव', 'bodo', 'english')
+    print(f"✓ {sum(map(len, SPELLINGS.values()))} romanized spellings found")
+
+
+if __name__ == "__main__":
+    test_romanized_input_finds_devanagari_entries()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Row store test: interned dataset rows survive freezing and a pickle round-trip unchanged.
+"""
+
+import csv
+import os
+import pickle
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.row_store import RowStore
+from services.translation_service import DATASET_COLUMNS, DATASET_PATH
+
+
+def test_rows_round_trip_through_pickle():
+    """Every cell matches the CSV after interning, freezing and unpickling; equal cells share one string"""
+    with open(DATASET_PATH, encoding='utf-8') as f:
+        csv_rows = [{column: (row.get(column) or '').strip() for column in DATASET_COLUMNS}
+                    for row in csv.DictReader(f)]
+    store = RowStore(DATASET_COLUMNS)
+    for row in csv_rows:
+        store.append(row)
+    store.freeze()
+
+    categories = {}
+    for row in store:
+        category = categories.setdefault(row['Category'], row['Category'])
+        assert row['Category'] is category  # Interned: one string per distinct value
+    assert len(store.strings) == len(set(store.strings))
+
+    restored = pickle.loads(pickle.dumps(store, protocol=pickle.HIGHEST_PROTOCOL))
+    assert len(restored) == len(csv_rows)
+    assert [row.to_dict() for row in restored] == csv_rows
+    assert list(restored.column('English')) == [row['English'] for row in csv_rows]
+    assert restored[-1].get('Missing', None) is None
+
+    # The string lookup is rebuilt on demand, so the restored store still interns new rows
+    row_id = restored.append(csv_rows[0])
+    assert restored[row_id].to_dict() == csv_rows[0] and len(restored.strings) == len(store.strings)
+    print(f"✓ {len(csv_rows)} rows round-trip through pickle with {len(store.strings)} distinct strings")
+
+
+if __name__ == "__main__":
+    test_rows_round_trip_through_pickle()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+SQLite engine test: a store compiled from a CSV answers exactly as the in-memory engine does.
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.translation_service as translation_service
+from services.sqlite_store import StoreNotBuilt, compile_store, default_store_path
+from services.translation_service import DATASET_PATH, LANGUAGE_COLUMNS, TranslationService
+
+
+def _texts(ts, source_lang, rng):
+    """Dataset phrases, sentences made of them, misspellings, romanized or folded spellings and misses"""
+    keys = [key for key in ts.translation_db[source_lang] if key]
+    texts = rng.sample(keys, 150)
+    texts += [' '.join(rng.sample(keys, 2)) for _ in range(100)]
+    texts += [key[:-1] + key[-1] * 2 for key in rng.sample(keys, 50)]
+    texts += [' '.join(reversed(key.split())) for key in rng.sample(keys, 50)]
+    texts += ['zzq', 'nayni phormakhou kheo', 'ka lawm e', '']
+    return texts
+
+
+def test_sqlite_matches_memory():
+    """Batch translations in every direction, detection and suggestions agree between the engines"""
+    workdir = tempfile.mkdtemp()
+    compile_on_start = translation_service.SQLITE_COMPILE_ON_START
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        shutil.copy(DATASET_PATH, csv_path)
+        rng = random.Random(25)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Without a store, a service not allowed to compile one refuses to start
+            translation_service.SQLITE_COMPILE_ON_START = False
+            try:
+                TranslationService(csv_path, engine='sqlite')
+                raise AssertionError("started without a store")
+            except StoreNotBuilt:
+                pass
+
+            compile_store(csv_path)
+            sqlite = TranslationService(csv_path, engine='sqlite')
+            memory = TranslationService(csv_path, use_snapshot=False, engine='memory')
+            assert sqlite.store.path == default_store_path(csv_path)
+            for source_lang in LANGUAGE_COLUMNS:
+                texts = _texts(memory, source_lang, rng)
+                assert (sqlite.translate_batch(texts, source_lang, list(LANGUAGE_COLUMNS))
+                        == memory.translate_batch(texts, source_lang, list(LANGUAGE_COLUMNS))), source_lang
+                assert sqlite.translate_batch(texts, None) == memory.translate_batch(texts, None), source_lang
+                for prefix in {text[:rng.randint(1, 4)] for text in texts if text}:
+                    assert sqlite.suggest(prefix, source_lang) == memory.suggest(prefix, source_lang), prefix
+        print(f"✓ {sqlite.store.path} answers like the memory engine")
+    finally:
+        translation_service.SQLITE_COMPILE_ON_START = compile_on_start
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_sqlite_matches_memory()
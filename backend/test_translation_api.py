@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+API test: translation endpoints through Flask's test client.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.translation_service as translation_service
+from services.translation_service import DATASET_PATH
+
+# The service is loaded by the tests, from a copy of the dataset, with no journal or watcher threads
+SETTINGS = {'TRANSLATION_PRELOAD': '0', 'TRANSLATION_JOURNAL': '0', 'TRANSLATION_RELOAD_POLL': '0'}
+
+BAD_BATCHES = [
+    {'texts': [1]},
+    {'texts': ['Good morning', None]},
+    {'texts': ['Good morning'], 'target_langs': [['mizo']]},
+]
+
+
+@contextlib.contextmanager
+def _client():
+    """Flask test client over a shared service that is not loaded yet"""
+    workdir = tempfile.mkdtemp()
+    settings = dict(SETTINGS, TRANSLATION_DATASETS=os.path.join(workdir, 'dataset.csv'))
+    saved = {name: os.environ.get(name) for name in settings}
+    try:
+        shutil.copy(DATASET_PATH, settings['TRANSLATION_DATASETS'])
+        os.environ.update(settings)
+        translation_service._shared_service = None
+        with contextlib.redirect_stdout(io.StringIO()):
+            from app import app
+        yield app.test_client()
+    finally:
+        translation_service._shared_service = None
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(workdir)
+
+
+def test_ready_probe():
+    """503 until the shared service is loaded, then 200 with its status; probing never loads it"""
+    with _client() as client:
+        response = client.get('/api/translate/ready')
+        assert response.status_code == 503
+        assert response.get_json() == {'success': False, 'translation': {'ready': False}}
+        assert translation_service._shared_service is None
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            translation_service.get_translation_service()
+        response = client.get('/api/translate/ready')
+        body = response.get_json()
+        assert response.status_code == 200 and body['success']
+        assert body['translation']['ready'] and body['translation']['loaded_from'] == 'csv'
+        assert body['translation']['entries']['english'] > 0
+    print("✓ Readiness probe is 503 before loading and 200 after")
+
+
+def test_batch_rejects_non_string_items():
+    """Non-string texts or target languages are a 400 before the service is touched; strings translate"""
+    with _client() as client:
+        for body in BAD_BATCHES:
+            response = client.post('/api/translate/batch', json=body)
+            assert response.status_code == 400, body
+            assert response.get_json() == {'success': False, 'message': 'texts and target_langs must only hold strings'}
+        assert translation_service._shared_service is None
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = client.post('/api/translate/batch', json={'texts': ['Good morning'], 'target_langs': ['mizo']})
+        assert response.status_code == 200
+        assert response.get_json()['translations'][0]['mizoTranslation']
+    print("✓ Batch items that are not strings are rejected with 400")
+
+
+if __name__ == "__main__":
+    test_ready_probe()
+    test_batch_rejects_non_string_items()
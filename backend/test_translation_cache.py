@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Result cache test: repeated instructions survive a stream of one-off sentences.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_cache import TranslationCache
+from services.translation_service import TranslationService
+
+
+def test_frequent_entries_survive_a_scan():
+    """TinyLFU admission keeps hot keys that a plain LRU would evict"""
+    cache = TranslationCache(capacity=10)
+    hot = [f"hot {i}" for i in range(5)]
+    for i in range(300):
+        # A teacher repeats a few instructions between many sentences said only once
+        keys = [f"one-off {i}"] + (hot if i % 10 == 0 else [])
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key.upper())
+
+    assert all(cache.get(key) == key.upper() for key in hot)
+    stats = cache.stats()
+    assert stats['size'] == 10 and stats['rejections'] > 0, stats
+    print(f"✓ Hot entries kept through a scan ({stats['rejections']} one-offs rejected)")
+
+
+def test_additions_invalidate_cached_results():
+    """A result cached before add_translation() is never served after it"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        assert ts.translate("Blorptastic", "english", "mizo") == "Blorptastic"
+        assert ts.translate("Blorptastic", "english", "mizo") == "Blorptastic"
+        hits = ts.cache.stats()['hits']
+        ts.add_translation("blorptastic", "english", "mizo", "Ropui")
+        assert ts.translate("Blorptastic", "english", "mizo") == "Ropui"
+    assert hits == 1 and ts.cache.stats()['invalidations'] >= 1
+    assert TranslationCache(capacity=0).get('anything') is None
+    print("✓ Runtime additions invalidate cached results")
+
+
+if __name__ == "__main__":
+    test_frequent_entries_survive_a_scan()
+    test_additions_invalidate_cached_results()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Journal test: compaction keeps the journal bounded without losing any runtime addition.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.translation_service as translation_service
+from services.translation_service import DATASET_PATH, TranslationService
+
+
+def _lines(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def test_rotation_keeps_every_addition():
+    """Processes sharing a journal, a cold start and a CSV reload all see the latest additions"""
+    workdir = tempfile.mkdtemp()
+    compact_every = translation_service.JOURNAL_COMPACT_EVERY
+    translation_service.JOURNAL_COMPACT_EVERY = 5
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        journal_path = os.path.join(workdir, 'dataset.journal')
+        shutil.copy(DATASET_PATH, csv_path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer = TranslationService(csv_path, journal_path=journal_path)
+            follower = TranslationService(csv_path, journal_path=journal_path)
+            for i in range(23):
+                # The same few words corrected over and over, as a teacher fixing an entry would
+                writer.add_translation(f"blorpword{i % 3}", 'english', 'mizo', f"Blorp {i}")
+            journal_id = writer.journal.read_id()
+            follower.sync_journal()
+            cold = TranslationService(csv_path, journal_path=journal_path)
+            from_csv = TranslationService(csv_path, use_snapshot=False, journal_path=journal_path)
+
+            with open(csv_path, 'a', encoding='utf-8') as f:
+                f.write('99001,Close the window please,खिरकिखौ बन्द खालाम,Tukverh khar rawh,instruction\n')
+            writer.reload_dataset()
+
+        latest = {f"blorpword{i % 3}": f"Blorp {i}" for i in range(20, 23)}
+        # 23 appends, rotated down to one entry per word plus what came after the last rotation
+        assert _lines(journal_path) <= 1 + 3 + 5, _lines(journal_path)
+        assert writer.journal.header()['continues'] and journal_id == writer.journal.read_id()
+        assert cold.loaded_from == 'snapshot'
+        for service in (writer, follower, cold, from_csv):
+            assert {word: service.translate(word, 'english', 'mizo') for word in latest} == latest
+        assert writer.translate("Close the window please", "english", "mizo") == "Tukverh khar rawh"
+        print(f"✓ 23 additions kept in a {_lines(journal_path)}-line journal")
+    finally:
+        translation_service.JOURNAL_COMPACT_EVERY = compact_every
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_rotation_keeps_every_addition()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Live session test: incremental updates must give what translate() gives for the whole transcript.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+from services.translation_sessions import TranslationSessionStore
+
+TARGETS = ['bodo', 'mizo']
+
+
+def test_incremental_updates_match_full_translation():
+    """Randomized growing transcripts with recognizer revisions and runtime additions, checked after every update"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+    store = TranslationSessionStore(lambda: ts)
+    phrases = [key for key in ts.translation_db['english'] if len(key) < 40]
+    rng = random.Random(11)
+    updates = 0
+    resets = 0
+    added = 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for trial in range(15):
+            store.end('CLASS')
+            source_lang = None if trial % 5 == 4 else 'english'
+            words = []
+            client = {target_lang: [] for target_lang in TARGETS}
+            for step in range(20):
+                if words and rng.random() < 0.15:
+                    del words[-rng.randint(1, 3):]  # The recognizer revised its last words
+                words += rng.choice(phrases).split() + rng.choice([[], ['quickly'], ['zzq'], ['opne'], ['yuor']])
+                if step == 12:
+                    # A word already in the stable prefix gets a new translation mid-class
+                    word = f"blorp{trial}"
+                    words[1:1] = [word]
+                    text = ' '.join(words)
+                    store.update('CLASS', text, source_lang, TARGETS)
+                    ts.add_translation(word, 'english', 'mizo', f"Blorp{trial}")
+                    added += 1
+                text = ' '.join(words)
+                delta = store.update('CLASS', text, source_lang, TARGETS)
+                expected = ts.translate_batch([text], source_lang, TARGETS)[0]['translations']
+                for target_lang, info in delta['targets'].items():
+                    # What a client holds after applying the delta to its previous segments
+                    client[target_lang][info['replace_from']:] = info['segments']
+                    assert expected[target_lang] == ts.translate(text, source_lang, target_lang)
+                    assert info['translation'] == expected[target_lang], (text, target_lang)
+                    assert ' '.join(client[target_lang]) == expected[target_lang], (text, target_lang)
+                if step == 12 and source_lang:
+                    assert delta['reset'] and f"Blorp{trial}" in delta['targets']['mizo']['translation']
+                updates += 1
+                resets += delta['reset']
+
+    assert resets < updates / 2  # Most updates really were incremental
+    print(f"✓ {updates} incremental updates ({resets} resets, {added} additions) match translate()")
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_full_translation()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Snapshot test: a snapshot that no longer matches its inputs is ignored and the CSV is loaded instead.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+import services.translation_snapshot as translation_snapshot
+from services.translation_service import DATASET_COLUMNS, DATASET_PATH, TranslationService
+from services.translation_snapshot import compile_snapshot, default_snapshot_path
+
+TEXTS = ['Open your notebooks', 'good morning', 'close the door quickly', 'blorpword', 'Nuam', 'नमस्कार']
+
+
+def _translations(ts):
+    return [(source_lang, ts.translate_batch(TEXTS, source_lang, ['english', 'bodo', 'mizo']))
+            for source_lang in ('english', 'bodo', 'mizo')]
+
+
+def _load(csv_paths, journal_path=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(csv_paths, journal_path=journal_path)
+        from_csv = TranslationService(csv_paths, use_snapshot=False, journal_path=journal_path)
+    return ts, _translations(ts) == _translations(from_csv)
+
+
+def test_stale_snapshots_fall_back_to_csv():
+    """Changed CSV, other format version, foreign journal, extra source and corrupt file each load the CSV"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        shutil.copy(DATASET_PATH, csv_path)
+        snapshot_path = default_snapshot_path(csv_path)
+
+        def build():
+            with contextlib.redirect_stdout(io.StringIO()):
+                compile_snapshot(csv_path)
+
+        build()
+        ts, same = _load(csv_path)
+        assert ts.loaded_from == 'snapshot' and same
+        # Touched but unchanged: the size matches and the content hash confirms it
+        os.utime(csv_path, ns=(0, 0))
+        ts, same = _load(csv_path)
+        assert ts.loaded_from == 'snapshot' and same
+
+        # Same size and mtime check fails: the hash decides
+        with open(csv_path, encoding='utf-8') as f:
+            content = f.read()
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content.replace('Open', 'Opem', 1))
+        ts, same = _load(csv_path)
+        assert ts.loaded_from == 'csv' and same
+
+        # A new row changes the size
+        build()
+        with open(csv_path, 'a', encoding='utf-8') as f:
+            f.write('99001,Blorpword,ब्लर्प,Blorp,instruction\n')
+        ts, same = _load(csv_path)
+        assert ts.loaded_from == 'csv' and same
+        assert ts.translate('blorpword', 'english', 'mizo') == 'Blorp'
+
+        # Another format version
+        build()
+        version = translation_snapshot.SNAPSHOT_VERSION
+        translation_snapshot.SNAPSHOT_VERSION = version + 1
+        try:
+            ts, same = _load(csv_path)
+        finally:
+            translation_snapshot.SNAPSHOT_VERSION = version
+        assert ts.loaded_from == 'csv' and same
+
+        # Compacted from one journal, loaded with another
+        journal_path = os.path.join(workdir, 'journal')
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer = TranslationService(csv_path, journal_path=journal_path)
+            writer.add_translation('zzqword', 'english', 'mizo', 'Zzq')
+            writer.compact_journal()
+        ts, same = _load(csv_path, journal_path)
+        assert ts.loaded_from == 'snapshot' and same
+        assert ts.translate('zzqword', 'english', 'mizo') == 'Zzq'
+        ts, same = _load(csv_path, os.path.join(workdir, 'other-journal'))
+        assert ts.loaded_from == 'csv' and same
+        assert ts.translate('zzqword', 'english', 'mizo') != 'Zzq'
+
+        # A source merged in after the build
+        build()
+        extra_path = os.path.join(workdir, 'extra.csv')
+        with open(extra_path, 'w', encoding='utf-8') as f:
+            f.write(','.join(DATASET_COLUMNS) + '\n99002,Qwopword,क्वप,Qwop,instruction\n')
+        ts, same = _load([csv_path, extra_path])
+        assert ts.loaded_from == 'csv' and same
+        assert ts.translate('qwopword', 'english', 'mizo') == 'Qwop'
+
+        # Cut off halfway through the pickled indexes
+        build()
+        with open(snapshot_path, 'r+b') as f:
+            f.truncate(os.path.getsize(snapshot_path) // 2)
+        ts, same = _load(csv_path)
+        assert ts.loaded_from == 'csv' and same
+        print("✓ Stale, foreign and corrupt snapshots fall back to the CSV with identical translations")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_stale_snapshots_fall_back_to_csv()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Streaming test: each line is translated as soon as it is read, never after the whole input.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+
+TRANSCRIPT = ["Good morning\n", "open your notebooks and write this down\n", "\n", "Thank you\n"]
+
+
+def test_stream_is_lazy_and_matches_batch():
+    """One line read per result yielded; results equal translate_batch() with line numbers added"""
+    read = []
+
+    def lines():
+        for line in TRANSCRIPT:
+            read.append(line)
+            yield line.encode('utf-8')  # request.stream yields bytes
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        stream = ts.translate_stream(lines(), 'english', ['bodo', 'mizo'])
+        first = next(stream)
+        read_before_rest = len(read)
+        streamed = [first] + list(stream)
+        batch = ts.translate_batch([line.strip() for line in TRANSCRIPT], 'english', ['bodo', 'mizo'])
+
+    assert read_before_rest == 1
+    assert [result['line'] for result in streamed] == [1, 2, 3, 4]
+    for result, expected in zip(streamed, batch):
+        assert result['text'] == expected['text']
+        assert result['translations'] == expected['translations'] and result['found'] == expected['found']
+    assert streamed[2]['translations'] == {'bodo': '', 'mizo': ''}
+    print(f"✓ {len(streamed)} lines streamed one at a time")
+
+
+if __name__ == "__main__":
+    test_stream_is_lazy_and_matches_batch()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Typo correction test: misspellings are fixed without swapping real words for wrong dataset words.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import TranslationService
+
+
+def _corrected(ts, text):
+    return {item['word']: item['correction'] for item in ts.find_corrections(text, 'english')}
+
+
+def test_corrections_use_distance_limits_and_context():
+    """Two edits only for long words; a word completing a phrase wins; ambiguous typos stay"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ts = TranslationService(use_snapshot=False)
+        # "chapter" is two edits from the dataset's "charger", too many for a 7-letter word
+        assert _corrected(ts, "the photosynthesis chapter") == {}
+        # "one" is as close and more frequent, but only "open" completes a dataset phrase
+        assert _corrected(ts, "opne your notebooks") == {'opne': 'open'}
+        assert (ts.translate("opne your notebooks", "english", "mizo")
+                == ts.translate("open your notebooks", "english", "mizo"))
+        # Without that context, "one" and "open" are too close to call
+        assert _corrected(ts, "opne") == {}
+        assert _corrected(ts, "pleese") == {'pleese': 'please'}
+    print("✓ Typos corrected only when the intended word is clear")
+
+
+if __name__ == "__main__":
+    test_corrections_use_distance_limits_and_context()
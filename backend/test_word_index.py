@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Word index test: word-by-word lookups give what scanning the rows for the word gave.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+
+from services.translation_service import DATASET_COLUMNS, TranslationService
+
+ROWS = [
+    ('1', 'Open the door', 'दरजाखौ खेव', 'Kawngkhar hawng rawh'),  # Contains "open" but is no entry for it
+    ('2', 'Open', '?', ''),  # No usable translation: later rows are tried
+    ('3', 'Open', 'खेव', 'Hawng'),
+    ('4', 'open', 'खेवो', 'Hawng rawh'),  # Same word again: the earlier row wins
+    ('5', 'Door', 'दरजा', '?'),
+    ('6', 'Door', 'दरजा', 'Kawngkhar'),
+]
+
+
+def test_word_entries_take_precedence():
+    """A word's own earliest usable row wins over longer rows holding it, later rows and runtime additions"""
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, 'dataset.csv')
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DATASET_COLUMNS)
+            writer.writerows(row + ('instruction',) for row in ROWS)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ts = TranslationService(csv_path, use_snapshot=False, journal_path=os.path.join(workdir, 'journal'))
+            assert ts._translate_word('Open,', 'english', 'mizo') == 'Hawng'
+            assert ts._translate_word('open', 'english', 'bodo') == 'खेव'
+            assert ts._translate_word('door', 'english', 'mizo') == 'Kawngkhar'
+            assert ts._translate_word('the', 'english', 'mizo') == ''
+            assert ts.translate('zzq open door', 'english', 'mizo') == 'zzq Hawng Kawngkhar'
+            assert ts.translate('door open', 'english', 'bodo') == 'दरजा खेव'
+
+            # Runtime additions only fill words the CSV has no entry for, as the row scan did
+            ts.add_translation('open', 'english', 'mizo', 'Hawng ta')
+            ts.add_translation('the', 'english', 'mizo', 'Chu')
+            assert ts.translate('zzq the open door', 'english', 'mizo') == 'zzq Chu Hawng Kawngkhar'
+        print("✓ Word entries take precedence over longer rows, later rows and additions")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    test_word_entries_take_precedence()
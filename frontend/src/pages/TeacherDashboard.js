@@ -178,12 +178,23 @@ const TeacherDashboard = () => {
       const startTime = performance.now();
       
       // ✅ Use safeFetch with proper error handling
-      const result = await safeFetch('/api/translate/batch', {
-        method: 'POST',
-        body: JSON.stringify({
-          texts: [text.trim()]
-        })
-      });
+      // During a live class the transcript only grows, so the session endpoint
+      // re-translates just the changed tail instead of the whole text
+      const useSession = classActive && joinCode;
+      const result = useSession
+        ? await safeFetch(`/api/translate/session/${joinCode}`, {
+            method: 'POST',
+            body: JSON.stringify({
+              text: text.trim(),
+              target_langs: ['bodo', 'mizo']
+            })
+          })
+        : await safeFetch('/api/translate/batch', {
+            method: 'POST',
+            body: JSON.stringify({
+              texts: [text.trim()]
+            })
+          });
       
       const endTime = performance.now();
       const responseTime = ((endTime - startTime) / 1000).toFixed(1);
@@ -202,7 +213,12 @@ const TeacherDashboard = () => {
       let bodo = '';
       let mizo = '';
       
-      if (data.translations && data.translations.length > 0) {
+      if (useSession && data.targets) {
+        bodo = data.targets.bodo?.translation || '— (not found in dataset)';
+        mizo = data.targets.mizo?.translation || '— (not found in dataset)';
+        setBodoTranslation(bodo);
+        setMizoTranslation(mizo);
+      } else if (data.translations && data.translations.length > 0) {
         const firstTranslation = data.translations[0];
         bodo = firstTranslation.bodoTranslation || '— (not found in dataset)';
         mizo = firstTranslation.mizoTranslation || '— (not found in dataset)';
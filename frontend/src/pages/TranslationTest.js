@@ -1,6 +1,6 @@
 // src/pages/TranslationTest.jsx  (or wherever you keep it)
 
-import React, { useState } from 'react';
+import React, { useRef, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Home, Copy, Trash2, Volume2, ArrowRightLeft } from 'lucide-react';
 import axios from 'axios';
@@ -17,6 +17,8 @@ const TranslationTest = () => {
   const [mizoTranslation, setMizoTranslation] = useState('');
   const [isTranslating, setIsTranslating] = useState(false);
   const [error, setError] = useState('');
+  const [suggestions, setSuggestions] = useState([]);
+  const latestSuggest = useRef(0); // Only the newest keystroke's suggestions are shown
 
   // Quick test phrases - matching exact dataset entries
   const samplePhrases = {
@@ -171,22 +173,62 @@ const TranslationTest = () => {
     }
   };
 
+  // Dataset phrases starting with what has been typed so far
+  const fetchSuggestions = async (text) => {
+    const request = ++latestSuggest.current;
+    if (!text.trim()) {
+      setSuggestions([]);
+      return;
+    }
+    try {
+      const res = await axios.get(`${API_BASE_URL}/api/translate/suggest`, {
+        params: {
+          q: text,
+          source_lang: sourceLanguage,
+          target_langs: ['english', 'bodo', 'mizo'].filter((lang) => lang !== sourceLanguage).join(','),
+          k: 6
+        }
+      });
+      if (request === latestSuggest.current) setSuggestions(res.data.suggestions || []);
+    } catch (err) {
+      console.warn('Suggestions unavailable:', err);
+    }
+  };
+
   // Textarea change
   const handleInputChange = (e) => {
     setInputText(e.target.value);
     setError('');
+    fetchSuggestions(e.target.value);
+  };
+
+  // A suggestion already carries its translations, so no translate request is needed
+  const handleSuggestion = (suggestion) => {
+    latestSuggest.current++;
+    setInputText(suggestion.text);
+    setSuggestions([]);
+    setError('');
+    const notFound = '— (not found in dataset)';
+    const { translations } = suggestion;
+    setEnglishTranslation(sourceLanguage === 'english' ? '' : translations.english || notFound);
+    setBodoTranslation(sourceLanguage === 'bodo' ? '' : translations.bodo || notFound);
+    setMizoTranslation(sourceLanguage === 'mizo' ? '' : translations.mizo || notFound);
   };
 
   // Enter key → translate
   const handleKeyDown = (e) => {
     if (e.key === 'Enter' && !e.shiftKey) {
       e.preventDefault();
+      latestSuggest.current++;
+      setSuggestions([]);
       handleTranslate();
     }
   };
 
   // Clear everything
   const clearAll = () => {
+    latestSuggest.current++;
+    setSuggestions([]);
     setInputText('');
     setEnglishTranslation('');
     setBodoTranslation('');
@@ -281,6 +323,20 @@ const TranslationTest = () => {
             rows={5}
           />
 
+          {suggestions.length > 0 && (
+            <div className="phrase-buttons">
+              {suggestions.map((suggestion) => (
+                <button
+                  key={suggestion.text}
+                  className="phrase-btn"
+                  onClick={() => handleSuggestion(suggestion)}
+                >
+                  {suggestion.text}
+                </button>
+              ))}
+            </div>
+          )}
+
           {error && (
             <div className="error-message">
               ⚠️ {error}